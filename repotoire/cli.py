@@ -180,6 +180,19 @@ def cli(ctx: click.Context, config: str | None, log_level: str | None, log_forma
     default=None,
     help="Number of entities to batch before loading to graph (overrides config, default: 100)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes used to parse files (default: 1)",
+)
+@click.option(
+    "--parse-cache",
+    "parse_cache_dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for an on-disk parse cache; unchanged files skip re-parsing",
+)
 @click.pass_context
 def ingest(
     ctx: click.Context,
@@ -197,6 +210,8 @@ def ingest(
     generate_clues: bool,
     generate_embeddings: bool,
     batch_size: int | None,
+    workers: int,
+    parse_cache_dir: str | None,
 ) -> None:
     """Ingest a codebase into the knowledge graph with security validation.
 
@@ -300,7 +315,9 @@ def ingest(
                     batch_size=validated_batch_size,
                     secrets_policy=final_secrets_policy,
                     generate_clues=generate_clues,
-                    generate_embeddings=generate_embeddings
+                    generate_embeddings=generate_embeddings,
+                    workers=workers,
+                    parse_cache_dir=parse_cache_dir,
                 )
 
                 # Setup progress bar if not in quiet mode
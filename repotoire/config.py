@@ -74,16 +74,19 @@ file = "logs/falkor.log"
 ```
 """
 
+import copy
 import os
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields, replace
 
 try:
     import yaml
     HAS_YAML = True
+    # libyaml-backed loader is much faster than the pure-Python one
+    _YamlSafeLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     HAS_YAML = False
 
@@ -97,10 +100,21 @@ except ImportError:
     except ImportError:
         HAS_TOML = False
 
+try:
+    import tomli_w
+    HAS_TOML_W = True
+except ImportError:
+    HAS_TOML_W = False
+
 from repotoire.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Matches ${VAR} or $VAR
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+# Bound once; patch.dict and os.environ[...] = ... mutate this same mapping
+_environ_get = os.environ.get
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid or cannot be loaded."""
@@ -244,29 +258,43 @@ class FalkorConfig:
     def merge(self, other: "FalkorConfig") -> "FalkorConfig":
         """Merge with another config (other takes precedence).
 
+        Fields of ``other`` still at their default value are treated as unset
+        and do not override ``self``. Values are copied as-is: both configs
+        already had environment variables expanded when they were built.
+
         Args:
             other: Config to merge with
 
         Returns:
             New merged config
         """
-        merged_dict = self.to_dict()
-        other_dict = other.to_dict()
+        sections = {}
+        for section in fields(self):
+            override = getattr(other, section.name)
+            defaults = type(override)()
+            changes = {
+                f.name: getattr(override, f.name)
+                for f in fields(override)
+                if getattr(override, f.name) != getattr(defaults, f.name)
+            }
+            sections[section.name] = replace(getattr(self, section.name), **changes)
+
+        return FalkorConfig(**sections)
 
-        # Deep merge
-        for section, values in other_dict.items():
-            if section not in merged_dict:
-                merged_dict[section] = values
-            else:
-                merged_dict[section].update(values)
 
-        return FalkorConfig.from_dict(merged_dict)
+def _replace_env_var(match: "re.Match[str]") -> str:
+    """Substitute a single ${VAR}/$VAR match, leaving unknown variables as-is."""
+    whole, braced, bare = match.group(0, 1, 2)
+    return _environ_get(braced or bare, whole)
 
 
 def _expand_env_vars(data: Union[Dict, list, str, Any]) -> Any:
-    """Recursively expand environment variables in config data.
+    """Expand environment variables in config data.
 
-    Supports ${VAR_NAME} and $VAR_NAME syntax.
+    Supports ${VAR_NAME} and $VAR_NAME syntax. Nested dicts and lists are
+    walked with an explicit stack rather than recursion, so deeply nested
+    configs cannot hit the recursion limit. The input is not modified;
+    containers are copied before their values are rewritten.
 
     Args:
         data: Configuration data (dict, list, str, or primitive)
@@ -274,26 +302,79 @@ def _expand_env_vars(data: Union[Dict, list, str, Any]) -> Any:
     Returns:
         Data with environment variables expanded
     """
-    if isinstance(data, dict):
-        return {k: _expand_env_vars(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [_expand_env_vars(item) for item in data]
-    elif isinstance(data, str):
-        # Match ${VAR} or $VAR
-        pattern = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
-
-        def replace_var(match):
-            var_name = match.group(1) or match.group(2)
-            return os.environ.get(var_name, match.group(0))
-
-        return pattern.sub(replace_var, data)
-    else:
-        return data
+    root = [data]
+    # Entries are (container, key or index, value found there)
+    stack: List[Tuple[Any, Any, Any]] = [(root, 0, data)]
+
+    while stack:
+        parent, key, value = stack.pop()
+        if isinstance(value, dict):
+            expanded_dict = dict(value)
+            parent[key] = expanded_dict
+            stack.extend((expanded_dict, k, v) for k, v in expanded_dict.items())
+        elif isinstance(value, list):
+            expanded_list = list(value)
+            parent[key] = expanded_list
+            stack.extend((expanded_list, i, v) for i, v in enumerate(expanded_list))
+        elif isinstance(value, str):
+            # Most config strings have no env references; skip the regex engine
+            if "$" in value:
+                parent[key] = _ENV_VAR_RE.sub(_replace_env_var, value)
+
+    return root[0]
+
+
+_CONFIG_FILE_NAMES = (".reporc", "falkor.toml")
+
+# Parsed config files keyed by (resolved path, st_mtime_ns, st_size)
+_config_file_cache: Dict[tuple, Dict[str, Any]] = {}
+
+# Found config file paths keyed by (resolved start directory, home directory)
+_config_path_cache: Dict[Tuple[Path, Path], Path] = {}
+_CONFIG_PATH_CACHE_SIZE = 32
+
+
+def _scan_for_config(directory: Path, names: tuple = _CONFIG_FILE_NAMES) -> Optional[Path]:
+    """Return the first of ``names`` present as a file in ``directory``.
+
+    Reads the directory once with ``os.scandir`` instead of stat-ing every
+    candidate, so each level of the upward search costs a single syscall
+    batch. Lookups of a single name should use ``Path.is_file`` instead.
+
+    Args:
+        directory: Directory to look in
+        names: Candidate file names, in order of preference
+
+    Returns:
+        Path to the preferred matching file, or None if none exist
+    """
+    found: Dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # is_file() follows symlinks, matching Path.is_file()
+                if entry.name in names and entry.is_file():
+                    found[entry.name] = entry.path
+    except OSError:
+        return None
+
+    for name in names:
+        if name in found:
+            return Path(found[name])
+    return None
 
 
 def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
     """Find config file using hierarchical search.
 
+    Found paths are memoized per resolved start directory and home
+    directory; a cached hit is re-checked so a deleted config file triggers
+    a fresh search. Misses are not cached, so a config file created later
+    is picked up when none was found before. A cached hit is not re-searched,
+    though: a higher-precedence config file created later in the same process
+    (e.g. a ``.reporc`` closer to ``start_dir``) is only seen after
+    ``clear_config_cache()``, which forgets all cached lookups.
+
     Searches in order:
     1. start_dir (or current directory)
     2. Parent directories up to root
@@ -314,20 +395,40 @@ def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
     else:
         start_dir = Path(start_dir).resolve()
 
+    key = (start_dir, Path.home())
+    config_path = _config_path_cache.get(key)
+    if config_path is not None and config_path.is_file():
+        return config_path
+
+    config_path = _search_config_file(*key)
+    if config_path is None:
+        _config_path_cache.pop(key, None)
+        return None
+
+    if key not in _config_path_cache and len(_config_path_cache) >= _CONFIG_PATH_CACHE_SIZE:
+        # Evict the oldest lookup
+        del _config_path_cache[next(iter(_config_path_cache))]
+    _config_path_cache[key] = config_path
+    return config_path
+
+
+def _search_config_file(start_dir: Path, home: Path) -> Optional[Path]:
+    """Uncached hierarchical search behind find_config_file.
+
+    Args:
+        start_dir: Resolved absolute starting directory
+        home: User home directory
+
+    Returns:
+        Path to config file, or None if not found
+    """
     # Search current directory and parents
     current = start_dir
     while True:
-        # Check for .reporc
-        falkorrc = current / ".reporc"
-        if falkorrc.exists() and falkorrc.is_file():
-            logger.info(f"Found config file: {falkorrc}")
-            return falkorrc
-
-        # Check for falkor.toml
-        falkor_toml = current / "falkor.toml"
-        if falkor_toml.exists() and falkor_toml.is_file():
-            logger.info(f"Found config file: {falkor_toml}")
-            return falkor_toml
+        config_path = _scan_for_config(current)
+        if config_path:
+            logger.info(f"Found config file: {config_path}")
+            return config_path
 
         # Move to parent
         parent = current.parent
@@ -335,21 +436,12 @@ def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
             break
         current = parent
 
-    # Check home directory
-    home = Path.home()
-
-    # Check ~/.reporc
-    home_falkorrc = home / ".reporc"
-    if home_falkorrc.exists() and home_falkorrc.is_file():
-        logger.info(f"Found config file: {home_falkorrc}")
-        return home_falkorrc
-
-    # Check ~/.config/falkor.toml
-    config_dir = home / ".config"
-    config_toml = config_dir / "falkor.toml"
-    if config_toml.exists() and config_toml.is_file():
-        logger.info(f"Found config file: {config_toml}")
-        return config_toml
+    # Check ~/.reporc, then ~/.config/falkor.toml
+    # A single stat each; scanning the home directory would list all of it
+    for config_path in (home / ".reporc", home / ".config" / "falkor.toml"):
+        if config_path.is_file():
+            logger.info(f"Found config file: {config_path}")
+            return config_path
 
     logger.debug("No config file found")
     return None
@@ -358,6 +450,9 @@ def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
 def load_config_file(file_path: Path) -> Dict[str, Any]:
     """Load configuration from file.
 
+    Parsed results are cached by path and modification time, so repeated
+    loads of an unchanged file skip re-parsing. Callers get their own copy.
+
     Supports:
     - .reporc (YAML or JSON)
     - falkor.toml (TOML)
@@ -373,20 +468,49 @@ def load_config_file(file_path: Path) -> Dict[str, Any]:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        raise ConfigError(f"Config file not found: {file_path}")
-
     try:
-        content = file_path.read_text()
-    except Exception as e:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise ConfigError(f"Config file not found: {file_path}")
+    except OSError as e:
         raise ConfigError(f"Failed to read config file {file_path}: {e}")
 
+    cache_key = (file_path.resolve(), stat.st_mtime_ns, stat.st_size)
+    data = _config_file_cache.get(cache_key)
+    if data is None:
+        try:
+            content = file_path.read_bytes()
+        except Exception as e:
+            raise ConfigError(f"Failed to read config file {file_path}: {e}")
+
+        data = _parse_config_content(file_path, content)
+        # Drop entries for older versions of the same file
+        for key in [k for k in _config_file_cache if k[0] == cache_key[0]]:
+            del _config_file_cache[key]
+        _config_file_cache[cache_key] = data
+
+    return copy.deepcopy(data)
+
+
+def _parse_config_content(file_path: Path, content: bytes) -> Dict[str, Any]:
+    """Parse config file content according to the file's format.
+
+    Args:
+        file_path: Path the content was read from (selects the format)
+        content: Raw file content (YAML and JSON parsers decode bytes themselves)
+
+    Returns:
+        Configuration dictionary
+
+    Raises:
+        ConfigError: If content cannot be parsed or format not supported
+    """
     # Detect format and parse
     if file_path.name == ".reporc" or file_path.suffix in [".yaml", ".yml", ".json"]:
         # Try YAML first (if available and appropriate extension)
         if HAS_YAML and file_path.suffix in [".yaml", ".yml", ""]:
             try:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YamlSafeLoader)
                 logger.debug(f"Loaded YAML config from {file_path}")
                 return data or {}
             except yaml.YAMLError:
@@ -397,7 +521,7 @@ def load_config_file(file_path: Path) -> Dict[str, Any]:
             data = json.loads(content)
             logger.debug(f"Loaded JSON config from {file_path}")
             return data
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # JSONDecodeError or UnicodeDecodeError
             raise ConfigError(
                 f"Failed to parse {file_path} as YAML or JSON: {e}\n"
                 f"Install PyYAML for YAML support: pip install pyyaml"
@@ -410,7 +534,7 @@ def load_config_file(file_path: Path) -> Dict[str, Any]:
             )
 
         try:
-            data = tomli.loads(content)
+            data = tomli.loads(content.decode("utf-8"))
             logger.debug(f"Loaded TOML config from {file_path}")
             return data
         except Exception as e:
@@ -420,6 +544,12 @@ def load_config_file(file_path: Path) -> Dict[str, Any]:
         raise ConfigError(f"Unsupported config file format: {file_path}")
 
 
+def clear_config_cache() -> None:
+    """Forget memoized config file locations and parsed config files."""
+    _config_path_cache.clear()
+    _config_file_cache.clear()
+
+
 def load_config_from_env() -> Dict[str, Any]:
     """Load configuration from environment variables.
 
@@ -635,8 +765,7 @@ def generate_config_template(format: str = "yaml") -> str:
         if not HAS_TOML:
             raise ConfigError("TOML support not available. Install: pip install tomli")
 
-        # Manual TOML generation (tomli doesn't have dump)
-        lines = [
+        header = [
             "# Falkor Configuration File (falkor.toml)",
             "#",
             "# This file configures Falkor's behavior. It can be placed:",
@@ -645,30 +774,34 @@ def generate_config_template(format: str = "yaml") -> str:
             "#",
             "# Environment variables can be referenced using ${VAR_NAME} syntax.",
             "",
-            "[neo4j]",
-            f'uri = "{data["neo4j"]["uri"]}"',
-            f'user = "{data["neo4j"]["user"]}"',
-            f'password = "{data["neo4j"]["password"] or ""}"',
-            f'max_retries = {data["neo4j"]["max_retries"]}',
-            f'retry_backoff_factor = {data["neo4j"]["retry_backoff_factor"]}',
-            f'retry_base_delay = {data["neo4j"]["retry_base_delay"]}',
-            "",
-            "[ingestion]",
-            f'patterns = {json.dumps(data["ingestion"]["patterns"])}',
-            f'follow_symlinks = {str(data["ingestion"]["follow_symlinks"]).lower()}',
-            f'max_file_size_mb = {data["ingestion"]["max_file_size_mb"]}',
-            f'batch_size = {data["ingestion"]["batch_size"]}',
-            "",
-            "[analysis]",
-            f'min_modularity = {data["analysis"]["min_modularity"]}',
-            f'max_coupling = {data["analysis"]["max_coupling"]}',
-            "",
-            "[logging]",
-            f'level = "{data["logging"]["level"]}"',
-            f'format = "{data["logging"]["format"]}"',
-            f'file = "{data["logging"]["file"] or ""}"',
         ]
 
+        # TOML has no null; unset optional values are written as ""
+        toml_data = {
+            section: {k: "" if v is None else v for k, v in values.items()}
+            for section, values in data.items()
+        }
+
+        if HAS_TOML_W:
+            toml_text: str = tomli_w.dumps(toml_data)
+            return "\n".join(header) + "\n" + toml_text
+
+        # Manual TOML generation (tomli doesn't have dump). Config values are
+        # strings, numbers, booleans and string lists; JSON renders strings and
+        # lists as valid TOML.
+        lines = list(header)
+        for section, values in toml_data.items():
+            lines.append(f"[{section}]")
+            for key, value in values.items():
+                if isinstance(value, bool):
+                    rendered = "true" if value else "false"
+                elif isinstance(value, (int, float)):
+                    rendered = repr(value)
+                else:
+                    rendered = json.dumps(value)
+                lines.append(f"{key} = {rendered}")
+            lines.append("")
+
         return "\n".join(lines)
 
     else:
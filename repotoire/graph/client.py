@@ -1,7 +1,8 @@
 """Neo4j database client."""
 
-from typing import Any, Dict, List, Optional, Callable, TypeVar
-from neo4j import GraphDatabase, Driver, Result
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Callable, Sequence, Tuple, TypeVar
+from neo4j import GraphDatabase, Driver, ManagedTransaction, Result, Session
 from neo4j.exceptions import ServiceUnavailable, SessionExpired
 import logging
 import time
@@ -206,6 +207,106 @@ class Neo4jClient:
 
         return self._retry_operation(_execute, operation_name="execute_query")
 
+    @contextmanager
+    def execute_query_stream(
+        self,
+        query: str,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Iterator[Dict]]:
+        """Execute a Cypher query and stream its records inside a with block.
+
+        Unlike execute_query, records are not materialized into a list, so large
+        result sets are transformed while the rest is still streaming in. Opening
+        the session and submitting the query are retried; once iteration begins,
+        errors propagate to the caller. The session is held until the block
+        exits, which discards any unread records and closes it.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            timeout: Query timeout in seconds (uses default if not specified)
+
+        Yields:
+            Iterator over the result records as dictionaries
+
+        Example:
+            >>> with client.execute_query_stream("MATCH (f:File) RETURN f.name AS name") as rows:
+            ...     first = next(rows, None)
+        """
+        timeout_ms = int((timeout or self.query_timeout) * 1000)
+
+        def _open() -> Tuple[Session, Result]:
+            session = self.driver.session()
+            try:
+                return session, session.run(query, parameters or {}, timeout=timeout_ms)
+            except Exception:
+                session.close()
+                raise
+
+        session, result = self._retry_operation(_open, operation_name="execute_query_stream")
+        try:
+            yield (dict(record) for record in result)
+        finally:
+            try:
+                result.consume()
+            finally:
+                session.close()
+
+    def execute_write_batch(self, queries: Sequence[str]) -> None:
+        """Run several parameterless statements in a single write transaction.
+
+        All statements share one session and commit once, so a batch costs a
+        single round-trip instead of one per statement. If any statement fails
+        the whole transaction rolls back.
+
+        Args:
+            queries: Cypher statements to run in order
+
+        Raises:
+            Exception: If the transaction fails after retries
+        """
+        def _run_all(tx: ManagedTransaction, qs: Sequence[str]) -> None:
+            for q in qs:
+                tx.run(q).consume()
+
+        def _execute_write() -> None:
+            with self.driver.session() as session:
+                session.execute_write(_run_all, queries)
+
+        self._retry_operation(_execute_write, operation_name="execute_write_batch")
+
+    def execute_each(self, queries: Sequence[str]) -> List[Optional[Exception]]:
+        """Run parameterless statements one by one on a single session.
+
+        Each statement auto-commits on its own, so a failure only affects that
+        statement, but connection acquisition is paid once for the whole list
+        rather than once per statement as with repeated execute_query calls.
+
+        Args:
+            queries: Cypher statements to run in order
+
+        Returns:
+            One entry per statement: None on success, or the error it raised
+
+        Raises:
+            Exception: If the connection fails after retries
+        """
+        def _execute() -> List[Optional[Exception]]:
+            errors: List[Optional[Exception]] = []
+            with self.driver.session() as session:
+                for q in queries:
+                    try:
+                        session.run(q).consume()
+                        errors.append(None)
+                    except (ServiceUnavailable, SessionExpired):
+                        raise
+                    except Exception as e:
+                        errors.append(e)
+            return errors
+
+        return self._retry_operation(_execute, operation_name="execute_each")
+
     def create_node(self, entity: Entity) -> str:
         """Create a node in the graph.
 
@@ -466,15 +567,16 @@ class Neo4jClient:
         logger.warning("Cleared all nodes from graph")
 
     def create_indexes(self) -> None:
-        """Create indexes for better query performance."""
-        indexes = [
-            "CREATE INDEX file_path IF NOT EXISTS FOR (f:File) ON (f.filePath)",
-            "CREATE INDEX class_name IF NOT EXISTS FOR (c:Class) ON (c.qualifiedName)",
-            "CREATE INDEX function_name IF NOT EXISTS FOR (f:Function) ON (f.qualifiedName)",
-        ]
-
-        for index_query in indexes:
-            self.execute_query(index_query)
+        """Create indexes for better query performance.
+
+        Creates the lookup indexes on File.filePath, Class.qualifiedName and
+        Function.qualifiedName in one transaction. The definitions are shared
+        with GraphSchema, which creates them as part of the full schema, so
+        they are named file_path_idx, class_name_idx and function_name_idx.
+        """
+        from repotoire.graph.schema import _LOOKUP_INDEXES  # avoid circular import
+
+        self.execute_write_batch(_LOOKUP_INDEXES)
 
         logger.info("Created graph indexes")
 
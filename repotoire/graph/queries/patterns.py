@@ -4,9 +4,266 @@ This module provides reusable Cypher patterns for detecting common graph structu
 and calculating graph metrics used by detectors.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import uuid
+from functools import lru_cache
+from typing import ContextManager, Iterator, List, Dict, Any, Optional, Tuple
 from repotoire.graph.client import Neo4jClient
-from repotoire.validation import validate_identifier
+from repotoire.validation import validate_identifier, validate_path_depth
+
+
+# Query builders are cached on their (already validated) identifiers so repeated
+# calls produce the identical string object, letting Neo4j reuse its cached plan
+# and skipping f-string assembly on the Python side. Numeric knobs stay parameters.
+
+def _order_and_limit(sort_key: str, sort: bool, limit_param: Optional[str]) -> str:
+    # Sorting is only pushed to the server when the caller consumes the order
+    # (or needs it to pick the top rows); a LIMIT lets the planner use a top-k heap
+    clauses = []
+    if sort or limit_param:
+        clauses.append(f"ORDER BY {sort_key} DESC")
+    if limit_param:
+        clauses.append(f"LIMIT ${limit_param}")
+    return "\n        ".join(clauses)
+
+
+@lru_cache(maxsize=256)
+def _degree_centrality_query(
+    label: str, rel_type: str, direction: str, sort: bool = True, limited: bool = False
+) -> str:
+    if direction == "OUTGOING":
+        rel_pattern = f"-[:{rel_type}]->"
+    elif direction == "INCOMING":
+        rel_pattern = f"<-[:{rel_type}]-"
+    else:  # BOTH
+        rel_pattern = f"-[:{rel_type}]-"
+
+    return f"""
+        MATCH (n:{label})
+        OPTIONAL MATCH (n){rel_pattern}(connected)
+        WITH n, count(connected) AS degree
+        RETURN elementId(n) AS node,
+               n.name AS name,
+               n.filePath AS file_path,
+               degree
+        {_order_and_limit("degree", sort, "top_k" if limited else None)}
+        """
+
+
+@lru_cache(maxsize=256)
+def _adjacency_query(label: str, rel_type: str) -> str:
+    # One row per node with its outgoing neighbours (collect() drops the nulls
+    # produced by the OPTIONAL MATCH, so isolated nodes get an empty list)
+    return f"""
+        MATCH (n:{label})
+        OPTIONAL MATCH (n)-[:{rel_type}]->(m:{label})
+        RETURN elementId(n) AS node,
+               n.filePath AS file_path,
+               collect(elementId(m)) AS targets
+        """
+
+
+@lru_cache(maxsize=256)
+def _gds_project_query(label: str, rel_type: str) -> str:
+    return f"""
+        MATCH (source:{label})
+        OPTIONAL MATCH (source)-[:{rel_type}]->(target:{label})
+        WITH gds.graph.project($graph_name, source, target) AS g
+        RETURN g.graphName AS graph_name
+        """
+
+
+@lru_cache(maxsize=8)
+def _gds_wcc_query(sort: bool = True, limited: bool = False) -> str:
+    return f"""
+        CALL gds.wcc.stream($graph_name)
+        YIELD nodeId, componentId
+        WITH componentId, collect(gds.util.asNode(nodeId)) AS members
+        RETURN elementId(members[0]) AS component_id,
+               [node IN members | node.filePath] AS nodes,
+               size(members) AS size
+        {_order_and_limit("size", sort, "top_k" if limited else None)}
+        """
+
+
+@lru_cache(maxsize=8)
+def _gds_scc_query(sort: bool = True, bounded: bool = False) -> str:
+    # Unlike the top-k queries, LIMIT here does not imply ORDER BY: with
+    # sort=False the server returns any $limit components unsorted
+    size_filter = "size(cycle) >= $min_length"
+    if bounded:
+        size_filter += " AND size(cycle) <= $max_length"
+    order = "ORDER BY length DESC\n        " if sort else ""
+    return f"""
+        CALL gds.scc.stream($graph_name)
+        YIELD nodeId, componentId
+        WITH componentId, collect(gds.util.asNode(nodeId).filePath) AS cycle
+        WHERE {size_filter}
+        RETURN cycle AS nodes, size(cycle) AS length
+        {order}LIMIT $limit
+        """
+
+_GDS_DROP_QUERY = "CALL gds.graph.drop($graph_name, false) YIELD graphName RETURN graphName"
+
+
+@lru_cache(maxsize=256)
+def _shortest_path_query(rel_filter: str, max_depth: int) -> str:
+    return f"""
+        MATCH (source), (target)
+        WHERE elementId(source) = $source_id AND elementId(target) = $target_id
+        MATCH path = shortestPath((source)-[{rel_filter}*1..{max_depth}]-(target))
+        RETURN path,
+               length(path) AS length,
+               [node IN nodes(path) | {{id: elementId(node), name: node.name}}] AS nodes
+        """
+
+
+@lru_cache(maxsize=256)
+def _shortest_paths_batch_query(rel_filter: str, max_depth: int) -> str:
+    # Pairs without a path produce no row; the caller fills in None for them
+    return f"""
+        UNWIND $pairs AS pair
+        MATCH (source), (target)
+        WHERE elementId(source) = pair.source_id AND elementId(target) = pair.target_id
+        MATCH path = shortestPath((source)-[{rel_filter}*1..{max_depth}]-(target))
+        RETURN pair.source_id AS source_id,
+               pair.target_id AS target_id,
+               path,
+               length(path) AS length,
+               [node IN nodes(path) | {{id: elementId(node), name: node.name}}] AS nodes
+        """
+
+
+@lru_cache(maxsize=256)
+def _all_paths_query(rel_filter: str, max_depth: int) -> str:
+    return f"""
+        MATCH (source), (target)
+        WHERE elementId(source) = $source_id AND elementId(target) = $target_id
+        MATCH path = (source)-[{rel_filter}*1..{max_depth}]-(target)
+        RETURN length(path) AS length,
+               [node IN nodes(path) | {{id: elementId(node), name: node.name}}] AS nodes
+        ORDER BY length
+        LIMIT $limit
+        """
+
+
+@lru_cache(maxsize=256)
+def _bottlenecks_query(
+    label: str, rel_type: str, sort: bool = True, limited: bool = False
+) -> str:
+    # Simple approximation: nodes with high combined in/out degree
+    return f"""
+        MATCH (n:{label})
+        OPTIONAL MATCH (n)-[:{rel_type}]->(out)
+        OPTIONAL MATCH (n)<-[:{rel_type}]-(in)
+        WITH n,
+             count(DISTINCT out) AS out_degree,
+             count(DISTINCT in) AS in_degree,
+             count(DISTINCT out) + count(DISTINCT in) AS total_degree
+        WHERE total_degree >= $threshold
+        RETURN elementId(n) AS node,
+               n.name AS name,
+               n.filePath AS file_path,
+               in_degree,
+               out_degree,
+               total_degree AS degree
+        {_order_and_limit("total_degree", sort, "top_k" if limited else None)}
+        """
+
+
+@lru_cache(maxsize=256)
+def _clustering_coefficient_query(label: str, rel_type: str) -> str:
+    # For each node, count triangles and possible triangles
+    return f"""
+        MATCH (n:{label})
+        OPTIONAL MATCH (n)-[:{rel_type}]-(neighbor:{label})
+        WITH n, collect(DISTINCT neighbor) AS neighbors, count(DISTINCT neighbor) AS degree
+        WHERE degree >= 2
+        UNWIND neighbors AS neighbor1
+        UNWIND neighbors AS neighbor2
+        WITH n, neighbor1, neighbor2, degree
+        WHERE neighbor1 <> neighbor2
+        OPTIONAL MATCH (neighbor1)-[:{rel_type}]-(neighbor2)
+        WITH n, degree, count(DISTINCT neighbor2) AS triangles
+        WITH n, degree, triangles, (degree * (degree - 1)) / 2.0 AS possible
+        WHERE possible > 0
+        RETURN avg(triangles / possible) AS avg_clustering_coefficient
+        """
+
+
+@lru_cache(maxsize=256)
+def _graph_metrics_query(label: str, rel_type: str) -> str:
+    # Collect each direction in its own WITH so the two OPTIONAL MATCHes do not
+    # multiply into an outs x ins cross product per node
+    return f"""
+        MATCH (n:{label})
+        OPTIONAL MATCH (n)-[:{rel_type}]->(out)
+        WITH n, collect(DISTINCT elementId(out)) AS outs
+        OPTIONAL MATCH (n)<-[:{rel_type}]-(in)
+        WITH n, outs, collect(DISTINCT elementId(in)) AS ins
+        RETURN elementId(n) AS node,
+               n.name AS name,
+               n.filePath AS file_path,
+               outs,
+               ins
+        """
+
+
+def _strongly_connected_components(neighbors: Dict[str, List[str]]) -> List[List[str]]:
+    """Tarjan's algorithm, iterative so deep graphs cannot hit the recursion limit.
+
+    Args:
+        neighbors: Adjacency list mapping node id -> outgoing neighbour ids
+
+    Returns:
+        List of components, each a list of node ids
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: set = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in neighbors:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(neighbors[root]))]
+
+        while work:
+            node, children = work[-1]
+            descended = False
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(neighbors.get(child, ()))))
+                    descended = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
 
 
 class CypherPatterns:
@@ -19,25 +276,110 @@ class CypherPatterns:
             client: Neo4j client instance
         """
         self.client = client
+        # (token, context) -> validated token; labels and relationship types
+        # cannot be query parameters, so validate each one once and reuse it
+        self._validated: Dict[Tuple[str, str], str] = {}
+        self._gds_available: Optional[bool] = None
+
+    def _check(self, token: str, context: str) -> str:
+        """Validate a label/relationship type for interpolation into Cypher.
+
+        Args:
+            token: Node label or relationship type
+            context: Description used in the error message
+
+        Returns:
+            The validated token
+
+        Raises:
+            ValidationError: If the token is not a safe identifier
+        """
+        key = (token, context)
+        validated = self._validated.get(key)
+        if validated is None:
+            validated = validate_identifier(token, context)
+            self._validated[key] = validated
+        return validated
+
+    @staticmethod
+    def _node_rows(
+        stream: ContextManager[Iterator[Dict[str, Any]]], fields: Tuple[str, ...]
+    ) -> Iterator[Dict[str, Any]]:
+        """Shape per-node metric rows as they stream in.
+
+        The stream's session is released when this generator is exhausted or
+        closed.
+
+        Args:
+            stream: execute_query_stream() context over rows with 'node',
+                'name', 'file_path' and the metric fields
+            fields: Metric fields to copy from each row
+
+        Yields:
+            Dictionaries with 'node', 'name', 'file_path' and ``fields``
+        """
+        with stream as rows:
+            for r in rows:
+                result = {
+                    "node": r["node"],
+                    "name": r["name"],
+                    "file_path": r.get("file_path"),
+                }
+                for field in fields:
+                    result[field] = r[field]
+                yield result
+
+    def _has_gds(self) -> bool:
+        """Check (once per instance) whether the Neo4j GDS plugin is available."""
+        if self._gds_available is None:
+            try:
+                self._gds_available = bool(
+                    self.client.execute_query("RETURN gds.version() AS version")
+                )
+            except Exception:
+                self._gds_available = False
+        return self._gds_available
+
+    def _fetch_adjacency(self, label: str, rel_type: str) -> List[Dict[str, Any]]:
+        """Fetch every node with its outgoing neighbour ids in a single query.
+
+        Args:
+            label: Validated node label
+            rel_type: Validated relationship type
+
+        Returns:
+            List of dictionaries with 'node', 'file_path', and 'targets' keys
+        """
+        return self.client.execute_query(_adjacency_query(label, rel_type))
 
     def find_cycles(
         self,
         node_label: str = "File",
         relationship_type: str = "IMPORTS",
         min_length: int = 2,
-        max_length: int = 15,
+        max_length: Optional[int] = None,
         limit: int = 100,
+        sort: bool = True,
     ) -> List[Dict[str, Any]]:
         """Find circular dependencies in the graph.
 
-        Uses shortest path queries to detect cycles between nodes.
+        Every strongly connected component with two or more nodes is a set of
+        mutually reachable nodes, i.e. a dependency cycle. Components are found
+        with GDS when available, otherwise with Tarjan's algorithm over an edge
+        list fetched in a single query. Both are linear in nodes + edges.
+
+        ``length`` is the number of nodes in the component, not the length of
+        a single cycle path through it, so large tangles are reported whole.
 
         Args:
             node_label: Label of nodes to check for cycles
             relationship_type: Relationship type to traverse
-            min_length: Minimum cycle length (default: 2)
-            max_length: Maximum cycle length to search (default: 15)
+            min_length: Minimum component size (default: 2)
+            max_length: Maximum component size to report; None (the default)
+                reports components of any size
             limit: Maximum number of cycles to return
+            sort: Order cycles largest first; when False the sort is skipped
+                and any ``limit`` cycles are returned
 
         Returns:
             List of cycle dictionaries with 'nodes' and 'length' keys
@@ -49,35 +391,50 @@ class CypherPatterns:
             ...     print(f"Cycle of length {cycle['length']}: {cycle['nodes']}")
         """
         # Validate inputs to prevent Cypher injection
-        validated_label = validate_identifier(node_label, "node label")
-        validated_rel_type = validate_identifier(relationship_type, "relationship type")
-
-        # Use parameterized query for numeric values
-        query = f"""
-        MATCH (n1:{validated_label})
-        MATCH (n2:{validated_label})
-        WHERE elementId(n1) < elementId(n2) AND n1 <> n2
-        MATCH path = shortestPath((n1)-[:{validated_rel_type}*$min_length..$max_length]->(n2))
-        MATCH cyclePath = shortestPath((n2)-[:{validated_rel_type}*$min_length..$max_length]->(n1))
-        WITH DISTINCT [node IN nodes(path) + nodes(cyclePath) WHERE node:{validated_label} | node.filePath] AS cycle
-        WHERE size(cycle) > 1
-        RETURN cycle AS nodes, size(cycle) AS length
-        ORDER BY length DESC
-        LIMIT $limit
-        """
-        results = self.client.execute_query(query, parameters={
-            "min_length": min_length,
-            "max_length": max_length,
-            "limit": limit
-        })
-        return [{"nodes": r["nodes"], "length": r["length"]} for r in results]
+        validated_label = self._check(node_label, "node label")
+        validated_rel_type = self._check(relationship_type, "relationship type")
+
+        if self._has_gds():
+            params: Dict[str, Any] = {
+                "graph_name": f"repotoire-scc-{uuid.uuid4().hex}",
+                "min_length": min_length,
+                "limit": limit,
+            }
+            if max_length is not None:
+                params["max_length"] = max_length
+            self.client.execute_query(
+                _gds_project_query(validated_label, validated_rel_type), parameters=params
+            )
+            try:
+                results = self.client.execute_query(
+                    _gds_scc_query(sort, max_length is not None), parameters=params
+                )
+            finally:
+                self.client.execute_query(_GDS_DROP_QUERY, parameters=params)
+            return [{"nodes": r["nodes"], "length": r["length"]} for r in results]
+
+        rows = self._fetch_adjacency(validated_label, validated_rel_type)
+        file_paths = {r["node"]: r["file_path"] for r in rows}
+        neighbors = {r["node"]: r["targets"] for r in rows}
+
+        cycles = [
+            {"nodes": [file_paths[m] for m in component], "length": len(component)}
+            for component in _strongly_connected_components(neighbors)
+            if len(component) >= min_length
+            and (max_length is None or len(component) <= max_length)
+        ]
+        if not sort:
+            return cycles[:limit]
+        return heapq.nlargest(limit, cycles, key=lambda c: c["length"])
 
     def calculate_degree_centrality(
         self,
         node_label: str = "File",
         relationship_type: str = "IMPORTS",
         direction: str = "OUTGOING",
-    ) -> List[Dict[str, Any]]:
+        top_k: Optional[int] = None,
+        sort: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
         """Calculate degree centrality for nodes.
 
         Degree centrality measures how many connections a node has.
@@ -86,19 +443,26 @@ class CypherPatterns:
             node_label: Label of nodes to analyze
             relationship_type: Relationship type to count
             direction: "OUTGOING", "INCOMING", or "BOTH"
+            top_k: Only return the K highest-degree nodes (always sorted)
+            sort: Order results by degree descending; pass False to skip the
+                server-side sort when order is not needed
 
         Returns:
-            List of dictionaries with 'node', 'name', and 'degree' keys
+            Iterator of dictionaries with 'node', 'name', 'file_path' and
+            'degree' keys, streamed from the server. This used to be a list:
+            wrap it in list() for len() or indexing. The query's session stays
+            open until the iterator is exhausted, so call its close() (or use
+            contextlib.closing) when stopping early.
 
         Example:
             >>> patterns = CypherPatterns(client)
-            >>> centrality = patterns.calculate_degree_centrality("File", "IMPORTS", "OUTGOING")
+            >>> centrality = list(patterns.calculate_degree_centrality("File", "IMPORTS", "OUTGOING"))
             >>> for node in centrality[:10]:
             ...     print(f"{node['name']}: {node['degree']} outgoing connections")
         """
         # Validate inputs to prevent Cypher injection
-        validated_label = validate_identifier(node_label, "node label")
-        validated_rel_type = validate_identifier(relationship_type, "relationship type")
+        validated_label = self._check(node_label, "node label")
+        validated_rel_type = self._check(relationship_type, "relationship type")
 
         # Validate direction parameter
         valid_directions = {"OUTGOING", "INCOMING", "BOTH"}
@@ -109,85 +473,129 @@ class CypherPatterns:
                 f"Direction must be one of: {', '.join(valid_directions)}"
             )
 
-        if direction == "OUTGOING":
-            rel_pattern = f"-[:{validated_rel_type}]->"
-        elif direction == "INCOMING":
-            rel_pattern = f"<-[:{validated_rel_type}]-"
-        else:  # BOTH
-            rel_pattern = f"-[:{validated_rel_type}]-"
-
-        query = f"""
-        MATCH (n:{validated_label})
-        OPTIONAL MATCH (n){rel_pattern}(connected)
-        WITH n, count(connected) AS degree
-        RETURN elementId(n) AS node,
-               n.name AS name,
-               n.filePath AS file_path,
-               degree
-        ORDER BY degree DESC
-        """
-        results = self.client.execute_query(query)
-        return [
-            {
-                "node": r["node"],
-                "name": r["name"],
-                "file_path": r.get("file_path"),
-                "degree": r["degree"],
-            }
-            for r in results
-        ]
+        query = _degree_centrality_query(
+            validated_label, validated_rel_type, direction, sort, top_k is not None
+        )
+        params = {"top_k": top_k} if top_k is not None else None
+        stream = self.client.execute_query_stream(query, parameters=params)
+        return self._node_rows(stream, ("degree",))
 
     def find_connected_components(
         self,
         node_label: str = "File",
         relationship_type: str = "IMPORTS",
-    ) -> List[Dict[str, Any]]:
+        top_k: Optional[int] = None,
+        sort: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
         """Find connected components (groups of connected nodes).
 
+        Uses GDS weakly connected components when the plugin is available;
+        otherwise fetches the edge list once and labels components client-side.
+        Both are linear in nodes + edges. Relationship direction is ignored.
+
         Args:
             node_label: Label of nodes to analyze
             relationship_type: Relationship type to traverse
+            top_k: Only return the K largest components (always sorted)
+            sort: Order components largest first; pass False to skip sorting
 
         Returns:
-            List of dictionaries with 'component_id' and 'nodes' keys
+            Iterator of dictionaries with 'component_id', 'nodes', and 'size'
+            keys. This used to be a list: wrap it in list() for len() or indexing.
 
         Example:
             >>> patterns = CypherPatterns(client)
-            >>> components = patterns.find_connected_components("File", "IMPORTS")
+            >>> components = list(patterns.find_connected_components("File", "IMPORTS"))
             >>> print(f"Found {len(components)} connected components")
         """
         # Validate inputs to prevent Cypher injection
-        validated_label = validate_identifier(node_label, "node label")
-        validated_rel_type = validate_identifier(relationship_type, "relationship type")
-
-        # Simple connected components using APOC or manual approach
-        # For MVP, we'll use a simple approach: find all nodes reachable from each node
-        query = f"""
-        MATCH (n:{validated_label})
-        OPTIONAL MATCH path = (n)-[:{validated_rel_type}*]-(connected:{validated_label})
-        WITH n, collect(DISTINCT connected) + [n] AS component
-        RETURN elementId(n) AS component_id,
-               [node IN component | node.filePath] AS nodes,
-               size(component) AS size
-        ORDER BY size DESC
-        """
-        results = self.client.execute_query(query)
+        validated_label = self._check(node_label, "node label")
+        validated_rel_type = self._check(relationship_type, "relationship type")
 
-        # Deduplicate components (same nodes in different order)
-        seen_components = set()
-        unique_components = []
+        if self._has_gds():
+            return self._gds_connected_components(
+                validated_label, validated_rel_type, top_k, sort
+            )
+
+        # Without GDS, pull the edge list once and label components client-side
+        rows = self._fetch_adjacency(validated_label, validated_rel_type)
+        file_paths: Dict[str, Any] = {}
+        neighbors: Dict[str, set] = {}
+        for r in rows:
+            node = r["node"]
+            file_paths[node] = r["file_path"]
+            neighbors.setdefault(node, set())
+            for target in r["targets"]:
+                # Components are weak: follow edges in both directions
+                neighbors[node].add(target)
+                neighbors.setdefault(target, set()).add(node)
+
+        visited: set = set()
+        components: List[Dict[str, Any]] = []
+        for start in file_paths:
+            if start in visited:
+                continue
+            visited.add(start)
+            stack = [start]
+            members = []
+            while stack:
+                current = stack.pop()
+                members.append(current)
+                for neighbor in neighbors[current]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        stack.append(neighbor)
+            components.append({
+                "component_id": start,
+                "nodes": [file_paths[m] for m in members],
+                "size": len(members),
+            })
+
+        if top_k is not None:
+            return iter(heapq.nlargest(top_k, components, key=lambda c: c["size"]))
+        if sort:
+            components.sort(key=lambda c: c["size"], reverse=True)
+        return iter(components)
+
+    def _gds_connected_components(
+        self,
+        label: str,
+        rel_type: str,
+        top_k: Optional[int] = None,
+        sort: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Run weakly connected components via GDS on a throwaway projection.
 
-        for r in results:
-            nodes_tuple = tuple(sorted(r["nodes"]))
-            if nodes_tuple not in seen_components:
-                seen_components.add(nodes_tuple)
-                unique_components.append({
-                    "component_id": r["component_id"],
-                    "nodes": r["nodes"],
-                    "size": r["size"],
-                })
+        Args:
+            label: Validated node label
+            rel_type: Validated relationship type
+            top_k: Only return the K largest components
+            sort: Order components largest first
 
-        return unique_components
+        Returns:
+            Iterator of dictionaries with 'component_id', 'nodes', and 'size' keys
+        """
+        params: Dict[str, Any] = {"graph_name": f"repotoire-wcc-{uuid.uuid4().hex}"}
+        if top_k is not None:
+            params["top_k"] = top_k
+        self.client.execute_query(_gds_project_query(label, rel_type), parameters=params)
+        try:
+            results = self.client.execute_query(
+                _gds_wcc_query(sort, top_k is not None), parameters=params
+            )
+        finally:
+            # Drop eagerly rather than on iterator exhaustion so the projection
+            # cannot leak if the caller never consumes the results
+            self.client.execute_query(_GDS_DROP_QUERY, parameters=params)
+
+        return (
+            {
+                "component_id": r["component_id"],
+                "nodes": r["nodes"],
+                "size": r["size"],
+            }
+            for r in results
+        )
 
     def find_shortest_path(
         self,
@@ -202,7 +610,7 @@ class CypherPatterns:
             source_id: elementId of source node
             target_id: elementId of target node
             relationship_type: Optional relationship type to traverse
-            max_depth: Maximum path length to search
+            max_depth: Maximum path length to search (1 to 100)
 
         Returns:
             Dictionary with 'path', 'length', and 'nodes' keys, or None if no path
@@ -215,26 +623,19 @@ class CypherPatterns:
         """
         # Validate relationship_type if provided
         if relationship_type:
-            validated_rel_type = validate_identifier(relationship_type, "relationship type")
+            validated_rel_type = self._check(relationship_type, "relationship type")
             rel_filter = f":{validated_rel_type}"
         else:
             rel_filter = ""
 
-        # Use parameterized query for max_depth
-        query = f"""
-        MATCH (source), (target)
-        WHERE elementId(source) = $source_id AND elementId(target) = $target_id
-        MATCH path = shortestPath((source)-[{rel_filter}*1..$max_depth]-(target))
-        RETURN path,
-               length(path) AS length,
-               [node IN nodes(path) | {{id: elementId(node), name: node.name}}] AS nodes
-        """
+        # Cypher rejects parameters in variable-length bounds, so the
+        # validated depth is written into the query
+        query = _shortest_path_query(rel_filter, validate_path_depth(max_depth))
         results = self.client.execute_query(
             query,
             parameters={
                 "source_id": source_id,
                 "target_id": target_id,
-                "max_depth": max_depth
             }
         )
 
@@ -247,6 +648,65 @@ class CypherPatterns:
             }
         return None
 
+    def find_shortest_paths(
+        self,
+        pairs: List[Tuple[str, str]],
+        relationship_type: Optional[str] = None,
+        max_depth: int = 10,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Find shortest paths for many (source, target) pairs in one query.
+
+        Equivalent to calling find_shortest_path for each pair, but the pairs
+        are sent as a single parameter list and UNWOUND server-side, so the
+        whole batch costs one round-trip.
+
+        Args:
+            pairs: (source elementId, target elementId) tuples
+            relationship_type: Optional relationship type to traverse
+            max_depth: Maximum path length to search (1 to 100)
+
+        Returns:
+            One entry per input pair, in order: a dictionary with 'path',
+            'length', and 'nodes' keys, or None if no path exists
+
+        Example:
+            >>> patterns = CypherPatterns(client)
+            >>> paths = patterns.find_shortest_paths([(a_id, b_id), (a_id, c_id)], "CALLS")
+            >>> reachable = [p for p in paths if p is not None]
+        """
+        if not pairs:
+            return []
+
+        # Validate relationship_type if provided
+        if relationship_type:
+            validated_rel_type = self._check(relationship_type, "relationship type")
+            rel_filter = f":{validated_rel_type}"
+        else:
+            rel_filter = ""
+
+        # Cypher rejects parameters in variable-length bounds, so the
+        # validated depth is written into the query
+        query = _shortest_paths_batch_query(rel_filter, validate_path_depth(max_depth))
+        results = self.client.execute_query(
+            query,
+            parameters={
+                "pairs": [
+                    {"source_id": source_id, "target_id": target_id}
+                    for source_id, target_id in pairs
+                ],
+            }
+        )
+
+        found = {
+            (r["source_id"], r["target_id"]): {
+                "path": r["path"],
+                "length": r["length"],
+                "nodes": r["nodes"],
+            }
+            for r in results
+        }
+        return [found.get((source_id, target_id)) for source_id, target_id in pairs]
+
     def find_all_paths(
         self,
         source_id: str,
@@ -261,7 +721,7 @@ class CypherPatterns:
             source_id: elementId of source node
             target_id: elementId of target node
             relationship_type: Optional relationship type to traverse
-            max_depth: Maximum path length to search
+            max_depth: Maximum path length to search (1 to 100)
             limit: Maximum number of paths to return
 
         Returns:
@@ -274,27 +734,19 @@ class CypherPatterns:
         """
         # Validate relationship_type if provided
         if relationship_type:
-            validated_rel_type = validate_identifier(relationship_type, "relationship type")
+            validated_rel_type = self._check(relationship_type, "relationship type")
             rel_filter = f":{validated_rel_type}"
         else:
             rel_filter = ""
 
-        # Use parameterized query for numeric values
-        query = f"""
-        MATCH (source), (target)
-        WHERE elementId(source) = $source_id AND elementId(target) = $target_id
-        MATCH path = (source)-[{rel_filter}*1..$max_depth]-(target)
-        RETURN length(path) AS length,
-               [node IN nodes(path) | {{id: elementId(node), name: node.name}}] AS nodes
-        ORDER BY length
-        LIMIT $limit
-        """
+        # Cypher rejects parameters in variable-length bounds, so the
+        # validated depth is written into the query; limit stays a parameter
+        query = _all_paths_query(rel_filter, validate_path_depth(max_depth))
         results = self.client.execute_query(
             query,
             parameters={
                 "source_id": source_id,
                 "target_id": target_id,
-                "max_depth": max_depth,
                 "limit": limit
             }
         )
@@ -306,7 +758,9 @@ class CypherPatterns:
         node_label: str = "File",
         relationship_type: str = "IMPORTS",
         threshold: int = 10,
-    ) -> List[Dict[str, Any]]:
+        top_k: Optional[int] = None,
+        sort: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
         """Find bottleneck nodes (high betweenness centrality).
 
         Bottleneck nodes are those that appear in many paths between other nodes.
@@ -315,50 +769,34 @@ class CypherPatterns:
             node_label: Label of nodes to analyze
             relationship_type: Relationship type to traverse
             threshold: Minimum degree to be considered a bottleneck
+            top_k: Only return the K highest-degree bottlenecks (always sorted)
+            sort: Order results by degree descending; pass False to skip the
+                server-side sort when order is not needed
 
         Returns:
-            List of bottleneck node dictionaries
+            Iterator of bottleneck node dictionaries, streamed from the server.
+            This used to be a list: wrap it in list() for len() or indexing.
+            The query's session stays open until the iterator is exhausted, so
+            call its close() (or use contextlib.closing) when stopping early.
 
         Example:
             >>> patterns = CypherPatterns(client)
-            >>> bottlenecks = patterns.find_bottlenecks("File", "IMPORTS", threshold=5)
+            >>> bottlenecks = list(patterns.find_bottlenecks("File", "IMPORTS", threshold=5))
             >>> for node in bottlenecks:
             ...     print(f"Bottleneck: {node['name']} (degree: {node['degree']})")
         """
         # Validate inputs to prevent Cypher injection
-        validated_label = validate_identifier(node_label, "node label")
-        validated_rel_type = validate_identifier(relationship_type, "relationship type")
-
-        # Simple approximation: nodes with high combined in/out degree
-        query = f"""
-        MATCH (n:{validated_label})
-        OPTIONAL MATCH (n)-[:{validated_rel_type}]->(out)
-        OPTIONAL MATCH (n)<-[:{validated_rel_type}]-(in)
-        WITH n,
-             count(DISTINCT out) AS out_degree,
-             count(DISTINCT in) AS in_degree,
-             count(DISTINCT out) + count(DISTINCT in) AS total_degree
-        WHERE total_degree >= $threshold
-        RETURN elementId(n) AS node,
-               n.name AS name,
-               n.filePath AS file_path,
-               in_degree,
-               out_degree,
-               total_degree AS degree
-        ORDER BY total_degree DESC
-        """
-        results = self.client.execute_query(query, parameters={"threshold": threshold})
-        return [
-            {
-                "node": r["node"],
-                "name": r["name"],
-                "file_path": r.get("file_path"),
-                "in_degree": r["in_degree"],
-                "out_degree": r["out_degree"],
-                "degree": r["degree"],
-            }
-            for r in results
-        ]
+        validated_label = self._check(node_label, "node label")
+        validated_rel_type = self._check(relationship_type, "relationship type")
+
+        query = _bottlenecks_query(
+            validated_label, validated_rel_type, sort, top_k is not None
+        )
+        params: Dict[str, Any] = {"threshold": threshold}
+        if top_k is not None:
+            params["top_k"] = top_k
+        stream = self.client.execute_query_stream(query, parameters=params)
+        return self._node_rows(stream, ("in_degree", "out_degree", "degree"))
 
     def calculate_clustering_coefficient(
         self,
@@ -382,26 +820,95 @@ class CypherPatterns:
             >>> print(f"Clustering coefficient: {coef:.3f}")
         """
         # Validate inputs to prevent Cypher injection
-        validated_label = validate_identifier(node_label, "node label")
-        validated_rel_type = validate_identifier(relationship_type, "relationship type")
+        validated_label = self._check(node_label, "node label")
+        validated_rel_type = self._check(relationship_type, "relationship type")
 
-        # For each node, count triangles and possible triangles
-        query = f"""
-        MATCH (n:{validated_label})
-        OPTIONAL MATCH (n)-[:{validated_rel_type}]-(neighbor:{validated_label})
-        WITH n, collect(DISTINCT neighbor) AS neighbors, count(DISTINCT neighbor) AS degree
-        WHERE degree >= 2
-        UNWIND neighbors AS neighbor1
-        UNWIND neighbors AS neighbor2
-        WITH n, neighbor1, neighbor2, degree
-        WHERE neighbor1 <> neighbor2
-        OPTIONAL MATCH (neighbor1)-[:{validated_rel_type}]-(neighbor2)
-        WITH n, degree, count(DISTINCT neighbor2) AS triangles
-        WITH n, degree, triangles, (degree * (degree - 1)) / 2.0 AS possible
-        WHERE possible > 0
-        RETURN avg(triangles / possible) AS avg_clustering_coefficient
-        """
+        query = _clustering_coefficient_query(validated_label, validated_rel_type)
         results = self.client.execute_query(query)
         if results and results[0]["avg_clustering_coefficient"] is not None:
             return float(results[0]["avg_clustering_coefficient"])
         return 0.0
+
+    def compute_graph_metrics(
+        self,
+        node_label: str = "File",
+        relationship_type: str = "IMPORTS",
+        bottleneck_threshold: int = 10,
+    ) -> Dict[str, Any]:
+        """Compute degree, bottleneck and clustering metrics in one round-trip.
+
+        Fetches each node's incoming and outgoing neighbours once and derives
+        all three metrics from that single result. Degrees count distinct
+        neighbours, as find_bottlenecks does. The clustering coefficient is
+        the standard average local coefficient (linked neighbour pairs over
+        possible pairs) over nodes with at least two undirected neighbours of
+        the same label. It is not the value calculate_clustering_coefficient
+        returns: that query counts distinct neighbours instead of linked
+        pairs.
+
+        Args:
+            node_label: Label of nodes to analyze
+            relationship_type: Relationship type to traverse
+            bottleneck_threshold: Minimum total degree to be considered a bottleneck
+
+        Returns:
+            Dictionary with 'degrees' (per-node 'node', 'name', 'file_path',
+            'in_degree', 'out_degree' and 'degree'), 'bottlenecks' (the
+            subset at or above the threshold, highest degree first) and
+            'clustering_coefficient' (0.0 to 1.0)
+
+        Example:
+            >>> patterns = CypherPatterns(client)
+            >>> metrics = patterns.compute_graph_metrics("File", "IMPORTS", 5)
+            >>> print(f"{len(metrics['bottlenecks'])} bottlenecks, "
+            ...       f"clustering {metrics['clustering_coefficient']:.3f}")
+        """
+        # Validate inputs to prevent Cypher injection
+        validated_label = self._check(node_label, "node label")
+        validated_rel_type = self._check(relationship_type, "relationship type")
+
+        rows = self.client.execute_query(
+            _graph_metrics_query(validated_label, validated_rel_type)
+        )
+
+        degrees = [
+            {
+                "node": r["node"],
+                "name": r["name"],
+                "file_path": r.get("file_path"),
+                "in_degree": len(r["ins"]),
+                "out_degree": len(r["outs"]),
+                "degree": len(r["ins"]) + len(r["outs"]),
+            }
+            for r in rows
+        ]
+        bottlenecks = sorted(
+            (d for d in degrees if d["degree"] >= bottleneck_threshold),
+            key=lambda d: d["degree"],
+            reverse=True,
+        )
+
+        # Undirected neighbourhoods restricted to nodes of the same label
+        neighbors: Dict[str, set] = {r["node"]: set() for r in rows}
+        for r in rows:
+            node = r["node"]
+            for other in (*r["outs"], *r["ins"]):
+                if other != node and other in neighbors:
+                    neighbors[node].add(other)
+
+        coefficients = []
+        for node, adjacent in neighbors.items():
+            degree = len(adjacent)
+            if degree < 2:
+                continue
+            # Each edge between two neighbours is seen from both ends
+            links = sum(len(neighbors[other] & adjacent) for other in adjacent) / 2
+            coefficients.append(links / (degree * (degree - 1) / 2))
+
+        return {
+            "degrees": degrees,
+            "bottlenecks": bottlenecks,
+            "clustering_coefficient": (
+                sum(coefficients) / len(coefficients) if coefficients else 0.0
+            ),
+        }
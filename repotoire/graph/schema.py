@@ -1,107 +1,172 @@
 """Graph schema definition and initialization."""
 
+import hashlib
+import logging
+from typing import Sequence, Tuple
+
 from repotoire.graph.client import Neo4jClient
 
+logger = logging.getLogger(__name__)
 
-class GraphSchema:
-    """Manages graph schema creation and constraints."""
+def _quote_name(name: str) -> str:
+    """Quote a schema object name as a Cypher identifier.
 
-    # Constraint definitions
-    CONSTRAINTS = [
-        # Uniqueness constraints
-        "CREATE CONSTRAINT file_path_unique IF NOT EXISTS FOR (f:File) REQUIRE f.filePath IS UNIQUE",
-        "CREATE CONSTRAINT module_qualified_name_unique IF NOT EXISTS FOR (m:Module) REQUIRE m.qualifiedName IS UNIQUE",
-        "CREATE CONSTRAINT class_qualified_name_unique IF NOT EXISTS FOR (c:Class) REQUIRE c.qualifiedName IS UNIQUE",
-        "CREATE CONSTRAINT function_qualified_name_unique IF NOT EXISTS FOR (f:Function) REQUIRE f.qualifiedName IS UNIQUE",
-    ]
-
-    # Index definitions for performance
-    INDEXES = [
-        # Basic indexes
-        "CREATE INDEX file_path_idx IF NOT EXISTS FOR (f:File) ON (f.filePath)",
-        "CREATE INDEX file_language_idx IF NOT EXISTS FOR (f:File) ON (f.language)",
-        "CREATE INDEX module_name_idx IF NOT EXISTS FOR (m:Module) ON (m.qualifiedName)",
-        "CREATE INDEX module_external_idx IF NOT EXISTS FOR (m:Module) ON (m.is_external)",
-        "CREATE INDEX class_name_idx IF NOT EXISTS FOR (c:Class) ON (c.qualifiedName)",
-        "CREATE INDEX function_name_idx IF NOT EXISTS FOR (f:Function) ON (f.qualifiedName)",
-        "CREATE INDEX concept_name_idx IF NOT EXISTS FOR (c:Concept) ON (c.name)",
-        "CREATE INDEX attribute_name_idx IF NOT EXISTS FOR (a:Attribute) ON (a.name)",
-        "CREATE INDEX variable_name_idx IF NOT EXISTS FOR (v:Variable) ON (v.name)",
-        # Function and class name pattern matching (for STARTS WITH queries)
-        "CREATE INDEX function_simple_name_idx IF NOT EXISTS FOR (f:Function) ON (f.name)",
-        "CREATE INDEX class_simple_name_idx IF NOT EXISTS FOR (c:Class) ON (c.name)",
-        # File exports for dead code detection
-        "CREATE INDEX file_exports_idx IF NOT EXISTS FOR (f:File) ON (f.exports)",
-        # Full-text search indexes
-        "CREATE FULLTEXT INDEX function_docstring_idx IF NOT EXISTS FOR (f:Function) ON EACH [f.docstring]",
-        "CREATE FULLTEXT INDEX class_docstring_idx IF NOT EXISTS FOR (c:Class) ON EACH [c.docstring]",
-        # Composite indexes for detector queries
-        "CREATE INDEX class_complexity_idx IF NOT EXISTS FOR (c:Class) ON (c.complexity, c.is_abstract)",
-        "CREATE INDEX function_complexity_idx IF NOT EXISTS FOR (f:Function) ON (f.complexity, f.is_async)",
-        "CREATE INDEX file_language_loc_idx IF NOT EXISTS FOR (f:File) ON (f.language, f.loc)",
-        # Composite indexes leveraging enhanced properties (FAL-91)
-        "CREATE INDEX file_language_test_idx IF NOT EXISTS FOR (f:File) ON (f.language, f.is_test)",
-        "CREATE INDEX file_test_module_idx IF NOT EXISTS FOR (f:File) ON (f.is_test, f.module_path)",
-        "CREATE INDEX function_method_static_idx IF NOT EXISTS FOR (f:Function) ON (f.is_method, f.is_static)",
-        "CREATE INDEX function_method_property_idx IF NOT EXISTS FOR (f:Function) ON (f.is_method, f.is_property)",
-        "CREATE INDEX class_dataclass_exception_idx IF NOT EXISTS FOR (c:Class) ON (c.is_dataclass, c.is_exception)",
-        "CREATE INDEX function_async_yield_idx IF NOT EXISTS FOR (f:Function) ON (f.is_async, f.has_yield)",
-        # Relationship property indexes for query performance
-        "CREATE INDEX imports_module_idx IF NOT EXISTS FOR ()-[r:IMPORTS]-() ON (r.module)",
-        "CREATE INDEX calls_line_number_idx IF NOT EXISTS FOR ()-[r:CALLS]-() ON (r.line_number)",
-        "CREATE INDEX inherits_order_idx IF NOT EXISTS FOR ()-[r:INHERITS]-() ON (r.order)",
-        # Enhanced node property indexes (FAL-90)
-        "CREATE INDEX file_is_test_idx IF NOT EXISTS FOR (f:File) ON (f.is_test)",
-        "CREATE INDEX file_module_path_idx IF NOT EXISTS FOR (f:File) ON (f.module_path)",
-        "CREATE INDEX class_is_dataclass_idx IF NOT EXISTS FOR (c:Class) ON (c.is_dataclass)",
-        "CREATE INDEX class_is_exception_idx IF NOT EXISTS FOR (c:Class) ON (c.is_exception)",
-        "CREATE INDEX class_nesting_level_idx IF NOT EXISTS FOR (c:Class) ON (c.nesting_level)",
-        "CREATE INDEX function_is_method_idx IF NOT EXISTS FOR (f:Function) ON (f.is_method)",
-        "CREATE INDEX function_is_static_idx IF NOT EXISTS FOR (f:Function) ON (f.is_static)",
-        "CREATE INDEX function_is_property_idx IF NOT EXISTS FOR (f:Function) ON (f.is_property)",
-        "CREATE INDEX function_has_return_idx IF NOT EXISTS FOR (f:Function) ON (f.has_return)",
-        "CREATE INDEX function_has_yield_idx IF NOT EXISTS FOR (f:Function) ON (f.has_yield)",
-    ]
-
-    # Vector indexes for RAG (Neo4j 5.18+)
-    VECTOR_INDEXES = [
-        # Function embeddings for semantic code search
-        """
-        CREATE VECTOR INDEX function_embeddings IF NOT EXISTS
-        FOR (f:Function)
-        ON f.embedding
-        OPTIONS {
-            indexConfig: {
-                `vector.dimensions`: 1536,
-                `vector.similarity_function`: 'cosine'
-            }
+    Backticks inside the name are doubled, so any name (including Unicode,
+    dots or spaces) is safe to interpolate into a DROP statement.
+    """
+    return "`" + name.replace("`", "``") + "`"
+
+
+# Sentinel node recording the hash of the last fully applied DDL set
+_SCHEMA_MARKER_QUERY = "MATCH (s:_FalkorSchema {id: 'singleton'}) RETURN s.hash AS hash"
+_SCHEMA_MARKER_SET = "MERGE (s:_FalkorSchema {id: 'singleton'}) SET s.hash = $hash"
+_SCHEMA_MARKER_DELETE = "MATCH (s:_FalkorSchema) DELETE s"
+
+# Token lookup indexes Neo4j creates itself; drop_all leaves them in place
+_BUILTIN_INDEXES = ("node_label_index", "relationship_type_index")
+
+_SHOW_CONSTRAINTS_QUERY = """
+SHOW CONSTRAINTS
+YIELD name
+RETURN name
+"""
+
+# Indexes backing a constraint are dropped together with it, so skip them
+_SHOW_INDEXES_QUERY = """
+SHOW INDEXES
+YIELD name, owningConstraint
+WHERE owningConstraint IS NULL AND NOT name IN $builtin
+RETURN name
+"""
+
+# Constraint definitions
+_CONSTRAINTS: Tuple[str, ...] = (
+    # Uniqueness constraints
+    "CREATE CONSTRAINT file_path_unique IF NOT EXISTS FOR (f:File) REQUIRE f.filePath IS UNIQUE",
+    "CREATE CONSTRAINT module_qualified_name_unique IF NOT EXISTS FOR (m:Module) REQUIRE m.qualifiedName IS UNIQUE",
+    "CREATE CONSTRAINT class_qualified_name_unique IF NOT EXISTS FOR (c:Class) REQUIRE c.qualifiedName IS UNIQUE",
+    "CREATE CONSTRAINT function_qualified_name_unique IF NOT EXISTS FOR (f:Function) REQUIRE f.qualifiedName IS UNIQUE",
+)
+
+# Lookup indexes on the identifying property of files, classes and functions;
+# also what Neo4jClient.create_indexes creates on its own
+_LOOKUP_INDEXES: Tuple[str, ...] = (
+    "CREATE INDEX file_path_idx IF NOT EXISTS FOR (f:File) ON (f.filePath)",
+    "CREATE INDEX class_name_idx IF NOT EXISTS FOR (c:Class) ON (c.qualifiedName)",
+    "CREATE INDEX function_name_idx IF NOT EXISTS FOR (f:Function) ON (f.qualifiedName)",
+)
+
+# Index definitions for performance, grouped by purpose (see _INDEXES for the
+# order they are submitted in)
+_INDEX_DEFINITIONS: Tuple[str, ...] = (
+    # Basic indexes
+    *_LOOKUP_INDEXES,
+    "CREATE INDEX file_language_idx IF NOT EXISTS FOR (f:File) ON (f.language)",
+    "CREATE INDEX module_name_idx IF NOT EXISTS FOR (m:Module) ON (m.qualifiedName)",
+    "CREATE INDEX module_external_idx IF NOT EXISTS FOR (m:Module) ON (m.is_external)",
+    "CREATE INDEX concept_name_idx IF NOT EXISTS FOR (c:Concept) ON (c.name)",
+    "CREATE INDEX attribute_name_idx IF NOT EXISTS FOR (a:Attribute) ON (a.name)",
+    "CREATE INDEX variable_name_idx IF NOT EXISTS FOR (v:Variable) ON (v.name)",
+    # Function and class name pattern matching (for STARTS WITH queries)
+    "CREATE INDEX function_simple_name_idx IF NOT EXISTS FOR (f:Function) ON (f.name)",
+    "CREATE INDEX class_simple_name_idx IF NOT EXISTS FOR (c:Class) ON (c.name)",
+    # File exports for dead code detection
+    "CREATE INDEX file_exports_idx IF NOT EXISTS FOR (f:File) ON (f.exports)",
+    # Full-text search indexes
+    "CREATE FULLTEXT INDEX function_docstring_idx IF NOT EXISTS FOR (f:Function) ON EACH [f.docstring]",
+    "CREATE FULLTEXT INDEX class_docstring_idx IF NOT EXISTS FOR (c:Class) ON EACH [c.docstring]",
+    # Composite indexes for detector queries
+    "CREATE INDEX class_complexity_idx IF NOT EXISTS FOR (c:Class) ON (c.complexity, c.is_abstract)",
+    "CREATE INDEX function_complexity_idx IF NOT EXISTS FOR (f:Function) ON (f.complexity, f.is_async)",
+    "CREATE INDEX file_language_loc_idx IF NOT EXISTS FOR (f:File) ON (f.language, f.loc)",
+    # Composite indexes leveraging enhanced properties (FAL-91)
+    "CREATE INDEX file_language_test_idx IF NOT EXISTS FOR (f:File) ON (f.language, f.is_test)",
+    "CREATE INDEX file_test_module_idx IF NOT EXISTS FOR (f:File) ON (f.is_test, f.module_path)",
+    "CREATE INDEX function_method_static_idx IF NOT EXISTS FOR (f:Function) ON (f.is_method, f.is_static)",
+    "CREATE INDEX function_method_property_idx IF NOT EXISTS FOR (f:Function) ON (f.is_method, f.is_property)",
+    "CREATE INDEX class_dataclass_exception_idx IF NOT EXISTS FOR (c:Class) ON (c.is_dataclass, c.is_exception)",
+    "CREATE INDEX function_async_yield_idx IF NOT EXISTS FOR (f:Function) ON (f.is_async, f.has_yield)",
+    # Relationship property indexes for query performance
+    "CREATE INDEX imports_module_idx IF NOT EXISTS FOR ()-[r:IMPORTS]-() ON (r.module)",
+    "CREATE INDEX calls_line_number_idx IF NOT EXISTS FOR ()-[r:CALLS]-() ON (r.line_number)",
+    "CREATE INDEX inherits_order_idx IF NOT EXISTS FOR ()-[r:INHERITS]-() ON (r.order)",
+    # Enhanced node property indexes (FAL-90)
+    "CREATE INDEX file_is_test_idx IF NOT EXISTS FOR (f:File) ON (f.is_test)",
+    "CREATE INDEX file_module_path_idx IF NOT EXISTS FOR (f:File) ON (f.module_path)",
+    "CREATE INDEX class_is_dataclass_idx IF NOT EXISTS FOR (c:Class) ON (c.is_dataclass)",
+    "CREATE INDEX class_is_exception_idx IF NOT EXISTS FOR (c:Class) ON (c.is_exception)",
+    "CREATE INDEX class_nesting_level_idx IF NOT EXISTS FOR (c:Class) ON (c.nesting_level)",
+    "CREATE INDEX function_is_method_idx IF NOT EXISTS FOR (f:Function) ON (f.is_method)",
+    "CREATE INDEX function_is_static_idx IF NOT EXISTS FOR (f:Function) ON (f.is_static)",
+    "CREATE INDEX function_is_property_idx IF NOT EXISTS FOR (f:Function) ON (f.is_property)",
+    "CREATE INDEX function_has_return_idx IF NOT EXISTS FOR (f:Function) ON (f.has_return)",
+    "CREATE INDEX function_has_yield_idx IF NOT EXISTS FOR (f:Function) ON (f.has_yield)",
+)
+
+
+def _ddl_shape(statement: str) -> Tuple[str, bool, int, str]:
+    """Sort key clustering DDL of the same kind and shape together.
+
+    Groups by index type (range/fulltext), node vs relationship pattern and
+    number of properties, so statements that differ only in label, property
+    and name are submitted back to back.
+    """
+    kind = statement.split(" IF NOT EXISTS")[0].rsplit(" ", 1)[0]
+    properties = statement.rsplit(" ON ", 1)[-1]
+    return (kind, "()-[" in statement, properties.count(",") + 1, statement)
+
+
+# Submission order: sorted by shape, so do not rely on _INDEX_DEFINITIONS order
+_INDEXES: Tuple[str, ...] = tuple(sorted(_INDEX_DEFINITIONS, key=_ddl_shape))
+
+# Vector indexes for RAG (Neo4j 5.18+)
+_VECTOR_INDEXES: Tuple[str, ...] = (
+    # Function embeddings for semantic code search
+    """
+    CREATE VECTOR INDEX function_embeddings IF NOT EXISTS
+    FOR (f:Function)
+    ON f.embedding
+    OPTIONS {
+        indexConfig: {
+            `vector.dimensions`: 1536,
+            `vector.similarity_function`: 'cosine'
         }
-        """,
-        # Class embeddings for semantic search
-        """
-        CREATE VECTOR INDEX class_embeddings IF NOT EXISTS
-        FOR (c:Class)
-        ON c.embedding
-        OPTIONS {
-            indexConfig: {
-                `vector.dimensions`: 1536,
-                `vector.similarity_function`: 'cosine'
-            }
+    }
+    """,
+    # Class embeddings for semantic search
+    """
+    CREATE VECTOR INDEX class_embeddings IF NOT EXISTS
+    FOR (c:Class)
+    ON c.embedding
+    OPTIONS {
+        indexConfig: {
+            `vector.dimensions`: 1536,
+            `vector.similarity_function`: 'cosine'
         }
-        """,
-        # File embeddings for document-level search
-        """
-        CREATE VECTOR INDEX file_embeddings IF NOT EXISTS
-        FOR (f:File)
-        ON f.embedding
-        OPTIONS {
-            indexConfig: {
-                `vector.dimensions`: 1536,
-                `vector.similarity_function`: 'cosine'
-            }
+    }
+    """,
+    # File embeddings for document-level search
+    """
+    CREATE VECTOR INDEX file_embeddings IF NOT EXISTS
+    FOR (f:File)
+    ON f.embedding
+    OPTIONS {
+        indexConfig: {
+            `vector.dimensions`: 1536,
+            `vector.similarity_function`: 'cosine'
         }
-        """,
-    ]
+    }
+    """,
+)
+
+
+class GraphSchema:
+    """Manages graph schema creation and constraints."""
+
+    # Immutable DDL shared by all instances (module-level tuples)
+    CONSTRAINTS = _CONSTRAINTS
+    INDEXES = _INDEXES
+    VECTOR_INDEXES = _VECTOR_INDEXES
 
     def __init__(self, client: Neo4jClient):
         """Initialize schema manager.
@@ -111,21 +176,46 @@ class GraphSchema:
         """
         self.client = client
 
+    def _apply_ddl(self, statements: Sequence[str], kind: str) -> bool:
+        """Run DDL statements in one transaction, falling back to one at a time.
+
+        The batch commits once, so either all statements apply or none do. If it
+        fails (e.g. one index type is unsupported by the server), each statement
+        is retried on its own, over one session, so the rest of the schema
+        still gets created.
+
+        Args:
+            statements: DDL statements (all idempotent via IF NOT EXISTS)
+            kind: Description used in warnings
+
+        Returns:
+            True if every statement was applied
+        """
+        try:
+            self.client.execute_write_batch(statements)
+            return True
+        except Exception as e:
+            logger.warning("Batched %s creation failed, retrying individually: %s", kind, e)
+
+        applied = True
+        for error in self.client.execute_each(statements):
+            if error is not None:
+                applied = False
+                logger.warning("Could not create %s: %s", kind, error)
+        return applied
+
     def create_constraints(self) -> None:
         """Create all uniqueness constraints."""
-        for constraint in self.CONSTRAINTS:
-            try:
-                self.client.execute_query(constraint)
-            except Exception as e:
-                print(f"Warning: Could not create constraint: {e}")
+        self._apply_ddl(self.CONSTRAINTS, "constraint")
 
     def create_indexes(self) -> None:
-        """Create all indexes."""
-        for index in self.INDEXES:
-            try:
-                self.client.execute_query(index)
-            except Exception as e:
-                print(f"Warning: Could not create index: {e}")
+        """Create all indexes.
+
+        CREATE INDEX returns once the index is registered; Neo4j populates
+        new indexes in the background, concurrently with each other, so
+        submitting them in one batch already lets the builds run in parallel.
+        """
+        self._apply_ddl(self.INDEXES, "index")
 
     def create_vector_indexes(self) -> None:
         """Create vector indexes for RAG semantic search.
@@ -133,66 +223,83 @@ class GraphSchema:
         Requires Neo4j 5.18+ with vector index support.
         Silently skips if Neo4j version doesn't support vector indexes.
         """
-        for vector_index in self.VECTOR_INDEXES:
-            try:
-                self.client.execute_query(vector_index)
-            except Exception as e:
+        try:
+            self.client.execute_write_batch(self.VECTOR_INDEXES)
+            return
+        except Exception:
+            pass  # Report per index below
+
+        for error in self.client.execute_each(self.VECTOR_INDEXES):
+            if error is not None:
                 # Vector indexes may not be supported in older Neo4j versions
-                print(f"Info: Could not create vector index (requires Neo4j 5.18+): {e}")
+                logger.info("Could not create vector index (requires Neo4j 5.18+): %s", error)
 
-    def initialize(self, enable_vector_search: bool = False) -> None:
+    def initialize(self, enable_vector_search: bool = False, force: bool = False) -> None:
         """Initialize complete schema.
 
+        Once every constraint and index has been applied, a hash of the DDL is
+        stored on a sentinel node; later calls with unchanged DDL skip straight
+        past it after a single lookup.
+
         Args:
             enable_vector_search: Whether to create vector indexes for RAG (requires Neo4j 5.18+)
+            force: Re-apply the DDL even if the stored hash matches
         """
-        print("Creating graph schema...")
-        self.create_constraints()
-        self.create_indexes()
+        statements = self.CONSTRAINTS + self.INDEXES
+        schema_hash = hashlib.sha256("\n".join(statements).encode()).hexdigest()
+
+        stored = None if force else self.client.execute_query(_SCHEMA_MARKER_QUERY)
+        if stored and stored[0]["hash"] == schema_hash:
+            logger.info("Graph schema is up to date")
+            self._initialize_vector_indexes(enable_vector_search)
+            return
+
+        logger.info("Creating graph schema...")
+        # Constraints first so their backing indexes exist before plain indexes
+        applied = self._apply_ddl(statements, "constraint/index")
+        if applied:
+            self.client.execute_query(
+                _SCHEMA_MARKER_SET, parameters={"hash": schema_hash}
+            )
 
+        self._initialize_vector_indexes(enable_vector_search)
+
+        if applied:
+            logger.info("Schema created successfully")
+        else:
+            logger.warning("Schema created partially; initialize() will retry the DDL")
+
+    def _initialize_vector_indexes(self, enable_vector_search: bool) -> None:
+        """Create vector indexes if requested (not covered by the schema hash)."""
         if enable_vector_search:
-            print("Creating vector indexes for RAG...")
+            logger.info("Creating vector indexes for RAG...")
             self.create_vector_indexes()
 
-        print("Schema created successfully!")
-
     def drop_all(self) -> None:
         """Drop all constraints and indexes. Use with caution!"""
-        import re
+        # Collect everything first, then drop in one batch
+        constraints = self.client.execute_query(_SHOW_CONSTRAINTS_QUERY)
+        indexes = self.client.execute_query(
+            _SHOW_INDEXES_QUERY, parameters={"builtin": list(_BUILTIN_INDEXES)}
+        )
 
-        # Validate name is safe (alphanumeric, underscore, hyphen only)
-        def is_safe_name(name: str) -> bool:
-            return bool(re.match(r'^[a-zA-Z0-9_-]+$', name))
+        statements = []
+        for kind, records in (("CONSTRAINT", constraints), ("INDEX", indexes)):
+            for record in records:
+                statements.append(f"DROP {kind} {_quote_name(record['name'])}")
 
-        # Drop all constraints
-        drop_constraints_query = """
-        SHOW CONSTRAINTS
-        YIELD name
-        RETURN name
-        """
-        constraints = self.client.execute_query(drop_constraints_query)
-        for record in constraints:
-            name = record["name"]
-            if is_safe_name(name):
-                # Safe to use f-string since we validated the name
-                self.client.execute_query(f"DROP CONSTRAINT {name}")
-            else:
-                print(f"Warning: Skipping constraint with unsafe name: {name}")
-
-        # Drop all indexes
-        drop_indexes_query = """
-        SHOW INDEXES
-        YIELD name
-        WHERE name <> 'node_label_index' AND name <> 'relationship_type_index'
-        RETURN name
-        """
-        indexes = self.client.execute_query(drop_indexes_query)
-        for record in indexes:
-            name = record["name"]
-            if is_safe_name(name):
-                # Safe to use f-string since we validated the name
-                self.client.execute_query(f"DROP INDEX {name}")
-            else:
-                print(f"Warning: Skipping index with unsafe name: {name}")
-
-        print("Schema dropped!")
+        # All drops in one transaction; statement by statement if that fails
+        if statements:
+            try:
+                self.client.execute_write_batch(statements)
+            except Exception as e:
+                logger.warning("Batched drop failed, retrying individually: %s", e)
+                errors = self.client.execute_each(statements)
+                for statement, error in zip(statements, errors):
+                    if error is not None:
+                        logger.warning("Could not run %s: %s", statement, error)
+
+        # Force the next initialize() to re-create everything
+        self.client.execute_query(_SCHEMA_MARKER_DELETE)
+
+        logger.info("Schema dropped")
@@ -147,7 +147,7 @@ class SecretsPolicy(str, Enum):
     FAIL = "fail"
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Base entity extracted from code.
 
@@ -187,7 +187,7 @@ class Entity:
     embedding: Optional[List[float]] = None  # Vector embedding for RAG (1536-dim for OpenAI)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEntity(Entity):
     """Source file node in the knowledge graph.
 
@@ -197,7 +197,7 @@ class FileEntity(Entity):
     Attributes:
         language: Programming language (e.g., "python", "javascript")
         loc: Lines of code (non-blank, non-comment)
-        hash: MD5 hash of file contents for change detection
+        hash: Content fingerprint (see hash_file_content) for change detection
         last_modified: Last modification timestamp for incremental ingestion
         exports: List of symbols exported via __all__ or similar
         module_path: Python module path (e.g., "falkor.parsers.python_parser")
@@ -231,7 +231,7 @@ class FileEntity(Entity):
         self.node_type = NodeType.FILE
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleEntity(Entity):
     """Module or package node representing an import target.
 
@@ -262,7 +262,7 @@ class ModuleEntity(Entity):
         self.node_type = NodeType.MODULE
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassEntity(Entity):
     """Class definition node.
 
@@ -303,7 +303,7 @@ class ClassEntity(Entity):
         self.node_type = NodeType.CLASS
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionEntity(Entity):
     """Function or method definition node.
 
@@ -362,7 +362,7 @@ class FunctionEntity(Entity):
         self.node_type = NodeType.FUNCTION
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableEntity(Entity):
     """Local variable or function parameter node.
 
@@ -387,7 +387,7 @@ class VariableEntity(Entity):
         self.node_type = NodeType.VARIABLE
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeEntity(Entity):
     """Class or instance attribute node.
 
@@ -415,7 +415,7 @@ class AttributeEntity(Entity):
         self.node_type = NodeType.ATTRIBUTE
 
 
-@dataclass
+@dataclass(slots=True)
 class ClueEntity(Entity):
     """AI-generated semantic summary or insight about code.
 
@@ -466,7 +466,7 @@ class ClueEntity(Entity):
             self.generated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEntity(Entity):
     """Git commit snapshot representing code at a specific point in time.
 
@@ -705,7 +705,7 @@ class SecretMatch:
     plugin_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """Directed relationship between two entities in the graph.
 
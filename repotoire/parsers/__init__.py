@@ -1,6 +1,6 @@
 """Code parsers for different programming languages."""
 
-from repotoire.parsers.base import CodeParser
+from repotoire.parsers.base import CodeParser, hash_file_content
 from repotoire.parsers.python_parser import PythonParser
 from repotoire.parsers.tree_sitter_adapter import UniversalASTNode, TreeSitterAdapter
 from repotoire.parsers.base_tree_sitter_parser import BaseTreeSitterParser
@@ -8,6 +8,7 @@ from repotoire.parsers.tree_sitter_python import TreeSitterPythonParser
 
 __all__ = [
     "CodeParser",
+    "hash_file_content",
     "PythonParser",
     "UniversalASTNode",
     "TreeSitterAdapter",
@@ -1,10 +1,36 @@
 """Base parser interface."""
 
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Any, List, Tuple
 
 from repotoire.models import Entity, Relationship
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+
+def hash_file_content(data: bytes) -> str:
+    """Fingerprint file contents for change detection.
+
+    Uses xxh3_128 when xxhash is installed and BLAKE2b (16-byte digest)
+    otherwise. The digest is prefixed with the algorithm ("xxh3:" or "b2:"),
+    so hashes stored by an install with the other algorithm never compare
+    equal by accident; they simply mismatch and the file is re-ingested.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        Algorithm-prefixed hex digest of the contents
+    """
+    if HAS_XXHASH:
+        return "xxh3:" + xxhash.xxh3_128_hexdigest(data)
+    return "b2:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 class CodeParser(ABC):
     """Abstract base class for language-specific code parsers."""
@@ -63,3 +89,22 @@ class CodeParser(ABC):
         entities = self.extract_entities(ast, file_path)
         relationships = self.extract_relationships(ast, file_path, entities)
         return entities, relationships
+
+    def process_source(
+        self, file_path: str, source: bytes, content_hash: str
+    ) -> Tuple[List[Entity], List[Relationship]]:
+        """Process a file whose contents the caller has already read and hashed.
+
+        Parsers that can work from the given bytes and hash_file_content()
+        digest override this to skip reading and hashing the file again; the
+        default simply calls process_file().
+
+        Args:
+            file_path: Path to source file
+            source: Raw file contents
+            content_hash: hash_file_content(source)
+
+        Returns:
+            Tuple of (entities, relationships)
+        """
+        return self.process_file(file_path)
@@ -7,9 +7,8 @@ all programming languages supported by tree-sitter.
 from typing import List, Optional, Dict
 from pathlib import Path
 from datetime import datetime
-import hashlib
 
-from repotoire.parsers.base import CodeParser
+from repotoire.parsers.base import CodeParser, hash_file_content
 from repotoire.parsers.tree_sitter_adapter import UniversalASTNode, TreeSitterAdapter
 from repotoire.models import (
     Entity,
@@ -250,13 +249,14 @@ class BaseTreeSitterParser(CodeParser):
         Returns:
             FileEntity with metadata
         """
-        # Calculate file hash
         with open(file_path, 'rb') as f:
-            file_hash = hashlib.md5(f.read()).hexdigest()
+            source = f.read()
+
+        # Calculate file hash
+        file_hash = hash_file_content(source)
 
         # Count lines
-        with open(file_path, 'r') as f:
-            lines_of_code = len([line for line in f if line.strip()])
+        lines_of_code = sum(1 for line in source.splitlines() if line.strip())
 
         # Get file modification time
         file_stats = Path(file_path).stat()
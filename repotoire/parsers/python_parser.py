@@ -1,11 +1,11 @@
 """Python code parser using AST module."""
 
 import ast
+import inspect
 from pathlib import Path
-from typing import List, Dict, Optional
-import hashlib
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
-from repotoire.parsers.base import CodeParser
+from repotoire.parsers.base import CodeParser, hash_file_content
 from repotoire.models import (
     Entity,
     FileEntity,
@@ -22,6 +22,230 @@ from repotoire.security import SecretsScanner
 from repotoire.security.secrets_scanner import apply_secrets_policy
 
 
+# Node types that add one decision point to cyclomatic complexity, as a
+# tuple so a single isinstance() call checks them all.
+# ast.BoolOp is handled separately: it adds one per boolean operator.
+_DECISION_TYPES = (
+    ast.If,
+    ast.While,
+    ast.For,
+    ast.ExceptHandler,
+    ast.With,
+    ast.Assert,
+)
+
+
+def _decision_points(node: ast.AST) -> int:
+    """Return the decision points a single node contributes.
+
+    Args:
+        node: AST node
+
+    Returns:
+        1 for branching statements, one per operator for boolean
+        expressions (``a and b or c`` -> 2), otherwise 0
+    """
+    if isinstance(node, _DECISION_TYPES):
+        return 1
+    if isinstance(node, ast.BoolOp):
+        return len(node.values) - 1
+    return 0
+
+# Nodes whose complexity is reported on an entity
+_SCOPE_TYPES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Function definition node types; isinstance() also narrows them for mypy
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _fast_docstring(
+    node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
+) -> Optional[str]:
+    """Return the cleaned docstring of a class or function node.
+
+    Same result as ``ast.get_docstring(node)`` without its type checks on
+    the common path; single-line docstrings skip ``inspect.cleandoc``,
+    which reduces to ``lstrip()`` for them.
+
+    Args:
+        node: ClassDef, FunctionDef or AsyncFunctionDef node
+
+    Returns:
+        Docstring or None
+    """
+    body = node.body
+    if not body or not isinstance(body[0], ast.Expr):
+        return None
+
+    value = body[0].value
+    if not isinstance(value, ast.Constant) or not isinstance(value.value, str):
+        return None
+
+    text = value.value
+    if "\n" not in text and "\t" not in text:
+        return text.lstrip()
+    return inspect.cleandoc(text)
+
+
+def _fast_annotation(node: ast.expr) -> str:
+    """Render a type annotation as source text.
+
+    Builds the string directly for the common shapes (names, dotted names,
+    ``None``, subscripts and ``X | Y`` unions of those) and falls back to
+    ``ast.unparse`` for anything else. The result always equals
+    ``ast.unparse(node)``.
+
+    Args:
+        node: Annotation expression
+
+    Returns:
+        Annotation source text
+    """
+    text = _simple_annotation(node)
+    return text if text is not None else ast.unparse(node)
+
+
+def _simple_annotation(node: ast.expr) -> Optional[str]:
+    """Render the annotation shapes _fast_annotation handles, else None."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        if not isinstance(node.value, (ast.Name, ast.Attribute)):
+            return None
+        value = _simple_annotation(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    if isinstance(node, ast.Constant):
+        return "None" if node.value is None else None
+    if isinstance(node, ast.Subscript):
+        if not isinstance(node.value, (ast.Name, ast.Attribute)):
+            return None
+        value = _simple_annotation(node.value)
+        index = node.slice
+        index_text: Optional[str]
+        if isinstance(index, ast.Tuple):
+            if len(index.elts) < 2:
+                return None
+            parts = [_simple_annotation(elt) for elt in index.elts]
+            if None in parts:
+                return None
+            index_text = ", ".join(cast(List[str], parts))
+        else:
+            index_text = _simple_annotation(index)
+        if value is None or index_text is None:
+            return None
+        return f"{value}[{index_text}]"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        # Right-nested unions need parentheses; leave those to ast.unparse
+        if isinstance(node.right, ast.BinOp):
+            return None
+        left = _simple_annotation(node.left)
+        right = _simple_annotation(node.right)
+        if left is None or right is None:
+            return None
+        return f"{left} | {right}"
+    return None
+
+
+# Decorators that mark a function as a property accessor
+_PROPERTY_DECORATORS = frozenset(
+    {"property", "property.setter", "property.deleter", "property.getter"}
+)
+
+
+def _signature(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> Tuple[List[str], Dict[str, str], Optional[str]]:
+    """Collect a function's positional parameters and annotations in one pass.
+
+    Args:
+        node: Function definition node
+
+    Returns:
+        Tuple of (parameter names, parameter name -> annotation, return annotation)
+    """
+    parameters: List[str] = []
+    parameter_types: Dict[str, str] = {}
+    for arg in node.args.args:
+        parameters.append(arg.arg)
+        if arg.annotation:
+            parameter_types[arg.arg] = _fast_annotation(arg.annotation)
+
+    return_type = _fast_annotation(node.returns) if node.returns else None
+    return parameters, parameter_types, return_type
+
+
+def _walk(node: ast.AST) -> List[ast.AST]:
+    """Return every node under ``node`` in ``ast.walk`` (breadth-first) order.
+
+    Extends a list while iterating it instead of going through ast.walk's
+    generator and deque, which is cheaper per node.
+
+    Args:
+        node: Root AST node
+
+    Returns:
+        List of nodes, starting with ``node``
+    """
+    iter_children = ast.iter_child_nodes
+    nodes = [node]
+    for current in nodes:
+        nodes.extend(iter_children(current))
+    return nodes
+
+
+def _count_decisions(tree: ast.AST) -> Dict[int, int]:
+    """Count decision points under every class and function in one pass.
+
+    Walks the tree once in post-order, adding each subtree's count to its
+    parent, so nested definitions are not re-walked for every ancestor.
+
+    Args:
+        tree: Python AST
+
+    Returns:
+        Map of id(ClassDef/FunctionDef node) to decision points in its subtree
+    """
+    iter_children = ast.iter_child_nodes
+    counts: Dict[int, int] = {}
+
+    # Frames are [node, child iterator, decisions so far]
+    stack: List[List[Any]] = [[tree, iter_children(tree), 0]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[1], None)
+        if child is not None:
+            stack.append([child, iter_children(child), _decision_points(child)])
+            continue
+
+        stack.pop()
+        node, _, total = frame
+        if isinstance(node, _SCOPE_TYPES):
+            counts[id(node)] = total
+        if stack:
+            stack[-1][2] += total
+
+    return counts
+
+
+_Function = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+_Definition = Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+class _TreeIndex(NamedTuple):
+    """Nodes bucketed from a single walk over a module AST.
+
+    Lists preserve ``ast.walk`` (breadth-first) order so extraction output
+    is identical to walking the tree separately for each node type.
+    """
+
+    definitions: List[_Definition]  # ClassDefs anywhere plus module-level functions
+    classes: List[ast.ClassDef]
+    functions: List[_Function]  # Every FunctionDef/AsyncFunctionDef
+    calls: List[ast.Call]
+    decision_counts: Dict[int, int]  # id(class/function node) -> decision points
+    self_attributes: Dict[int, Set[str]]  # id(method) -> self.x names, filled lazily
+
+
 class PythonParser(CodeParser):
     """Parser for Python source files."""
 
@@ -35,6 +259,9 @@ class PythonParser(CodeParser):
         self.entity_map: Dict[str, str] = {}  # qualified_name -> entity_id
         self.secrets_policy = secrets_policy
         self.secrets_scanner = SecretsScanner() if secrets_policy != SecretsPolicy.WARN else None
+        self._tree_index: Optional[Tuple[ast.AST, _TreeIndex]] = None
+        # (file_path, raw bytes, content hash or None) from parse()/process_source()
+        self._source: Optional[Tuple[str, bytes, Optional[str]]] = None
 
     def parse(self, file_path: str) -> ast.AST:
         """Parse Python file into AST.
@@ -45,9 +272,48 @@ class PythonParser(CodeParser):
         Returns:
             Python AST
         """
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open(file_path, "rb") as f:
             source = f.read()
-            return ast.parse(source, filename=file_path)
+
+        # Keep the raw bytes so the file entity can hash and count them
+        # without reading the file again
+        self._source = (file_path, source, None)
+        return ast.parse(source, filename=file_path)
+
+    def process_source(
+        self, file_path: str, source: bytes, content_hash: str
+    ) -> Tuple[List[Entity], List[Relationship]]:
+        """Process already-read file contents, reusing the caller's hash.
+
+        Args:
+            file_path: Path to source file
+            source: Raw file contents
+            content_hash: hash_file_content(source)
+
+        Returns:
+            Tuple of (entities, relationships)
+        """
+        tree = ast.parse(source, filename=file_path)
+        self._source = (file_path, source, content_hash)
+        entities = self.extract_entities(tree, file_path)
+        relationships = self.extract_relationships(tree, file_path, entities)
+        return entities, relationships
+
+    def _read_source(self, file_path: str) -> Tuple[bytes, Optional[str]]:
+        """Return the raw bytes of a file, reusing the read done by parse().
+
+        Args:
+            file_path: Path to source file
+
+        Returns:
+            Tuple of (file contents, content hash if the caller supplied one)
+        """
+        cached, self._source = self._source, None
+        if cached is not None and cached[0] == file_path:
+            return cached[1], cached[2]
+
+        with open(file_path, "rb") as f:
+            return f.read(), None
 
     def _scan_and_redact_text(self, text: Optional[str], context: str, line_number: int) -> Optional[str]:
         """Scan text for secrets and apply policy.
@@ -77,6 +343,49 @@ class PythonParser(CodeParser):
         # Apply policy
         return apply_secrets_policy(scan_result, self.secrets_policy, context)
 
+    def _index_tree(self, tree: ast.AST) -> _TreeIndex:
+        """Bucket the nodes entity and relationship extraction need.
+
+        The tree is walked once and the result is reused by every extractor,
+        including ``extract_relationships`` on the same tree.
+
+        Args:
+            tree: Python AST
+
+        Returns:
+            _TreeIndex for the tree
+        """
+        if self._tree_index is not None and self._tree_index[0] is tree:
+            return self._tree_index[1]
+
+        top_level = {id(node) for node in getattr(tree, "body", ())}
+        definitions: List[_Definition] = []
+        classes: List[ast.ClassDef] = []
+        functions: List[_Function] = []
+        calls: List[ast.Call] = []
+
+        for node in _walk(tree):
+            if isinstance(node, ast.Call):
+                calls.append(node)
+            elif isinstance(node, ast.ClassDef):
+                classes.append(node)
+                definitions.append(node)
+            elif isinstance(node, _FUNCTION_TYPES):
+                functions.append(node)
+                if id(node) in top_level:
+                    definitions.append(node)
+
+        index = _TreeIndex(
+            definitions=definitions,
+            classes=classes,
+            functions=functions,
+            calls=calls,
+            decision_counts=_count_decisions(tree),
+            self_attributes={},
+        )
+        self._tree_index = (tree, index)
+        return index
+
     def extract_entities(self, tree: ast.AST, file_path: str) -> List[Entity]:
         """Extract entities from Python AST.
 
@@ -95,7 +404,7 @@ class PythonParser(CodeParser):
         self.file_entity = file_entity
 
         # Extract classes and functions
-        for node in ast.walk(tree):
+        for node in self._index_tree(tree).definitions:
             if isinstance(node, ast.ClassDef):
                 class_entity = self._extract_class(node, file_path)
                 entities.append(class_entity)
@@ -103,7 +412,7 @@ class PythonParser(CodeParser):
                 # Extract methods from class - pass class qualified name with line number
                 class_qualified_name = f"{node.name}:{node.lineno}"
                 for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    if isinstance(item, _FUNCTION_TYPES):
                         method_entity = self._extract_function(
                             item, file_path, class_name=class_qualified_name
                         )
@@ -115,17 +424,16 @@ class PythonParser(CodeParser):
                         )
                         entities.extend(nested_funcs)
 
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Only top-level functions (not methods)
-                if self._is_top_level(node, tree):
-                    func_entity = self._extract_function(node, file_path)
-                    entities.append(func_entity)
+            else:
+                # Only top-level functions (not methods) are indexed
+                func_entity = self._extract_function(node, file_path)
+                entities.append(func_entity)
 
-                    # Extract nested functions within top-level functions
-                    nested_funcs = self._extract_nested_functions(
-                        node, file_path, parent_qualified=func_entity.qualified_name
-                    )
-                    entities.extend(nested_funcs)
+                # Extract nested functions within top-level functions
+                nested_funcs = self._extract_nested_functions(
+                    node, file_path, parent_qualified=func_entity.qualified_name
+                )
+                entities.extend(nested_funcs)
 
         # Extract module entities from imports
         module_entities = self._extract_modules(tree, file_path)
@@ -155,6 +463,11 @@ class PythonParser(CodeParser):
         # Build entity lookup map
         entity_map = {e.qualified_name: e for e in entities}
 
+        # First entity per name, so imported names resolve without a scan
+        entity_by_name: Dict[str, str] = {}
+        for qname, entity in entity_map.items():
+            entity_by_name.setdefault(entity.name, qname)
+
         # Extract imports (only module-level, not nested in functions/classes)
         file_entity_name = file_path  # Use file path as qualified name for File node
 
@@ -186,13 +499,8 @@ class PythonParser(CodeParser):
                     imported_name = alias.name
 
                     # Try to resolve to actual entity
-                    target_qualified_name = None
-
                     # Strategy 1: Check if entity is in current file
-                    for entity_qname, entity in entity_map.items():
-                        if entity.name == imported_name:
-                            target_qualified_name = entity_qname
-                            break
+                    target_qualified_name = entity_by_name.get(imported_name)
 
                     # Strategy 2: For cross-file imports, store both the import-style name
                     # and mark it for later resolution. The pipeline will need to fix these up.
@@ -237,39 +545,34 @@ class PythonParser(CodeParser):
         # Extract DECORATES relationships (decorators applied to functions)
         self._extract_decorates(tree, file_path, entity_map, relationships)
 
-        # Create CONTAINS relationships (hierarchical: file→top-level, class→members)
+        # Create CONTAINS relationships (hierarchical: file→top-level, class→members).
+        # One type() lookup per entity decides both the file skip and the parent.
         file_qualified_name = file_path
+        contains_type = RelationshipType.CONTAINS
         for entity in entities:
-            if entity.node_type == NodeType.FILE:
+            entity_type = type(entity)
+            if entity_type is FileEntity:
                 continue  # Skip the file itself
 
             # Determine parent from entity type and qualified name structure
-            parent_qname = None
-
-            if isinstance(entity, FunctionEntity) and entity.is_method:
-                # Method: parent is the class
+            if entity_type is AttributeEntity or (
+                entity_type is FunctionEntity and cast(FunctionEntity, entity).is_method
+            ):
+                # Method or class attribute: parent is the class
                 # qualified_name format: "file.py::ClassName:line.method_name:line"
-                # Extract parent by splitting on last '.' and handling line number suffix
-                if '.' in entity.qualified_name:
-                    parent_qname = entity.qualified_name.rsplit('.', 1)[0]
-
-            elif isinstance(entity, AttributeEntity):
-                # Class attribute: parent is the class
-                # Similar format: "file.py::ClassName:line.attribute_name"
-                if '.' in entity.qualified_name:
-                    parent_qname = entity.qualified_name.rsplit('.', 1)[0]
-
+                # or "file.py::ClassName:line.attribute_name"
+                parent_qname, dot, _ = entity.qualified_name.rpartition(".")
+                if not dot:
+                    continue
+            elif entity.node_type == NodeType.FILE:
+                continue  # File entity from another parser or a subclass
             else:
                 # Top-level entity (class, module, top-level function)
                 parent_qname = file_qualified_name
 
             if parent_qname:
                 relationships.append(
-                    Relationship(
-                        source_id=parent_qname,
-                        target_id=entity.qualified_name,
-                        rel_type=RelationshipType.CONTAINS,
-                    )
+                    Relationship(parent_qname, entity.qualified_name, contains_type)
                 )
 
         return relationships
@@ -286,13 +589,14 @@ class PythonParser(CodeParser):
         """
         path_obj = Path(file_path)
 
-        # Calculate file hash
-        with open(file_path, "rb") as f:
-            file_hash = hashlib.md5(f.read()).hexdigest()
+        source, file_hash = self._read_source(file_path)
+
+        # Calculate file hash unless the caller already did
+        if file_hash is None:
+            file_hash = hash_file_content(source)
 
         # Count lines of code
-        with open(file_path, "r") as f:
-            loc = len([line for line in f if line.strip()])
+        loc = sum(1 for line in source.splitlines() if line.strip())
 
         # Extract __all__ exports
         exports = self._extract_exports(tree)
@@ -351,7 +655,7 @@ class PythonParser(CodeParser):
         """
         # Include line number to handle nested classes with same name
         qualified_name = f"{file_path}::{node.name}:{node.lineno}"
-        docstring = ast.get_docstring(node)
+        docstring = _fast_docstring(node)
 
         # Scan docstring for secrets
         if docstring:
@@ -420,43 +724,26 @@ class PythonParser(CodeParser):
                     decorators.append("unknown_decorator")
 
         # Build qualified name with line number to ensure uniqueness
+        # (handles same-name functions/methods) in a single format.
         # Format: file::class.function@decorator:line
         if class_name:
-            base_name = f"{file_path}::{class_name}.{node.name}"
-        else:
-            base_name = f"{file_path}::{node.name}"
-
-        # Add decorator suffix if present
-        if decorator_suffix:
-            qualified_name = f"{base_name}{decorator_suffix}:{node.lineno}"
+            qualified_name = f"{file_path}::{class_name}.{node.name}{decorator_suffix}:{node.lineno}"
         else:
-            # Add line number to handle same-name functions/methods
-            qualified_name = f"{base_name}:{node.lineno}"
+            qualified_name = f"{file_path}::{node.name}{decorator_suffix}:{node.lineno}"
 
-        docstring = ast.get_docstring(node)
+        docstring = _fast_docstring(node)
 
         # Scan docstring for secrets
         if docstring:
             docstring = self._scan_and_redact_text(docstring, file_path, node.lineno)
 
-        # Extract parameters
-        parameters = [arg.arg for arg in node.args.args]
-
-        # Extract parameter type annotations
-        parameter_types = {}
-        for arg in node.args.args:
-            if arg.annotation:
-                parameter_types[arg.arg] = ast.unparse(arg.annotation)
-
-        # Extract return type if annotated
-        return_type = None
-        if node.returns:
-            return_type = ast.unparse(node.returns)
+        # Extract parameters, their type annotations and the return type
+        parameters, parameter_types, return_type = _signature(node)
 
         # Determine decorator flags
         is_static = "staticmethod" in decorators
         is_classmethod = "classmethod" in decorators
-        is_property = any(d in decorators for d in ["property", "property.setter", "property.deleter", "property.getter"])
+        is_property = not _PROPERTY_DECORATORS.isdisjoint(decorators)
 
         return FunctionEntity(
             name=node.name,
@@ -494,32 +781,21 @@ class PythonParser(CodeParser):
 
         # Walk through the function body to find nested functions
         for node in parent_node.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if isinstance(node, _FUNCTION_TYPES):
                 # This is a nested function - extract it
                 # Build qualified name with parent prefix: "parent_qname.nested_name:line"
                 # Example: "file.py::log_operation:203" + ".wrapper:248" = "file.py::log_operation:203.wrapper:248"
                 # This format allows CONTAINS logic to extract parent automatically
                 qualified_name = f"{parent_qualified}.{node.name}:{node.lineno}"
 
-                docstring = ast.get_docstring(node)
+                docstring = _fast_docstring(node)
 
                 # Scan docstring for secrets
                 if docstring:
                     docstring = self._scan_and_redact_text(docstring, file_path, node.lineno)
 
-                # Extract parameters
-                parameters = [arg.arg for arg in node.args.args]
-
-                # Extract parameter type annotations
-                parameter_types = {}
-                for arg in node.args.args:
-                    if arg.annotation:
-                        parameter_types[arg.arg] = ast.unparse(arg.annotation)
-
-                # Extract return type if annotated
-                return_type = None
-                if node.returns:
-                    return_type = ast.unparse(node.returns)
+                # Extract parameters, their type annotations and the return type
+                parameters, parameter_types, return_type = _signature(node)
 
                 # Extract decorators
                 decorators = [self._get_decorator_name(dec) for dec in node.decorator_list]
@@ -527,7 +803,7 @@ class PythonParser(CodeParser):
                 # Determine decorator flags
                 is_static = "staticmethod" in decorators
                 is_classmethod = "classmethod" in decorators
-                is_property = any(d in decorators for d in ["property", "property.setter", "property.deleter", "property.getter"])
+                is_property = not _PROPERTY_DECORATORS.isdisjoint(decorators)
 
                 nested_func = FunctionEntity(
                     name=node.name,
@@ -565,28 +841,14 @@ class PythonParser(CodeParser):
         Returns:
             Complexity score
         """
-        complexity = 1  # Base complexity
-
-        for child in ast.walk(node):
-            # Each decision point adds 1 to complexity
-            if isinstance(
-                child,
-                (
-                    ast.If,
-                    ast.While,
-                    ast.For,
-                    ast.ExceptHandler,
-                    ast.With,
-                    ast.Assert,
-                    ast.BoolOp,
-                ),
-            ):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                # Each boolean operator adds complexity
-                complexity += len(child.values) - 1
+        # Classes and functions of the indexed tree were counted in one pass
+        if self._tree_index is not None:
+            decisions = self._tree_index[1].decision_counts.get(id(node))
+            if decisions is not None:
+                return 1 + decisions
 
-        return complexity
+        # Base complexity plus each decision point
+        return 1 + sum(_decision_points(child) for child in _walk(node))
 
     def _is_top_level(self, node: ast.FunctionDef | ast.AsyncFunctionDef, tree: ast.AST) -> bool:
         """Check if function is top-level (not a method).
@@ -603,7 +865,7 @@ class PythonParser(CodeParser):
             return node in tree.body
         return False
 
-    def _get_docstring(self, node: ast.AST) -> Optional[str]:
+    def _get_docstring(self, node: _Definition) -> Optional[str]:
         """Extract docstring from AST node.
 
         Args:
@@ -612,7 +874,7 @@ class PythonParser(CodeParser):
         Returns:
             Docstring or None
         """
-        return ast.get_docstring(node)
+        return _fast_docstring(node)
 
     def _extract_calls(
         self,
@@ -635,9 +897,11 @@ class PythonParser(CodeParser):
 
             def __init__(self, file_path: str):
                 self.file_path = file_path
+                self.prefix = file_path + "::"
                 self.current_class: Optional[str] = None
                 self.current_class_line: Optional[int] = None
                 self.function_stack: List[tuple[str, int]] = []  # Stack for nested functions (name, line)
+                self.scope_name: Optional[str] = None  # Cached qualified name of the current scope
                 self.calls: List[tuple[str, str, int, bool]] = []  # (caller, callee, line, is_self_call)
                 self.uses: List[tuple[str, str, int]] = []  # (user, used_function, line) for function references
 
@@ -647,39 +911,47 @@ class PythonParser(CodeParser):
                 old_class_line = self.current_class_line
                 self.current_class = node.name
                 self.current_class_line = node.lineno
+                self.scope_name = None
                 self.generic_visit(node)
                 self.current_class = old_class
                 self.current_class_line = old_class_line
+                self.scope_name = None
 
             def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
                 """Visit function definition."""
                 self.function_stack.append((node.name, node.lineno))
+                self.scope_name = None
                 self.generic_visit(node)
                 self.function_stack.pop()
+                self.scope_name = None
 
             def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
                 """Visit async function definition."""
                 self.function_stack.append((node.name, node.lineno))
+                self.scope_name = None
                 self.generic_visit(node)
                 self.function_stack.pop()
+                self.scope_name = None
 
-            def visit_Call(self, node: ast.Call) -> None:
-                """Visit function call."""
-                if self.function_stack:
+            def current_scope(self) -> str:
+                """Qualified name of the enclosing function, rebuilt only when the scope changes."""
+                if self.scope_name is None:
                     # Build function qualified name from stack with line numbers
                     # For nested functions, build full chain: parent.child:line
                     if self.current_class and self.current_class_line:
                         # Method (possibly nested): file.py::ClassName:line.method:line[.nested:line...]
-                        caller = f"{self.file_path}::{self.current_class}:{self.current_class_line}"
-                        for func_name, func_line in self.function_stack:
-                            caller += f".{func_name}:{func_line}"
+                        parts = [f"{self.current_class}:{self.current_class_line}"]
+                        parts.extend(f"{name}:{line}" for name, line in self.function_stack)
                     else:
                         # Top-level function (possibly nested): file.py::func:line[.nested:line...]
-                        first_func_name, first_func_line = self.function_stack[0]
-                        caller = f"{self.file_path}::{first_func_name}:{first_func_line}"
-                        # Add nested functions if any
-                        for func_name, func_line in self.function_stack[1:]:
-                            caller += f".{func_name}:{func_line}"
+                        parts = [f"{name}:{line}" for name, line in self.function_stack]
+                    self.scope_name = self.prefix + ".".join(parts)
+                return self.scope_name
+
+            def visit_Call(self, node: ast.Call) -> None:
+                """Visit function call."""
+                if self.function_stack:
+                    caller = self.current_scope()
 
                     # Determine callee name (best effort)
                     result = self._get_call_name(node)
@@ -710,16 +982,7 @@ class PythonParser(CodeParser):
             def visit_Return(self, node: ast.Return) -> None:
                 """Visit return statement - track functions being returned."""
                 if self.function_stack and node.value:
-                    # Build current function qualified name
-                    if self.current_class and self.current_class_line:
-                        user = f"{self.file_path}::{self.current_class}:{self.current_class_line}"
-                        for func_name, func_line in self.function_stack:
-                            user += f".{func_name}:{func_line}"
-                    else:
-                        first_func_name, first_func_line = self.function_stack[0]
-                        user = f"{self.file_path}::{first_func_name}:{first_func_line}"
-                        for func_name, func_line in self.function_stack[1:]:
-                            user += f".{func_name}:{func_line}"
+                    user = self.current_scope()
 
                     # Check if returning a function reference
                     if isinstance(node.value, ast.Name):
@@ -770,99 +1033,79 @@ class PythonParser(CodeParser):
         visitor = CallVisitor(file_path)
         visitor.visit(tree)
 
-        # Create CALLS relationships
-        for caller, callee, line, is_self_call in visitor.calls:
-            # Try to resolve callee to a qualified name in our entity map
-            callee_qualified = None
-
+        # Index entity_map once so every call resolves with dict lookups.
+        # setdefault keeps the first match in entity_map order.
+        first_by_name: Dict[str, str] = {}
+        class_by_name: Dict[str, str] = {}
+        function_by_name: Dict[str, str] = {}
+        local_function_by_name: Dict[str, str] = {}
+        class_methods: Dict[tuple[str, str], str] = {}  # ("ClassName:123", method) -> qname
+        for qname, entity in entity_map.items():
+            name = entity.name
+            first_by_name.setdefault(name, qname)
+            if entity.node_type == NodeType.CLASS:
+                class_by_name.setdefault(name, qname)
+            elif entity.node_type == NodeType.FUNCTION:
+                function_by_name.setdefault(name, qname)
+                if qname.startswith(file_path):
+                    local_function_by_name.setdefault(name, qname)
+
+            # "file.py::ClassName:123.method_name:456" -> ("ClassName:123", "method_name")
+            _, sep, member_path = qname.partition("::")
+            class_part, dot, rest = member_path.partition(".")
+            if sep and dot:
+                method_name, colon, _ = rest.partition(":")
+                if colon:
+                    class_methods.setdefault((class_part, method_name), qname)
+
+        def resolve_callee(caller: str, callee: str, is_self_call: bool) -> str:
+            """Resolve a call name to a qualified name in entity_map, else the name itself."""
             if is_self_call:
                 # For self.method() calls, resolve to the method in the current class
                 # Extract class from caller: "file.py::ClassName:123.method_name:456"
                 if "::" in caller and "." in caller:
                     # Get the part between :: and the first .
-                    parts = caller.split("::")
-                    if len(parts) > 1:
-                        class_part = parts[1].split(".")[0]  # "ClassName:123"
-                        # Look for method in this class
-                        method_pattern = f"::{class_part}.{callee}:"
-                        for qname in entity_map.keys():
-                            if method_pattern in qname:
-                                callee_qualified = qname
-                                break
-
-            if not callee_qualified:
-                # Try different matching strategies
-                # 1. Exact name match - prioritize classes for capitalized names
-                is_likely_class = callee and callee[0].isupper()
-
-                if is_likely_class:
-                    # First try to match a Class entity
-                    for qname, entity in entity_map.items():
-                        if entity.node_type == NodeType.CLASS and entity.name == callee:
-                            callee_qualified = qname
-                            break
-
-                if not callee_qualified:
-                    # Then try any entity with matching name
-                    for qname, entity in entity_map.items():
-                        if entity.name == callee:
-                            callee_qualified = qname
-                            break
-
-            if not callee_qualified:
-                # 2. Check if callee ends with the qualified name pattern
-                for qname in entity_map.keys():
-                    if qname.endswith(f"::{callee}:") or qname.endswith(f".{callee}:"):
-                        callee_qualified = qname
-                        break
-
-            if not callee_qualified:
-                # 3. For simple function names, check if it's in the same file
-                for qname, entity in entity_map.items():
-                    if qname.startswith(file_path) and entity.name == callee:
-                        callee_qualified = qname
-                        break
-
-            # If not found, use the callee name as-is (might be external)
-            if not callee_qualified:
-                callee_qualified = callee
-
-            relationships.append(
-                Relationship(
-                    source_id=caller,
-                    target_id=callee_qualified,
-                    rel_type=RelationshipType.CALLS,
-                    properties={"line": line, "call_name": callee, "is_self_call": is_self_call},
-                )
+                    class_part = caller.split("::")[1].split(".")[0]  # "ClassName:123"
+                    qualified = class_methods.get((class_part, callee))
+                    if qualified:
+                        return qualified
+
+            # Exact name match - prioritize classes for capitalized names
+            if callee and callee[0].isupper():
+                qualified = class_by_name.get(callee)
+                if qualified:
+                    return qualified
+
+            # Then try any entity with matching name; if not found, use the
+            # callee name as-is (might be external)
+            return first_by_name.get(callee) or callee
+
+        # The visitor collected plain tuples; build the relationships in one pass
+        calls_type = RelationshipType.CALLS
+        relationships.extend(
+            Relationship(
+                caller,
+                resolve_callee(caller, callee, is_self_call),
+                calls_type,
+                {"line": line, "call_name": callee, "is_self_call": is_self_call},
             )
+            for caller, callee, line, is_self_call in visitor.calls
+        )
 
-        # Create USES relationships for function references (not calls)
+        # Create USES relationships for function references (not calls),
+        # preferring functions in the same file, then any file
+        uses_type = RelationshipType.USES
         for user, used_func_name, line in visitor.uses:
-            # Try to resolve the function reference
-            used_qualified = None
-
-            # Try to find the function in entity_map
-            for qname, entity in entity_map.items():
-                if entity.node_type == NodeType.FUNCTION and entity.name == used_func_name:
-                    # Prefer functions in the same file
-                    if qname.startswith(file_path):
-                        used_qualified = qname
-                        break
-
-            # If not found in same file, try any file
-            if not used_qualified:
-                for qname, entity in entity_map.items():
-                    if entity.node_type == NodeType.FUNCTION and entity.name == used_func_name:
-                        used_qualified = qname
-                        break
-
+            used_qualified = local_function_by_name.get(used_func_name) or function_by_name.get(
+                used_func_name
+            )
             if used_qualified:
                 relationships.append(
                     Relationship(
-                        source_id=user,
-                        target_id=used_qualified,
-                        rel_type=RelationshipType.USES,
-                        properties={"line": line, "reference_type": "function_reference"},
+                        user,
+                        used_qualified,
+                        uses_type,
+                        {"line": line, "reference_type": "function_reference"},
                     )
                 )
 
@@ -879,46 +1122,44 @@ class PythonParser(CodeParser):
             file_path: Path to source file
             relationships: List to append relationships to
         """
+        classes = self._index_tree(tree).classes
+
         # Build a map of class names to their line numbers
-        local_classes = {}  # {class_name: line_number}
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                local_classes[node.name] = node.lineno
+        local_classes = {node.name: node.lineno for node in classes}
 
         # Now extract inheritance relationships
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Use qualified name with line number
-                child_class_qualified = f"{file_path}::{node.name}:{node.lineno}"
-
-                # Extract base classes
-                for idx, base in enumerate(node.bases):
-                    # Try to get the base class name
-                    base_name = self._get_base_class_name(base)
-                    if base_name:
-                        # Determine the target qualified name
-                        # If base class is defined in this file, need to find its line number
-                        if base_name in local_classes:
-                            # Intra-file inheritance - include line number to match qualified name format
-                            base_lineno = local_classes[base_name]
-                            base_qualified = f"{file_path}::{base_name}:{base_lineno}"
-                        else:
-                            # Imported or external base class
-                            # Use the name as extracted (e.g., "ABC", "typing.Generic", etc.)
-                            base_qualified = base_name
+        for node in classes:
+            # Use qualified name with line number
+            child_class_qualified = f"{file_path}::{node.name}:{node.lineno}"
 
-                        relationships.append(
-                            Relationship(
-                                source_id=child_class_qualified,
-                                target_id=base_qualified,
-                                rel_type=RelationshipType.INHERITS,
-                                properties={
-                                    "base_class": base_name,
-                                    "line": node.lineno,
-                                    "order": idx,  # MRO order (important for multiple inheritance)
-                                },
-                            )
+            # Extract base classes
+            for idx, base in enumerate(node.bases):
+                # Try to get the base class name
+                base_name = self._get_base_class_name(base)
+                if base_name:
+                    # Determine the target qualified name
+                    # If base class is defined in this file, need to find its line number
+                    if base_name in local_classes:
+                        # Intra-file inheritance - include line number to match qualified name format
+                        base_lineno = local_classes[base_name]
+                        base_qualified = f"{file_path}::{base_name}:{base_lineno}"
+                    else:
+                        # Imported or external base class
+                        # Use the name as extracted (e.g., "ABC", "typing.Generic", etc.)
+                        base_qualified = base_name
+
+                    relationships.append(
+                        Relationship(
+                            source_id=child_class_qualified,
+                            target_id=base_qualified,
+                            rel_type=RelationshipType.INHERITS,
+                            properties={
+                                "base_class": base_name,
+                                "line": node.lineno,
+                                "order": idx,  # MRO order (important for multiple inheritance)
+                            },
                         )
+                    )
 
     def _get_base_class_name(self, node: ast.expr) -> Optional[str]:
         """Extract base class name from AST node.
@@ -998,20 +1239,19 @@ class PythonParser(CodeParser):
                 # For now, we'll skip this and only create the parent module
 
         # Detect dynamic imports (importlib.import_module, __import__)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                module_name = self._extract_dynamic_import(node)
-                if module_name and module_name not in modules:
-                    modules[module_name] = ModuleEntity(
-                        name=module_name.split(".")[-1],
-                        qualified_name=module_name,
-                        file_path=file_path,
-                        line_start=node.lineno,
-                        line_end=node.lineno,
-                        is_external=True,
-                        package=self._get_package_name(module_name),
-                        is_dynamic_import=True,
-                    )
+        for node in self._index_tree(tree).calls:
+            module_name = self._extract_dynamic_import(node)
+            if module_name and module_name not in modules:
+                modules[module_name] = ModuleEntity(
+                    name=module_name.split(".")[-1],
+                    qualified_name=module_name,
+                    file_path=file_path,
+                    line_start=node.lineno,
+                    line_end=node.lineno,
+                    is_external=True,
+                    package=self._get_package_name(module_name),
+                    is_dynamic_import=True,
+                )
 
         return list(modules.values())
 
@@ -1117,17 +1357,20 @@ class PythonParser(CodeParser):
         # Use (class_name, line_number) as key to handle nested classes with same name
         class_info: Dict[tuple[str, int], tuple[ast.ClassDef, Dict[str, str]]] = {}
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Extract method names for this class
-                methods: Dict[str, str] = {}  # method_name -> qualified_name
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        # Use new qualified name format with class line number
-                        method_qualified = f"{file_path}::{node.name}:{node.lineno}.{item.name}:{item.lineno}"
-                        methods[item.name] = method_qualified
+        # First class defined under each name, used to resolve base classes
+        class_by_name: Dict[str, tuple[ast.ClassDef, Dict[str, str]]] = {}
+
+        for node in self._index_tree(tree).classes:
+            # Extract method names for this class
+            methods: Dict[str, str] = {}  # method_name -> qualified_name
+            for item in node.body:
+                if isinstance(item, _FUNCTION_TYPES):
+                    # Use new qualified name format with class line number
+                    method_qualified = f"{file_path}::{node.name}:{node.lineno}.{item.name}:{item.lineno}"
+                    methods[item.name] = method_qualified
 
-                class_info[(node.name, node.lineno)] = (node, methods)
+            class_info[(node.name, node.lineno)] = (node, methods)
+            class_by_name.setdefault(node.name, (node, methods))
 
         # Now check for overrides
         for (class_name, class_line), (class_node, child_methods) in class_info.items():
@@ -1138,12 +1381,7 @@ class PythonParser(CodeParser):
                     continue
 
                 # Check if base class is defined in this file
-                # Need to find the base class by name in class_info
-                parent_info = None
-                for (cname, cline), (cnode, cmethods) in class_info.items():
-                    if cname == base_name:
-                        parent_info = (cnode, cmethods)
-                        break
+                parent_info = class_by_name.get(base_name)
 
                 if parent_info:
                     parent_node, parent_methods = parent_info
@@ -1184,40 +1422,59 @@ class PythonParser(CodeParser):
         attributes: Dict[str, AttributeEntity] = {}  # qualified_name -> entity
 
         # Walk through all classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                class_line = node.lineno
+        for node in self._index_tree(tree).classes:
+            class_name = node.name
+            class_line = node.lineno
+
+            # Find all self.attribute accesses in this class's methods
+            class_attributes = set()
+
+            for item in node.body:
+                if isinstance(item, _FUNCTION_TYPES):
+                    class_attributes.update(self._self_attributes(tree, item))
+
+            # Create AttributeEntity for each unique attribute
+            for attr_name in class_attributes:
+                # qualified_name: file::ClassName:line.attribute_name
+                qualified_name = f"{file_path}::{class_name}:{class_line}.{attr_name}"
+
+                if qualified_name not in attributes:
+                    attributes[qualified_name] = AttributeEntity(
+                        name=attr_name,
+                        qualified_name=qualified_name,
+                        file_path=file_path,
+                        line_start=class_line,  # Use class line since we don't know exact attribute definition line
+                        line_end=class_line,
+                        is_class_attribute=False,  # These are instance attributes
+                    )
 
-                # Find all self.attribute accesses in this class's methods
-                class_attributes = set()
+        return list(attributes.values())
 
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        # Walk through method body to find self.x accesses
-                        for child in ast.walk(item):
-                            if isinstance(child, ast.Attribute):
-                                # Check if it's self.something
-                                if isinstance(child.value, ast.Name) and child.value.id == "self":
-                                    attr_name = child.attr
-                                    class_attributes.add(attr_name)
-
-                # Create AttributeEntity for each unique attribute
-                for attr_name in class_attributes:
-                    # qualified_name: file::ClassName:line.attribute_name
-                    qualified_name = f"{file_path}::{class_name}:{class_line}.{attr_name}"
-
-                    if qualified_name not in attributes:
-                        attributes[qualified_name] = AttributeEntity(
-                            name=attr_name,
-                            qualified_name=qualified_name,
-                            file_path=file_path,
-                            line_start=class_line,  # Use class line since we don't know exact attribute definition line
-                            line_end=class_line,
-                            is_class_attribute=False,  # These are instance attributes
-                        )
+    def _self_attributes(self, tree: ast.AST, method: ast.AST) -> Set[str]:
+        """Return the names accessed as ``self.<name>`` inside a method.
 
-        return list(attributes.values())
+        The method body is walked once; attribute entities and USES
+        relationships share the result.
+
+        Args:
+            tree: Python AST containing the method
+            method: FunctionDef/AsyncFunctionDef node
+
+        Returns:
+            Set of attribute names
+        """
+        cache = self._index_tree(tree).self_attributes
+        attributes = cache.get(id(method))
+        if attributes is None:
+            attributes = {
+                child.attr
+                for child in _walk(method)
+                if isinstance(child, ast.Attribute)
+                and isinstance(child.value, ast.Name)
+                and child.value.id == "self"
+            }
+            cache[id(method)] = attributes
+        return attributes
 
     def _extract_attribute_usage(
         self,
@@ -1235,43 +1492,37 @@ class PythonParser(CodeParser):
             relationships: List to append relationships to
         """
         # Walk through all classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                class_line = node.lineno
+        for node in self._index_tree(tree).classes:
+            class_name = node.name
+            class_line = node.lineno
 
-                # Process each method
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        method_name = item.name
-                        method_line = item.lineno
+            # Process each method
+            for item in node.body:
+                if isinstance(item, _FUNCTION_TYPES):
+                    method_name = item.name
+                    method_line = item.lineno
 
-                        # Method qualified name with line number
-                        method_qualified = f"{file_path}::{class_name}:{class_line}.{method_name}:{method_line}"
+                    # Method qualified name with line number
+                    method_qualified = f"{file_path}::{class_name}:{class_line}.{method_name}:{method_line}"
 
-                        # Find all self.attribute accesses in this method
-                        accessed_attributes = set()
-                        for child in ast.walk(item):
-                            if isinstance(child, ast.Attribute):
-                                if isinstance(child.value, ast.Name) and child.value.id == "self":
-                                    attr_name = child.attr
-                                    accessed_attributes.add(attr_name)
+                    # Find all self.attribute accesses in this method
+                    accessed_attributes = self._self_attributes(tree, item)
 
-                        # Create USES relationship for each accessed attribute
-                        for attr_name in accessed_attributes:
-                            attr_qualified = f"{file_path}::{class_name}:{class_line}.{attr_name}"
+                    # Create USES relationship for each accessed attribute
+                    for attr_name in accessed_attributes:
+                        attr_qualified = f"{file_path}::{class_name}:{class_line}.{attr_name}"
 
-                            relationships.append(
-                                Relationship(
-                                    source_id=method_qualified,
-                                    target_id=attr_qualified,
-                                    rel_type=RelationshipType.USES,
-                                    properties={
-                                        "attribute_name": attr_name,
-                                        "class_name": class_name,
-                                    },
-                                )
+                        relationships.append(
+                            Relationship(
+                                source_id=method_qualified,
+                                target_id=attr_qualified,
+                                rel_type=RelationshipType.USES,
+                                properties={
+                                    "attribute_name": attr_name,
+                                    "class_name": class_name,
+                                },
                             )
+                        )
 
     def _extract_decorates(
         self,
@@ -1292,49 +1543,49 @@ class PythonParser(CodeParser):
             entity_map: Map of qualified_name to Entity
             relationships: List to append relationships to
         """
-        # Walk through all function definitions (including nested and methods)
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Skip if no decorators
-                if not node.decorator_list:
-                    continue
+        # Map (name, line) to the first matching function's qualified name
+        function_names: Dict[tuple[str, int], str] = {}
+        for qname, entity in entity_map.items():
+            if isinstance(entity, FunctionEntity):
+                function_names.setdefault((entity.name, entity.line_start), qname)
 
-                # Build the function's qualified name
-                # We need to determine if this is a top-level function, method, or nested function
-                func_name = node.name
-                func_line = node.lineno
-
-                # Try to find this function in entity_map to get its qualified name
-                func_qualified_name = None
-                for qname, entity in entity_map.items():
-                    if isinstance(entity, FunctionEntity):
-                        if entity.name == func_name and entity.line_start == func_line:
-                            func_qualified_name = qname
-                            break
-
-                # If we couldn't find it in entity_map, skip (shouldn't happen)
-                if not func_qualified_name:
+        # Walk through all function definitions (including nested and methods)
+        for node in self._index_tree(tree).functions:
+            # Skip if no decorators
+            if not node.decorator_list:
+                continue
+
+            # Build the function's qualified name
+            # We need to determine if this is a top-level function, method, or nested function
+            func_name = node.name
+            func_line = node.lineno
+
+            # Look up this function in entity_map to get its qualified name
+            func_qualified_name = function_names.get((func_name, func_line))
+
+            # If we couldn't find it in entity_map, skip (shouldn't happen)
+            if not func_qualified_name:
+                continue
+
+            # Process each decorator
+            for decorator in node.decorator_list:
+                decorator_name = self._resolve_decorator_name(decorator)
+                if not decorator_name:
                     continue
 
-                # Process each decorator
-                for decorator in node.decorator_list:
-                    decorator_name = self._resolve_decorator_name(decorator)
-                    if not decorator_name:
-                        continue
-
-                    # Create DECORATES relationship
-                    # Note: The decorator is the source, the function is the target
-                    relationships.append(
-                        Relationship(
-                            source_id=decorator_name,
-                            target_id=func_qualified_name,
-                            rel_type=RelationshipType.DECORATES,
-                            properties={
-                                "line": decorator.lineno,
-                                "decorator_type": type(decorator).__name__,
-                            },
-                        )
+                # Create DECORATES relationship
+                # Note: The decorator is the source, the function is the target
+                relationships.append(
+                    Relationship(
+                        source_id=decorator_name,
+                        target_id=func_qualified_name,
+                        rel_type=RelationshipType.DECORATES,
+                        properties={
+                            "line": decorator.lineno,
+                            "decorator_type": type(decorator).__name__,
+                        },
                     )
+                )
 
     def _resolve_decorator_name(self, decorator: ast.expr) -> Optional[str]:
         """Resolve decorator name from AST node.
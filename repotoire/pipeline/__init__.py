@@ -1,5 +1,6 @@
 """Ingestion pipeline for processing codebases."""
 
 from repotoire.pipeline.ingestion import IngestionPipeline, SecurityError
+from repotoire.pipeline.parse_cache import ParseCache
 
-__all__ = ["IngestionPipeline", "SecurityError"]
+__all__ = ["IngestionPipeline", "ParseCache", "SecurityError"]
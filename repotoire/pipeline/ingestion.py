@@ -1,16 +1,109 @@
 """Main ingestion pipeline for processing codebases."""
 
+import sys
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Callable, Deque, Dict, Iterator, List, NamedTuple, Optional
 
-from repotoire.graph import Neo4jClient, GraphSchema
-from repotoire.parsers import CodeParser, PythonParser
-from repotoire.models import Entity, Relationship, SecretsPolicy, RelationshipType
-from repotoire.logging_config import get_logger, LogContext, log_operation
+from repotoire.graph import GraphSchema, Neo4jClient
+from repotoire.logging_config import LogContext, get_logger, log_operation
+from repotoire.models import Entity, FileEntity, Relationship, RelationshipType, SecretsPolicy
+from repotoire.parsers import CodeParser, PythonParser, hash_file_content
+from repotoire.pipeline.parse_cache import ParseCache
 
 logger = get_logger(__name__)
 
+# Parsers installed in each worker process by _init_parse_worker
+_worker_parsers: Dict[str, CodeParser] = {}
+
+
+def _init_parse_worker(parsers: Dict[str, CodeParser]) -> None:
+    """Install the pipeline's parsers in a parse worker process.
+
+    Args:
+        parsers: Language -> parser mapping from the pipeline
+    """
+    global _worker_parsers
+    _worker_parsers = parsers
+
+
+_ParseResult = tuple[List[Entity], List[Relationship], Optional[str]]
+
+
+class _ParseTask(NamedTuple):
+    """One file for a parse worker.
+
+    ``source`` and ``content_hash`` are set when the parent already read and
+    hashed the file for a parse cache lookup, so the worker does not repeat it.
+    """
+
+    language: str
+    file_path: str
+    source: Optional[bytes] = None
+    content_hash: Optional[str] = None
+
+
+def _parse_tasks(
+    parsers: Dict[str, CodeParser], tasks: List[_ParseTask]
+) -> List[_ParseResult]:
+    """Parse files, capturing each file's error instead of raising.
+
+    Args:
+        parsers: Language -> parser mapping
+        tasks: Files to parse
+
+    Returns:
+        One (entities, relationships, error message or None) tuple per task
+    """
+    results: List[_ParseResult] = []
+    for task in tasks:
+        parser = parsers[task.language]
+        try:
+            if task.source is not None and task.content_hash is not None:
+                entities, relationships = parser.process_source(
+                    task.file_path, task.source, task.content_hash
+                )
+            else:
+                entities, relationships = parser.process_file(task.file_path)
+            results.append((entities, relationships, None))
+        except Exception as e:
+            results.append(([], [], str(e)))
+    return results
+
+
+def _parse_in_worker(tasks: List[_ParseTask]) -> List[_ParseResult]:
+    """Parse a chunk of files in a worker process.
+
+    Args:
+        tasks: Files to parse
+
+    Returns:
+        One (entities, relationships, error message or None) tuple per task
+    """
+    return _parse_tasks(_worker_parsers, tasks)
+
+
+class _CacheLookup(NamedTuple):
+    """Outcome of a parse cache lookup for one file."""
+
+    key: str
+    result: Optional[tuple[List[Entity], List[Relationship]]]
+    source: bytes
+    content_hash: str
+
+
+class _PlannedFile(NamedTuple):
+    """How one file of a worker chunk gets its result."""
+
+    file_path: Path
+    cached: Optional[tuple[List[Entity], List[Relationship]]] = None
+    cache_key: Optional[str] = None  # Set for cache misses sent to a worker
+    error: Optional[Exception] = None  # Cache lookup failure; the file is skipped
+
 
 class SecurityError(Exception):
     """Raised when a security violation is detected."""
@@ -24,6 +117,10 @@ class IngestionPipeline:
     MAX_FILE_SIZE_MB = 10  # Maximum file size to process
     DEFAULT_FOLLOW_SYMLINKS = False  # Don't follow symlinks by default
     DEFAULT_BATCH_SIZE = 100  # Default batch size for loading entities
+    DEFAULT_WORKERS = 1  # Parse in-process by default
+    PARSE_CHUNK_SIZE = 16  # Files per worker task, amortizes pickling overhead
+    PARSE_CHUNKS_PER_WORKER = 2  # Chunks in flight per worker, bounds buffered sources
+    IO_THREADS = 16  # Concurrent reads when fingerprinting files
 
     def __init__(
         self,
@@ -34,7 +131,9 @@ class IngestionPipeline:
         batch_size: int = DEFAULT_BATCH_SIZE,
         secrets_policy: SecretsPolicy = SecretsPolicy.REDACT,
         generate_clues: bool = False,
-        generate_embeddings: bool = False
+        generate_embeddings: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        parse_cache_dir: Optional[str] = None,
     ):
         """Initialize ingestion pipeline with security validation.
 
@@ -47,6 +146,12 @@ class IngestionPipeline:
             secrets_policy: Policy for handling detected secrets (default: REDACT)
             generate_clues: Whether to generate AI semantic clues (default: False)
             generate_embeddings: Whether to generate vector embeddings for RAG (default: False)
+            workers: Number of processes used to parse files (default: 1, parse in-process).
+                Parsers are sent to the workers by pickling, which must succeed
+                under the "spawn" start method (the default on macOS and Windows);
+                files whose chunk fails in the pool are parsed in-process instead
+            parse_cache_dir: Directory for the on-disk parse cache; unchanged files
+                are loaded from it instead of re-parsed (default: None, disabled)
 
         Raises:
             ValueError: If repository path is invalid
@@ -74,6 +179,8 @@ class IngestionPipeline:
         self.secrets_policy = secrets_policy
         self.generate_clues = generate_clues
         self.generate_embeddings = generate_embeddings
+        self.workers = workers
+        self.parse_cache = ParseCache(parse_cache_dir) if parse_cache_dir else None
 
         # Track skipped files for reporting
         self.skipped_files: List[Dict[str, str]] = []
@@ -259,18 +366,36 @@ class IngestionPipeline:
             logger.warning(f"Could not make path relative: {file_path}")
             return str(file_path)
 
-    def parse_and_extract(self, file_path: Path) -> tuple[List[Entity], List[Relationship]]:
-        """Parse a file and extract entities/relationships with security validation.
+    def _hash_files(self, files: List[Path]) -> Dict[Path, str]:
+        """Fingerprint files, overlapping their reads on a thread pool.
+
+        File reads release the GIL, so many small files are read with
+        several requests in flight instead of one blocking read at a time.
 
         Args:
-            file_path: Path to source file (must be within repository)
+            files: Files to fingerprint
 
         Returns:
-            Tuple of (entities, relationships)
+            Map of file path to hash_file_content() digest
+        """
+        def read_and_hash(file_path: Path) -> str:
+            with open(file_path, "rb") as f:
+                return hash_file_content(f.read())
 
-        Note:
-            All file paths stored in entities will be relative to repository root
-            for security (avoids exposing system structure).
+        if len(files) < 2:
+            return {file_path: read_and_hash(file_path) for file_path in files}
+
+        with ThreadPoolExecutor(max_workers=self.IO_THREADS) as executor:
+            return dict(zip(files, executor.map(read_and_hash, files)))
+
+    def _parser_language(self, file_path: Path) -> Optional[str]:
+        """Validate a file and choose the parser language for it.
+
+        Args:
+            file_path: Path to source file (must be within repository)
+
+        Returns:
+            Language of a registered parser, or None if the file is skipped
         """
         # Security validation
         try:
@@ -281,36 +406,290 @@ class IngestionPipeline:
                 "file": str(file_path),
                 "reason": "Security validation failed"
             })
-            return [], []
+            return None
 
         # Determine language from extension
         language = self._detect_language(file_path)
 
         if language not in self.parsers:
             logger.warning(f"No parser for {language}, skipping {file_path}")
+            return None
+
+        return language
+
+    def _finish_extraction(
+        self, file_path: Path, entities: List[Entity], relationships: List[Relationship]
+    ) -> tuple[List[Entity], List[Relationship]]:
+        """Rewrite entity file paths relative to the repository root.
+
+        Args:
+            file_path: Path to the parsed file
+            entities: Entities extracted from the file
+            relationships: Relationships extracted from the file
+
+        Returns:
+            Tuple of (entities, relationships)
+        """
+        # Convert all entity file paths to relative paths for security.
+        # Each distinct path is resolved once and interned, so every entity
+        # from a file shares a single string.
+        relative_paths: Dict[str, str] = {}
+        for entity in entities:
+            path = entity.file_path
+            if path:
+                relative = relative_paths.get(path)
+                if relative is None:
+                    relative = sys.intern(self._get_relative_path(Path(path)))
+                    relative_paths[path] = relative
+                # Store relative path instead of absolute
+                entity.file_path = relative
+
+        logger.debug(
+            f"Extracted {len(entities)} entities and {len(relationships)} relationships from {file_path}"
+        )
+        return entities, relationships
+
+    def _record_parse_error(self, file_path: Path, error: object) -> None:
+        """Log a parse failure and add the file to the skipped list.
+
+        Args:
+            file_path: Path to the file that failed
+            error: Exception or error message
+        """
+        logger.error(f"Failed to parse {file_path}: {error}")
+        self.skipped_files.append({
+            "file": str(file_path),
+            "reason": f"Parse error: {str(error)}"
+        })
+
+    @staticmethod
+    def _cache_lookup(
+        parse_cache: ParseCache, file_path: Path, parser: CodeParser
+    ) -> _CacheLookup:
+        """Read and hash a file once, then look it up in the parse cache.
+
+        Args:
+            parse_cache: Cache to consult
+            file_path: Path to source file
+            parser: Parser that would process the file
+
+        Returns:
+            The cache key, cached result (None on a miss), and the bytes and
+            hash that were read, so a miss can be parsed without reading again
+        """
+        with open(file_path, "rb") as f:
+            source = f.read()
+        content_hash = hash_file_content(source)
+        cache_key = ParseCache.make_key(content_hash, parser)
+
+        cached = parse_cache.get(str(file_path), cache_key)
+        if cached is not None:
+            # Content is unchanged but the file may have been touched
+            last_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
+            for entity in cached[0]:
+                if isinstance(entity, FileEntity):
+                    entity.last_modified = last_modified
+            logger.debug(f"Parse cache hit: {file_path}")
+        return _CacheLookup(cache_key, cached, source, content_hash)
+
+    def parse_and_extract(self, file_path: Path) -> tuple[List[Entity], List[Relationship]]:
+        """Parse a file and extract entities/relationships with security validation.
+
+        Args:
+            file_path: Path to source file (must be within repository)
+
+        Returns:
+            Tuple of (entities, relationships)
+
+        Note:
+            All file paths stored in entities will be relative to repository root
+            for security (avoids exposing system structure).
+        """
+        language = self._parser_language(file_path)
+        if language is None:
             return [], []
 
         parser = self.parsers[language]
+        parse_cache = self.parse_cache
 
         try:
-            entities, relationships = parser.process_file(str(file_path))
+            if parse_cache is None:
+                entities, relationships = parser.process_file(str(file_path))
+                return self._finish_extraction(file_path, entities, relationships)
 
-            # Convert all entity file paths to relative paths for security
-            for entity in entities:
-                if hasattr(entity, 'file_path') and entity.file_path:
-                    # Store relative path instead of absolute
-                    entity.file_path = self._get_relative_path(Path(entity.file_path))
+            lookup = self._cache_lookup(parse_cache, file_path, parser)
+            if lookup.result is not None:
+                return self._finish_extraction(file_path, *lookup.result)
 
-            logger.debug(
-                f"Extracted {len(entities)} entities and {len(relationships)} relationships from {file_path}"
+            entities, relationships = parser.process_source(
+                str(file_path), lookup.source, lookup.content_hash
             )
-            return entities, relationships
+            parse_cache.put(str(file_path), lookup.key, entities, relationships)
+            return self._finish_extraction(file_path, entities, relationships)
         except Exception as e:
-            logger.error(f"Failed to parse {file_path}: {e}")
-            self.skipped_files.append({
-                "file": str(file_path),
-                "reason": f"Parse error: {str(e)}"
-            })
+            self._record_parse_error(file_path, e)
+            return [], []
+
+    def _extract_in_workers(
+        self, files: List[Path]
+    ) -> Iterator[tuple[List[Entity], List[Relationship]]]:
+        """Parse files in a process pool, yielding results in file order.
+
+        Validation, path rewriting and error reporting stay in this process;
+        workers only run the parsers. Files are planned a chunk at a time:
+        parse cache hits are served here, and misses go to a worker with the
+        bytes and hash already read for the lookup. The pool is only started
+        once a chunk has something to parse.
+
+        The pipeline's parsers are pickled into each worker, so they must be
+        picklable under the "spawn" start method. A chunk whose future fails
+        (a broken pool, or a parser or result that cannot be pickled) is
+        parsed in-process instead, with the same skip-and-log handling as
+        serial parsing.
+
+        Args:
+            files: Files to parse
+
+        Yields:
+            Tuple of (entities, relationships) per file, empty on failure
+        """
+        languages = [self._parser_language(file_path) for file_path in files]
+        tasks = [
+            (file_path, language)
+            for file_path, language in zip(files, languages)
+            if language is not None
+        ]
+        chunks = deque(
+            tasks[i:i + self.PARSE_CHUNK_SIZE]
+            for i in range(0, len(tasks), self.PARSE_CHUNK_SIZE)
+        )
+        max_in_flight = max(1, self.workers) * self.PARSE_CHUNKS_PER_WORKER
+        in_flight: Deque[
+            tuple[List[_PlannedFile], List[_ParseTask], Optional["Future[List[_ParseResult]]"]]
+        ] = deque()
+
+        with ExitStack() as stack:
+            executor: Optional[ProcessPoolExecutor] = None
+            planned: Iterator[_PlannedFile] = iter(())
+            worker_results: Iterator[_ParseResult] = iter(())
+
+            for language in languages:
+                if language is None:
+                    yield [], []
+                    continue
+
+                plan = next(planned, None)
+                if plan is None:
+                    # Keep up to max_in_flight chunks submitted ahead of the reader
+                    while chunks and len(in_flight) < max_in_flight:
+                        chunk_plan, worker_tasks = self._plan_chunk(chunks.popleft())
+                        future = None
+                        if worker_tasks:
+                            if executor is None:
+                                executor = stack.enter_context(ProcessPoolExecutor(
+                                    max_workers=self.workers,
+                                    initializer=_init_parse_worker,
+                                    initargs=(self.parsers,),
+                                ))
+                            future = executor.submit(_parse_in_worker, worker_tasks)
+                        in_flight.append((chunk_plan, worker_tasks, future))
+
+                    chunk_plan, worker_tasks, future = in_flight.popleft()
+                    planned = iter(chunk_plan)
+                    worker_results = iter(self._chunk_results(worker_tasks, future))
+                    plan = next(planned)
+
+                yield self._finish_planned(plan, worker_results)
+
+    def _plan_chunk(
+        self, chunk: List[tuple[Path, str]]
+    ) -> tuple[List[_PlannedFile], List[_ParseTask]]:
+        """Serve a chunk's parse cache hits and collect the files left to parse.
+
+        Args:
+            chunk: (file_path, language) pairs
+
+        Returns:
+            Tuple of (plan per file in order, tasks for a worker)
+        """
+        parse_cache = self.parse_cache
+        plan: List[_PlannedFile] = []
+        worker_tasks: List[_ParseTask] = []
+        for file_path, language in chunk:
+            if parse_cache is None:
+                plan.append(_PlannedFile(file_path))
+                worker_tasks.append(_ParseTask(language, str(file_path)))
+                continue
+            try:
+                lookup = self._cache_lookup(parse_cache, file_path, self.parsers[language])
+            except Exception as e:
+                plan.append(_PlannedFile(file_path, error=e))
+                continue
+            if lookup.result is not None:
+                plan.append(_PlannedFile(file_path, cached=lookup.result))
+                continue
+            plan.append(_PlannedFile(file_path, cache_key=lookup.key))
+            worker_tasks.append(
+                _ParseTask(language, str(file_path), lookup.source, lookup.content_hash)
+            )
+        return plan, worker_tasks
+
+    def _chunk_results(
+        self,
+        worker_tasks: List[_ParseTask],
+        future: Optional["Future[List[_ParseResult]]"],
+    ) -> List[_ParseResult]:
+        """Return a chunk's worker results, parsing in-process if the worker failed.
+
+        Args:
+            worker_tasks: Tasks submitted for the chunk
+            future: Future for the chunk, None when nothing was submitted
+
+        Returns:
+            (entities, relationships, error message or None) per task
+        """
+        if future is None:
+            return []
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(
+                f"Parse worker failed ({type(e).__name__}: {e}); "
+                f"parsing {len(worker_tasks)} files in-process"
+            )
+            return _parse_tasks(self.parsers, worker_tasks)
+
+    def _finish_planned(
+        self, plan: _PlannedFile, worker_results: Iterator[_ParseResult]
+    ) -> tuple[List[Entity], List[Relationship]]:
+        """Turn one planned file into its final (entities, relationships).
+
+        Args:
+            plan: The file's plan from _plan_chunk
+            worker_results: The chunk's worker results, consumed in task order
+
+        Returns:
+            Tuple of (entities, relationships), empty on failure
+        """
+        file_path = plan.file_path
+        if plan.error is not None:
+            self._record_parse_error(file_path, plan.error)
+            return [], []
+
+        if plan.cached is not None:
+            entities, relationships = plan.cached
+        else:
+            entities, relationships, error = next(worker_results)
+            if error is not None:
+                self._record_parse_error(file_path, error)
+                return [], []
+            if self.parse_cache is not None and plan.cache_key is not None:
+                self.parse_cache.put(str(file_path), plan.cache_key, entities, relationships)
+
+        try:
+            return self._finish_extraction(file_path, entities, relationships)
+        except Exception as e:
+            self._record_parse_error(file_path, e)
             return [], []
 
     def _generate_clues_for_entities(
@@ -369,7 +748,7 @@ class IngestionPipeline:
         if not self.embedder:
             return 0
 
-        from repotoire.models import FunctionEntity, ClassEntity, FileEntity
+        from repotoire.models import ClassEntity, FileEntity, FunctionEntity
 
         entities_embedded = 0
         embedding_batch_size = 50  # Smaller batches for API rate limits
@@ -595,20 +974,24 @@ class IngestionPipeline:
 
         if incremental:
             logger.info("Running incremental ingestion (comparing file hashes)")
+            known_files = []
             for file_path in files:
                 rel_path = self._get_relative_path(file_path)
-                metadata = self.db.get_file_metadata(rel_path)
+                known_files.append((file_path, rel_path, self.db.get_file_metadata(rel_path)))
+
+            # Fingerprint every file already in the graph with overlapping reads
+            current_hashes = self._hash_files(
+                [file_path for file_path, _, metadata in known_files if metadata is not None]
+            )
 
+            for file_path, rel_path, metadata in known_files:
                 if metadata is None:
                     # New file, need to ingest
                     files_to_process.append(file_path)
                     files_new += 1
                 else:
                     # File exists in database, compare hashes
-                    # Need to compute current hash
-                    import hashlib
-                    with open(file_path, "rb") as f:
-                        current_hash = hashlib.md5(f.read()).hexdigest()
+                    current_hash = current_hashes[file_path]
 
                     if current_hash == metadata["hash"]:
                         # File unchanged, skip
@@ -672,43 +1055,54 @@ class IngestionPipeline:
         files_processed = 0
         files_failed = 0
 
-        for i, file_path in enumerate(files_to_process, 1):
-            with LogContext(operation="parse_file", file=str(file_path), progress=f"{i}/{len(files_to_process)}"):
-                logger.debug(f"Processing file {i}/{len(files_to_process)}: {file_path}")
-
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(i, len(files_to_process), str(file_path))
-
-                entities, relationships = self.parse_and_extract(file_path)
+        if self.workers > 1 and len(files_to_process) > 1:
+            extracted = self._extract_in_workers(files_to_process)
+        else:
+            # Lazy, so each file is parsed inside its own log context
+            extracted = (self.parse_and_extract(file_path) for file_path in files_to_process)
 
-                if entities:
-                    files_processed += 1
-                    all_entities.extend(entities)
-                    all_relationships.extend(relationships)
+        try:
+            for i, file_path in enumerate(files_to_process, 1):
+                with LogContext(operation="parse_file", file=str(file_path), progress=f"{i}/{len(files_to_process)}"):
+                    logger.debug(f"Processing file {i}/{len(files_to_process)}: {file_path}")
+
+                    # Call progress callback if provided
+                    if progress_callback:
+                        progress_callback(i, len(files_to_process), str(file_path))
+
+                    entities, relationships = next(extracted)
+
+                    if entities:
+                        files_processed += 1
+                        all_entities.extend(entities)
+                        all_relationships.extend(relationships)
+
+                        # Generate semantic clues if enabled
+                        if self.generate_clues:
+                            clue_entities, clue_relationships = self._generate_clues_for_entities(entities)
+                            all_entities.extend(clue_entities)
+                            all_relationships.extend(clue_relationships)
+                    else:
+                        files_failed += 1
+
+                    # Batch load entities for better performance
+                    if len(all_entities) >= self.batch_size:
+                        batch_start = time.time()
+                        self.load_to_graph(all_entities, all_relationships)
+                        batch_duration = time.time() - batch_start
+
+                        logger.debug("Loaded batch", extra={
+                            "entities": len(all_entities),
+                            "relationships": len(all_relationships),
+                            "duration_seconds": round(batch_duration, 3)
+                        })
 
-                    # Generate semantic clues if enabled
-                    if self.generate_clues:
-                        clue_entities, clue_relationships = self._generate_clues_for_entities(entities)
-                        all_entities.extend(clue_entities)
-                        all_relationships.extend(clue_relationships)
-                else:
-                    files_failed += 1
-
-                # Batch load entities for better performance
-                if len(all_entities) >= self.batch_size:
-                    batch_start = time.time()
-                    self.load_to_graph(all_entities, all_relationships)
-                    batch_duration = time.time() - batch_start
-
-                    logger.debug("Loaded batch", extra={
-                        "entities": len(all_entities),
-                        "relationships": len(all_relationships),
-                        "duration_seconds": round(batch_duration, 3)
-                    })
-
-                    all_entities = []
-                    all_relationships = []
+                        all_entities = []
+                        all_relationships = []
+        finally:
+            # Commits any pending cache writes and releases the database
+            if self.parse_cache is not None:
+                self.parse_cache.close()
 
         # Load remaining entities
         if all_entities:
@@ -0,0 +1,155 @@
+"""On-disk cache of parser output keyed by file content."""
+
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from repotoire import __version__
+from repotoire.logging_config import get_logger
+from repotoire.models import Entity, Relationship
+
+logger = get_logger(__name__)
+
+
+class ParseCache:
+    """SQLite-backed cache of ``(entities, relationships)`` per source file.
+
+    Each file keeps one entry, tagged with a key built from the content hash
+    and the parser that produced it. A changed file, parser, secrets policy
+    or Repotoire version misses the cache and overwrites the entry.
+
+    Entries are pickled, so only point the cache at a directory you trust
+    (never inside the repository being analyzed).
+
+    The database is opened on first use and released by close(), after
+    which the next call reopens it; use the cache as a context manager or
+    call close() in a ``finally`` block.
+
+    Example:
+        >>> with ParseCache("~/.cache/repotoire") as cache:
+        ...     key = ParseCache.make_key(content_hash, parser)
+        ...     cached = cache.get("/repo/app.py", key)
+    """
+
+    FILE_NAME = "parse_cache.sqlite3"
+    FORMAT_VERSION = 1  # Bump when the cached payload layout changes
+    COMMIT_EVERY = 64  # Writes per transaction
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Prepare the cache directory; the database opens on first use.
+
+        Args:
+            cache_dir: Directory holding the cache file
+        """
+        directory = Path(cache_dir).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / self.FILE_NAME
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending_writes = 0
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the open database connection, opening (or creating) it if needed."""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.path))
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS parse_results ("
+                    "file_path TEXT PRIMARY KEY, cache_key TEXT NOT NULL, payload BLOB NOT NULL)"
+                )
+            except Exception:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def make_key(cls, content_hash: str, parser: object) -> str:
+        """Build the cache key for a file's content and the parser reading it.
+
+        Args:
+            content_hash: Fingerprint from hash_file_content()
+            parser: Parser instance that will process the file
+
+        Returns:
+            Cache key string
+        """
+        parser_type = type(parser)
+        policy = getattr(parser, "secrets_policy", None)
+        return (
+            f"{cls.FORMAT_VERSION}:{__version__}:"
+            f"{parser_type.__module__}.{parser_type.__qualname__}:{policy}:{content_hash}"
+        )
+
+    def get(
+        self, file_path: str, cache_key: str
+    ) -> Optional[Tuple[List[Entity], List[Relationship]]]:
+        """Return the cached parse result for a file, if still valid.
+
+        Args:
+            file_path: Path the file was parsed from
+            cache_key: Key from make_key() for the file's current content
+
+        Returns:
+            Tuple of (entities, relationships), or None on a miss
+        """
+        row = self._connection().execute(
+            "SELECT payload FROM parse_results WHERE file_path = ? AND cache_key = ?",
+            (file_path, cache_key),
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            entities, relationships = pickle.loads(row[0])
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable parse cache entry for {file_path}: {e}")
+            return None
+        return entities, relationships
+
+    def put(
+        self,
+        file_path: str,
+        cache_key: str,
+        entities: List[Entity],
+        relationships: List[Relationship],
+    ) -> None:
+        """Store a parse result, replacing any older entry for the file.
+
+        Args:
+            file_path: Path the file was parsed from
+            cache_key: Key from make_key() for the parsed content
+            entities: Entities extracted from the file
+            relationships: Relationships extracted from the file
+        """
+        payload = pickle.dumps((entities, relationships), protocol=pickle.HIGHEST_PROTOCOL)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO parse_results (file_path, cache_key, payload) VALUES (?, ?, ?)",
+            (file_path, cache_key, payload),
+        )
+        self._pending_writes += 1
+        if self._pending_writes >= self.COMMIT_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit pending writes."""
+        if self._conn is not None:
+            self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database (safe to call twice)."""
+        if self._conn is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+            self._conn = None
@@ -9,6 +9,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Safe Cypher identifier: letters, digits, underscores and hyphens only
+_IDENTIFIER_RE = re.compile(r'[a-zA-Z0-9_-]+')
+
 
 class ValidationError(Exception):
     """Raised when input validation fails.
@@ -298,6 +301,47 @@ def validate_batch_size(batch_size: int) -> int:
     return batch_size
 
 
+# Longest variable-length path the graph queries will search
+MAX_PATH_DEPTH = 100
+
+
+def validate_path_depth(max_depth: int) -> int:
+    """Validate a maximum path depth for a variable-length Cypher pattern.
+
+    Cypher does not accept parameters in variable-length bounds such as
+    ``[*1..5]``, so the depth is interpolated into the query text and must
+    be a plain positive integer.
+
+    Args:
+        max_depth: Maximum number of relationships in a path
+
+    Returns:
+        Validated depth as an int
+
+    Raises:
+        ValidationError: If the depth is not an integer or is out of range
+    """
+    if isinstance(max_depth, bool) or not isinstance(max_depth, int):
+        raise ValidationError(
+            f"Path depth must be an integer: {max_depth!r}",
+            "Use a positive integer, e.g., 5"
+        )
+
+    if max_depth <= 0:
+        raise ValidationError(
+            f"Path depth must be positive: {max_depth}",
+            "Use a positive integer, e.g., 5"
+        )
+
+    if max_depth > MAX_PATH_DEPTH:
+        raise ValidationError(
+            f"Path depth is too large: {max_depth}",
+            f"Use at most {MAX_PATH_DEPTH}; long variable-length paths are very expensive"
+        )
+
+    return int(max_depth)
+
+
 def validate_retry_config(max_retries: int, backoff_factor: float, base_delay: float) -> tuple[int, float, float]:
     """Validate retry configuration parameters.
 
@@ -446,7 +490,8 @@ def validate_identifier(name: str, context: str = "identifier") -> str:
 
     # Allow alphanumeric, underscores, and hyphens only
     # This prevents Cypher injection attacks
-    if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+    # (fullmatch, unlike ^...$, also rejects a trailing newline)
+    if not _IDENTIFIER_RE.fullmatch(name):
         raise ValidationError(
             f"Invalid {context}: {name}",
             f"{context.capitalize()} must contain only letters, numbers, underscores, and hyphens.\n"
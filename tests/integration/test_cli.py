@@ -1,5 +1,6 @@
 """Integration tests for CLI commands."""
 
+import shutil
 import tempfile
 import json
 from pathlib import Path
@@ -40,7 +41,6 @@ def hello():
     yield temp_path
 
     # Cleanup
-    import shutil
     shutil.rmtree(temp_dir)
 
 
@@ -1,9 +1,8 @@
 """Integration tests for incremental ingestion functionality."""
 
-import hashlib
-
 import pytest
 
+from repotoire.parsers import hash_file_content
 from repotoire.pipeline.ingestion import IngestionPipeline
 from repotoire.graph import Neo4jClient
 
@@ -243,7 +242,7 @@ class TestIncrementalIngestion:
         file1.write_text(content)
 
         # Compute expected hash
-        expected_hash = hashlib.md5(content.encode()).hexdigest()
+        expected_hash = hash_file_content(content.encode())
 
         # Ingest file
         pipeline = IngestionPipeline(str(temp_repo), neo4j_client)
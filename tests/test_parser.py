@@ -1,6 +1,8 @@
 """Tests for Python parser."""
 
+import tempfile
 from pathlib import Path
+
 from repotoire.parsers import PythonParser
 from repotoire.models import NodeType
 
@@ -24,8 +26,6 @@ class MyClass:
 '''
 
     # Save to temp file
-    import tempfile
-
     with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
         f.write(test_code)
         temp_path = f.name
@@ -57,8 +57,6 @@ def documented_function():
     pass
 '''
 
-    import tempfile
-
     with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
         f.write(test_code)
         temp_path = f.name
@@ -1,7 +1,9 @@
 """Unit tests for configuration management."""
 
+import dataclasses
 import json
-import tempfile
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
@@ -19,48 +21,91 @@ from repotoire.config import (
     load_config,
     load_config_from_env,
     generate_config_template,
+    clear_config_cache,
     _expand_env_vars,
+    HAS_TOML,
+    HAS_TOML_W,
+    HAS_YAML,
 )
+import repotoire.config as config_module
+
+
+# Optional format parsers, checked once at import instead of in every test
+requires_yaml = pytest.mark.skipif(not HAS_YAML, reason="PyYAML not installed")
+requires_toml = pytest.mark.skipif(not HAS_TOML, reason="tomli/tomllib not available")
+requires_toml_w = pytest.mark.skipif(not HAS_TOML_W, reason="tomli-w not installed")
+
+
+@contextmanager
+def set_env(**values):
+    """Temporarily set environment variables, restoring only the touched keys.
+
+    Cheaper than patch.dict("os.environ", ...), which copies the whole
+    environment on entry and exit.
+    """
+    saved = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    """Start and end every test with empty config path and parse caches."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+NEO4J_DEFAULTS = {
+    "uri": "bolt://localhost:7687",
+    "user": "neo4j",
+    "password": None,
+    "max_retries": 3,
+    "retry_backoff_factor": 2.0,
+    "retry_base_delay": 1.0,
+}
+
+INGESTION_DEFAULTS = {
+    "patterns": ["**/*.py"],
+    "follow_symlinks": False,
+    "max_file_size_mb": 10.0,
+    "batch_size": 100,
+}
+
+ANALYSIS_DEFAULTS = {"min_modularity": 0.3, "max_coupling": 5.0}
+
+LOGGING_DEFAULTS = {"level": "INFO", "format": "human", "file": None}
+
+
+@pytest.fixture(scope="session")
+def default_falkor_config():
+    """Create one default FalkorConfig; tests must treat it as read-only."""
+    return FalkorConfig()
 
 
 class TestConfigDataClasses:
     """Test configuration data classes."""
 
-    def test_neo4j_config_defaults(self):
-        """Test Neo4j config default values."""
-        config = Neo4jConfig()
-        assert config.uri == "bolt://localhost:7687"
-        assert config.user == "neo4j"
-        assert config.password is None
-
-    def test_ingestion_config_defaults(self):
-        """Test ingestion config default values."""
-        config = IngestionConfig()
-        assert config.patterns == ["**/*.py"]
-        assert config.follow_symlinks is False
-        assert config.max_file_size_mb == 10.0
-        assert config.batch_size == 100
-
-    def test_analysis_config_defaults(self):
-        """Test analysis config default values."""
-        config = AnalysisConfig()
-        assert config.min_modularity == 0.3
-        assert config.max_coupling == 5.0
-
-    def test_logging_config_defaults(self):
-        """Test logging config default values."""
-        config = LoggingConfig()
-        assert config.level == "INFO"
-        assert config.format == "human"
-        assert config.file is None
-
-    def test_falkor_config_defaults(self):
-        """Test complete Falkor config with defaults."""
-        config = FalkorConfig()
-        assert isinstance(config.neo4j, Neo4jConfig)
-        assert isinstance(config.ingestion, IngestionConfig)
-        assert isinstance(config.analysis, AnalysisConfig)
-        assert isinstance(config.logging, LoggingConfig)
+    @pytest.mark.parametrize("attr,config_class,expected", [
+        ("neo4j", Neo4jConfig, NEO4J_DEFAULTS),
+        ("ingestion", IngestionConfig, INGESTION_DEFAULTS),
+        ("analysis", AnalysisConfig, ANALYSIS_DEFAULTS),
+        ("logging", LoggingConfig, LOGGING_DEFAULTS),
+    ])
+    def test_config_defaults(self, default_falkor_config, attr, config_class, expected):
+        """Test section defaults, standalone and inside FalkorConfig."""
+        assert dataclasses.asdict(config_class()) == expected
+
+        section = getattr(default_falkor_config, attr)
+        assert isinstance(section, config_class)
+        assert dataclasses.asdict(section) == expected
 
     def test_falkor_config_from_dict(self):
         """Test creating config from dictionary."""
@@ -88,10 +133,9 @@ class TestConfigDataClasses:
         assert config.ingestion.follow_symlinks is True
         assert config.logging.level == "DEBUG"
 
-    def test_falkor_config_to_dict(self):
+    def test_falkor_config_to_dict(self, default_falkor_config):
         """Test converting config to dictionary."""
-        config = FalkorConfig()
-        data = config.to_dict()
+        data = default_falkor_config.to_dict()
 
         assert "neo4j" in data
         assert "ingestion" in data
@@ -101,9 +145,9 @@ class TestConfigDataClasses:
         assert data["neo4j"]["uri"] == "bolt://localhost:7687"
         assert data["ingestion"]["patterns"] == ["**/*.py"]
 
-    def test_falkor_config_merge(self):
+    def test_falkor_config_merge(self, default_falkor_config):
         """Test merging two configs."""
-        config1 = FalkorConfig()
+        config1 = default_falkor_config
         config2_data = {
             "neo4j": {"uri": "bolt://new:7687"},
             "logging": {"level": "DEBUG"},
@@ -120,44 +164,62 @@ class TestConfigDataClasses:
         assert merged.neo4j.user == "neo4j"
         assert merged.ingestion.patterns == ["**/*.py"]
 
+        # config1 itself is left untouched
+        assert config1 == FalkorConfig()
+
+    def test_falkor_config_merge_keeps_non_default_base(self):
+        """Test that default values in the other config do not override."""
+        config1 = FalkorConfig.from_dict({
+            "neo4j": {"user": "admin"},
+            "ingestion": {"batch_size": 500},
+        })
+        config2 = FalkorConfig.from_dict({"neo4j": {"uri": "bolt://new:7687"}})
+
+        merged = config1.merge(config2)
+
+        assert merged.neo4j.uri == "bolt://new:7687"
+        assert merged.neo4j.user == "admin"
+        assert merged.ingestion.batch_size == 500
+        assert merged.neo4j is not config1.neo4j
+
 
 class TestEnvVarExpansion:
     """Test environment variable expansion."""
 
     def test_expand_simple_string(self):
         """Test expanding ${VAR} syntax."""
-        with patch.dict("os.environ", {"MY_VAR": "test_value"}):
+        with set_env(MY_VAR="test_value"):
             result = _expand_env_vars("${MY_VAR}")
             assert result == "test_value"
 
     def test_expand_dollar_var(self):
         """Test expanding $VAR syntax."""
-        with patch.dict("os.environ", {"MY_VAR": "test_value"}):
+        with set_env(MY_VAR="test_value"):
             result = _expand_env_vars("$MY_VAR")
             assert result == "test_value"
 
     def test_expand_in_string(self):
         """Test expanding variable in middle of string."""
-        with patch.dict("os.environ", {"HOST": "localhost"}):
+        with set_env(HOST="localhost"):
             result = _expand_env_vars("bolt://${HOST}:7687")
             assert result == "bolt://localhost:7687"
 
     def test_expand_multiple_vars(self):
         """Test expanding multiple variables."""
-        with patch.dict("os.environ", {"HOST": "localhost", "PORT": "7687"}):
+        with set_env(HOST="localhost", PORT="7687"):
             result = _expand_env_vars("bolt://${HOST}:${PORT}")
             assert result == "bolt://localhost:7687"
 
     def test_expand_dict(self):
         """Test expanding variables in dictionary."""
-        with patch.dict("os.environ", {"PASSWORD": "secret"}):
+        with set_env(PASSWORD="secret"):
             data = {"neo4j": {"password": "${PASSWORD}"}}
             result = _expand_env_vars(data)
             assert result["neo4j"]["password"] == "secret"
 
     def test_expand_list(self):
         """Test expanding variables in list."""
-        with patch.dict("os.environ", {"PATTERN": "*.py"}):
+        with set_env(PATTERN="*.py"):
             data = ["${PATTERN}", "*.js"]
             result = _expand_env_vars(data)
             assert result == ["*.py", "*.js"]
@@ -168,17 +230,7 @@ class TestEnvVarExpansion:
         assert result == "${UNDEFINED_VAR}"
 
 
-class TestConfigFileLoading:
-    """Test loading configuration from files."""
-
-    def test_load_yaml_config(self):
-        """Test loading YAML config file."""
-        pytest.importorskip("yaml")  # Skip if PyYAML not installed
-
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
-
-        yaml_content = """
+YAML_CONFIG = """
 neo4j:
   uri: bolt://test:7687
   user: test_user
@@ -188,46 +240,15 @@ ingestion:
     - "**/*.py"
     - "**/*.js"
 """
-        config_path.write_text(yaml_content)
-
-        try:
-            data = load_config_file(config_path)
-            assert data["neo4j"]["uri"] == "bolt://test:7687"
-            assert data["neo4j"]["user"] == "test_user"
-            assert "**/*.js" in data["ingestion"]["patterns"]
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
 
-    def test_load_json_config(self):
-        """Test loading JSON config file."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+JSON_CONFIG = {
+    "neo4j": {
+        "uri": "bolt://test:7687",
+        "user": "test_user",
+    }
+}
 
-        json_content = {
-            "neo4j": {
-                "uri": "bolt://test:7687",
-                "user": "test_user",
-            }
-        }
-        config_path.write_text(json.dumps(json_content))
-
-        try:
-            data = load_config_file(config_path)
-            assert data["neo4j"]["uri"] == "bolt://test:7687"
-            assert data["neo4j"]["user"] == "test_user"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
-
-    def test_load_toml_config(self):
-        """Test loading TOML config file."""
-        pytest.importorskip("tomli")  # Skip if tomli not installed
-
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / "falkor.toml"
-
-        toml_content = """
+TOML_CONFIG = """
 [neo4j]
 uri = "bolt://test:7687"
 user = "test_user"
@@ -235,201 +256,242 @@ user = "test_user"
 [ingestion]
 patterns = ["**/*.py", "**/*.js"]
 """
-        config_path.write_text(toml_content)
 
-        try:
-            data = load_config_file(config_path)
-            assert data["neo4j"]["uri"] == "bolt://test:7687"
-            assert data["neo4j"]["user"] == "test_user"
+
+class TestConfigFileLoading:
+    """Test loading configuration from files."""
+
+    @pytest.mark.parametrize("filename,content,has_patterns", [
+        pytest.param(".falkorrc", YAML_CONFIG, True, marks=requires_yaml, id="yaml"),
+        pytest.param(".falkorrc", json.dumps(JSON_CONFIG), False, id="json"),
+        pytest.param("falkor.toml", TOML_CONFIG, True, marks=requires_toml, id="toml"),
+    ])
+    def test_load_config_formats(self, tmp_path, filename, content, has_patterns):
+        """Test loading YAML, JSON and TOML config files."""
+        config_path = tmp_path / filename
+        config_path.write_text(content)
+
+        data = load_config_file(config_path)
+        assert data["neo4j"]["uri"] == "bolt://test:7687"
+        assert data["neo4j"]["user"] == "test_user"
+        if has_patterns:
             assert "**/*.js" in data["ingestion"]["patterns"]
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
 
     def test_load_config_file_not_found(self):
         """Test error when config file doesn't exist."""
         with pytest.raises(ConfigError, match="not found"):
             load_config_file(Path("/nonexistent/config.yaml"))
 
-    def test_load_config_invalid_format(self):
+    def test_load_config_invalid_format(self, tmp_path):
         """Test error with unsupported file format."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / "config.xml"
+        config_path = tmp_path / "config.xml"
         config_path.write_text("<config></config>")
 
-        try:
-            with pytest.raises(ConfigError, match="Unsupported"):
-                load_config_file(config_path)
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        with pytest.raises(ConfigError, match="Unsupported"):
+            load_config_file(config_path)
+
+    def test_load_config_file_cached_until_modified(self, tmp_path):
+        """Test that unchanged files are parsed once and edits are picked up."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"neo4j": {"user": "first"}}))
+
+        with patch("repotoire.config.json.loads", wraps=json.loads) as loads:
+            first = load_config_file(config_path)
+            first["neo4j"]["user"] = "mutated"
+            second = load_config_file(config_path)
+            assert loads.call_count == 1
+        assert second["neo4j"]["user"] == "first"
+
+        config_path.write_text(json.dumps({"neo4j": {"user": "second!"}}))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config_file(config_path)["neo4j"]["user"] == "second!"
 
 
 class TestConfigFileSearch:
     """Test hierarchical config file search."""
 
-    def test_find_config_in_current_dir(self):
+    def test_find_config_in_current_dir(self, tmp_path):
         """Test finding .falkorrc in current directory."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text("{}")
 
-        try:
-            found = find_config_file(Path(temp_dir))
-            assert found == config_path
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        found = find_config_file(tmp_path)
+        assert found == config_path
 
-    def test_find_toml_config_in_current_dir(self):
+    def test_find_toml_config_in_current_dir(self, tmp_path):
         """Test finding falkor.toml in current directory."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / "falkor.toml"
-        config_path.write_text("")
-
-        try:
-            found = find_config_file(Path(temp_dir))
-            assert found == config_path
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
-
-    def test_find_config_in_parent_dir(self):
+        config_path = tmp_path / "falkor.toml"
+        config_path.touch()
+
+        found = find_config_file(tmp_path)
+        assert found == config_path
+
+    def test_find_config_in_parent_dir(self, tmp_path):
         """Test finding config in parent directory."""
-        temp_dir = tempfile.mkdtemp()
-        parent = Path(temp_dir)
+        parent = tmp_path
         child = parent / "subdir"
         child.mkdir()
 
         config_path = parent / ".falkorrc"
         config_path.write_text("{}")
 
-        try:
-            found = find_config_file(child)
-            assert found == config_path
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        found = find_config_file(child)
+        assert found == config_path
 
-    def test_find_config_prefers_falkorrc(self):
+    def test_find_config_prefers_falkorrc(self, tmp_path):
         """Test that .falkorrc is preferred over falkor.toml."""
-        temp_dir = tempfile.mkdtemp()
-        falkorrc = Path(temp_dir) / ".falkorrc"
-        toml_file = Path(temp_dir) / "falkor.toml"
+        falkorrc = tmp_path / ".falkorrc"
+        toml_file = tmp_path / "falkor.toml"
 
         falkorrc.write_text("{}")
-        toml_file.write_text("")
+        toml_file.touch()
 
-        try:
-            found = find_config_file(Path(temp_dir))
-            assert found == falkorrc
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        found = find_config_file(tmp_path)
+        assert found == falkorrc
 
-    def test_find_config_returns_none(self):
+    def test_find_config_returns_none(self, tmp_path):
         """Test returns None when no config found."""
-        temp_dir = tempfile.mkdtemp()
+        found = find_config_file(tmp_path)
+        assert found is None
+
+    def test_find_config_does_not_cache_misses(self, tmp_path):
+        """Test a config file created after a failed search is found."""
+        assert find_config_file(tmp_path) is None
+
+        config_path = tmp_path / "falkor.toml"
+        config_path.touch()
+
+        assert find_config_file(tmp_path) == config_path
+
+    def test_find_config_follows_home(self, tmp_path, monkeypatch):
+        """Test cached lookups are keyed on the home directory."""
+        project = tmp_path / "project"
+        project.mkdir()
+        for name in ("home_a", "home_b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / ".reporc").write_text("{}")
 
-        try:
-            found = find_config_file(Path(temp_dir))
-            assert found is None
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        monkeypatch.setenv("HOME", str(tmp_path / "home_a"))
+        assert find_config_file(project) == tmp_path / "home_a" / ".reporc"
+
+        monkeypatch.setenv("HOME", str(tmp_path / "home_b"))
+        assert find_config_file(project) == tmp_path / "home_b" / ".reporc"
+
+    def test_find_config_skips_directories(self, tmp_path):
+        """Test that a directory named like a config file is ignored."""
+        parent = tmp_path
+        child = parent / "subdir"
+        child.mkdir()
+        (child / "falkor.toml").mkdir()
+
+        config_path = parent / "falkor.toml"
+        config_path.touch()
+
+        found = find_config_file(child)
+        assert found == config_path
 
 
 class TestLoadConfig:
     """Test high-level config loading."""
 
-    def test_load_config_explicit_file(self):
+    def test_load_config_explicit_file(self, monkeypatch):
         """Test loading with explicit config file path."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / "myconfig.json"
-        config_path.write_text('{"neo4j": {"uri": "bolt://custom:7687"}}')
+        # Only the wiring is under test here; file parsing is covered above
+        loaded = []
 
-        try:
-            config = load_config(config_file=config_path)
-            assert config.neo4j.uri == "bolt://custom:7687"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        def fake_load_config_file(path):
+            loaded.append(path)
+            return {"neo4j": {"uri": "bolt://custom:7687"}}
 
-    def test_load_config_search(self):
+        monkeypatch.setattr("repotoire.config.load_config_file", fake_load_config_file)
+
+        config = load_config(config_file="myconfig.json")
+        assert config.neo4j.uri == "bolt://custom:7687"
+        assert loaded == [Path("myconfig.json")]
+
+    def test_load_config_search(self, tmp_path):
         """Test loading via hierarchical search."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text('{"neo4j": {"user": "custom"}}')
 
-        try:
-            config = load_config(search_path=Path(temp_dir))
-            assert config.neo4j.user == "custom"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        config = load_config(search_path=tmp_path)
+        assert config.neo4j.user == "custom"
 
-    def test_load_config_defaults(self):
+    def test_load_config_defaults(self, tmp_path):
         """Test loading returns defaults when no config found."""
-        temp_dir = tempfile.mkdtemp()
-
-        try:
-            config = load_config(search_path=Path(temp_dir))
-            # Should have defaults
-            assert config.neo4j.uri == "bolt://localhost:7687"
-            assert config.ingestion.patterns == ["**/*.py"]
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+        config = load_config(search_path=tmp_path)
+        # Should have defaults
+        assert config.neo4j.uri == "bolt://localhost:7687"
+        assert config.ingestion.patterns == ["**/*.py"]
 
-    def test_load_config_with_env_vars(self):
+    def test_load_config_with_env_vars(self, tmp_path):
         """Test that environment variables are expanded."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text('{"neo4j": {"password": "${TEST_PASSWORD}"}}')
 
-        try:
-            with patch.dict("os.environ", {"TEST_PASSWORD": "secret123"}):
-                config = load_config(config_file=config_path)
-                assert config.neo4j.password == "secret123"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
-
+        with set_env(TEST_PASSWORD="secret123"):
+            config = load_config(config_file=config_path)
+            assert config.neo4j.password == "secret123"
 
-class TestGenerateConfigTemplate:
-    """Test config template generation."""
 
-    def test_generate_yaml_template(self):
-        """Test generating YAML template."""
-        pytest.importorskip("yaml")
+@pytest.fixture(scope="session")
+def config_template():
+    """Return a getter that generates each template format once per session."""
+    templates = {}
 
-        template = generate_config_template(format="yaml")
+    def get(format):
+        if format not in templates:
+            templates[format] = generate_config_template(format=format)
+        return templates[format]
 
-        assert "neo4j:" in template
-        assert "ingestion:" in template
-        assert "patterns:" in template
-        assert "bolt://localhost:7687" in template
+    return get
 
-    def test_generate_json_template(self):
-        """Test generating JSON template."""
-        template = generate_config_template(format="json")
 
-        assert '"neo4j"' in template
-        assert '"ingestion"' in template
-        assert '"patterns"' in template
+class TestGenerateConfigTemplate:
+    """Test config template generation."""
 
-        # Verify it's valid JSON
-        data = json.loads(template)
+    @pytest.mark.parametrize("format,expected", [
+        pytest.param(
+            "yaml",
+            ["neo4j:", "ingestion:", "patterns:", "bolt://localhost:7687"],
+            marks=requires_yaml,
+            id="yaml",
+        ),
+        pytest.param("json", ['"neo4j"', '"ingestion"', '"patterns"'], id="json"),
+        pytest.param(
+            "toml",
+            ["[neo4j]", "[ingestion]", 'uri = "bolt://localhost:7687"'],
+            marks=requires_toml,
+            id="toml",
+        ),
+    ])
+    def test_generate_template(self, config_template, format, expected):
+        """Test generating a template in each supported format."""
+        template = config_template(format)
+
+        for needle in expected:
+            assert needle in template
+
+    def test_generate_json_template_is_valid(self, config_template):
+        """Test the JSON template parses and keeps its comment key."""
+        data = json.loads(config_template("json"))
         assert "neo4j" in data
         assert "_comment" in data  # Comment is stored as key
 
-    def test_generate_toml_template(self):
-        """Test generating TOML template."""
-        template = generate_config_template(format="toml")
+    @requires_toml
+    @requires_toml_w
+    def test_toml_writers_agree(self, config_template, monkeypatch):
+        """Test the tomli-w template parses the same as the manual one."""
+        written = config_module.tomli.loads(config_template("toml"))
+
+        monkeypatch.setattr(config_module, "HAS_TOML_W", False)
+        manual = config_module.tomli.loads(generate_config_template(format="toml"))
 
-        assert "[neo4j]" in template
-        assert "[ingestion]" in template
-        assert 'uri = "bolt://localhost:7687"' in template
+        assert written == manual
+        # TOML has no null; unset optional values become empty strings
+        assert written["neo4j"]["password"] == ""
+        assert written["logging"]["file"] == ""
 
     def test_generate_invalid_format(self):
         """Test error with invalid format."""
@@ -442,11 +504,11 @@ class TestEnvironmentVariableLoading:
 
     def test_load_from_env_neo4j(self):
         """Test loading Neo4j config from environment."""
-        with patch.dict("os.environ", {
-            "FALKOR_NEO4J_URI": "bolt://prod:7687",
-            "FALKOR_NEO4J_USER": "admin",
-            "FALKOR_NEO4J_PASSWORD": "secret123",
-        }):
+        with set_env(
+            FALKOR_NEO4J_URI="bolt://prod:7687",
+            FALKOR_NEO4J_USER="admin",
+            FALKOR_NEO4J_PASSWORD="secret123",
+        ):
             data = load_config_from_env()
 
             assert data["neo4j"]["uri"] == "bolt://prod:7687"
@@ -455,12 +517,12 @@ class TestEnvironmentVariableLoading:
 
     def test_load_from_env_ingestion(self):
         """Test loading ingestion config from environment."""
-        with patch.dict("os.environ", {
-            "FALKOR_INGESTION_PATTERNS": "**/*.py,**/*.js,**/*.ts",
-            "FALKOR_INGESTION_FOLLOW_SYMLINKS": "true",
-            "FALKOR_INGESTION_MAX_FILE_SIZE_MB": "20.5",
-            "FALKOR_INGESTION_BATCH_SIZE": "200",
-        }):
+        with set_env(
+            FALKOR_INGESTION_PATTERNS="**/*.py,**/*.js,**/*.ts",
+            FALKOR_INGESTION_FOLLOW_SYMLINKS="true",
+            FALKOR_INGESTION_MAX_FILE_SIZE_MB="20.5",
+            FALKOR_INGESTION_BATCH_SIZE="200",
+        ):
             data = load_config_from_env()
 
             assert data["ingestion"]["patterns"] == ["**/*.py", "**/*.js", "**/*.ts"]
@@ -470,11 +532,11 @@ class TestEnvironmentVariableLoading:
 
     def test_load_from_env_logging(self):
         """Test loading logging config from environment."""
-        with patch.dict("os.environ", {
-            "FALKOR_LOG_LEVEL": "debug",
-            "FALKOR_LOG_FORMAT": "json",
-            "FALKOR_LOG_FILE": "logs/test.log",
-        }):
+        with set_env(
+            FALKOR_LOG_LEVEL="debug",
+            FALKOR_LOG_FORMAT="json",
+            FALKOR_LOG_FILE="logs/test.log",
+        ):
             data = load_config_from_env()
 
             assert data["logging"]["level"] == "DEBUG"
@@ -483,11 +545,11 @@ class TestEnvironmentVariableLoading:
 
     def test_load_from_env_logging_unprefixed(self):
         """Test loading logging config from unprefixed env vars."""
-        with patch.dict("os.environ", {
-            "LOG_LEVEL": "warning",
-            "LOG_FORMAT": "json",
-            "LOG_FILE": "app.log",
-        }):
+        with set_env(
+            LOG_LEVEL="warning",
+            LOG_FORMAT="json",
+            LOG_FILE="app.log",
+        ):
             data = load_config_from_env()
 
             assert data["logging"]["level"] == "WARNING"
@@ -496,19 +558,19 @@ class TestEnvironmentVariableLoading:
 
     def test_load_from_env_logging_prefix_takes_precedence(self):
         """Test that FALKOR_ prefix takes precedence over unprefixed."""
-        with patch.dict("os.environ", {
-            "FALKOR_LOG_LEVEL": "debug",
-            "LOG_LEVEL": "info",
-        }):
+        with set_env(
+            FALKOR_LOG_LEVEL="debug",
+            LOG_LEVEL="info",
+        ):
             data = load_config_from_env()
             assert data["logging"]["level"] == "DEBUG"
 
     def test_load_from_env_invalid_numbers(self):
         """Test handling of invalid numeric values."""
-        with patch.dict("os.environ", {
-            "FALKOR_INGESTION_MAX_FILE_SIZE_MB": "not_a_number",
-            "FALKOR_INGESTION_BATCH_SIZE": "invalid",
-        }):
+        with set_env(
+            FALKOR_INGESTION_MAX_FILE_SIZE_MB="not_a_number",
+            FALKOR_INGESTION_BATCH_SIZE="invalid",
+        ):
             data = load_config_from_env()
             # Should not include invalid values
             assert "max_file_size_mb" not in data.get("ingestion", {})
@@ -524,108 +586,82 @@ class TestEnvironmentVariableLoading:
 class TestFallbackChain:
     """Test configuration fallback chain."""
 
-    def test_fallback_defaults_only(self):
+    def test_fallback_defaults_only(self, tmp_path):
         """Test config with only defaults."""
-        temp_dir = tempfile.mkdtemp()
-
-        try:
-            with patch.dict("os.environ", {}, clear=True):
-                config = load_config(search_path=Path(temp_dir))
+        with patch.dict("os.environ", {}, clear=True):
+            config = load_config(search_path=tmp_path)
 
-                # Should have defaults
-                assert config.neo4j.uri == "bolt://localhost:7687"
-                assert config.neo4j.user == "neo4j"
-                assert config.ingestion.patterns == ["**/*.py"]
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+            # Should have defaults
+            assert config.neo4j.uri == "bolt://localhost:7687"
+            assert config.neo4j.user == "neo4j"
+            assert config.ingestion.patterns == ["**/*.py"]
 
-    def test_fallback_file_overrides_defaults(self):
+    def test_fallback_file_overrides_defaults(self, tmp_path):
         """Test config file overrides defaults."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text('{"neo4j": {"uri": "bolt://file:7687"}}')
 
-        try:
-            with patch.dict("os.environ", {}, clear=True):
-                config = load_config(search_path=Path(temp_dir))
+        with patch.dict("os.environ", {}, clear=True):
+            config = load_config(search_path=tmp_path)
 
-                # File value should override default
-                assert config.neo4j.uri == "bolt://file:7687"
-                # Default should still be present
-                assert config.neo4j.user == "neo4j"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+            # File value should override default
+            assert config.neo4j.uri == "bolt://file:7687"
+            # Default should still be present
+            assert config.neo4j.user == "neo4j"
 
-    def test_fallback_env_overrides_file(self):
+    def test_fallback_env_overrides_file(self, tmp_path):
         """Test environment variables override config file."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text('{"neo4j": {"uri": "bolt://file:7687"}}')
 
-        try:
-            with patch.dict("os.environ", {"FALKOR_NEO4J_URI": "bolt://env:7687"}):
-                config = load_config(search_path=Path(temp_dir))
+        with set_env(FALKOR_NEO4J_URI="bolt://env:7687"):
+            config = load_config(search_path=tmp_path)
 
-                # Env value should override file
-                assert config.neo4j.uri == "bolt://env:7687"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+            # Env value should override file
+            assert config.neo4j.uri == "bolt://env:7687"
 
-    def test_fallback_chain_complete(self):
+    def test_fallback_chain_complete(self, tmp_path):
         """Test complete fallback chain."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text(json.dumps({
             "neo4j": {"uri": "bolt://file:7687", "user": "file_user"},
             "ingestion": {"patterns": ["**/*.py", "**/*.js"]},
         }))
 
-        try:
-            with patch.dict("os.environ", {
-                "FALKOR_NEO4J_URI": "bolt://env:7687",
-                "FALKOR_INGESTION_BATCH_SIZE": "150",
-            }):
-                config = load_config(search_path=Path(temp_dir))
+        with set_env(
+            FALKOR_NEO4J_URI="bolt://env:7687",
+            FALKOR_INGESTION_BATCH_SIZE="150",
+        ):
+            config = load_config(search_path=tmp_path)
 
-                # Env var overrides file
-                assert config.neo4j.uri == "bolt://env:7687"
+            # Env var overrides file
+            assert config.neo4j.uri == "bolt://env:7687"
 
-                # File overrides default
-                assert config.neo4j.user == "file_user"
-                assert config.ingestion.patterns == ["**/*.py", "**/*.js"]
+            # File overrides default
+            assert config.neo4j.user == "file_user"
+            assert config.ingestion.patterns == ["**/*.py", "**/*.js"]
 
-                # Env var provides new value
-                assert config.ingestion.batch_size == 150
+            # Env var provides new value
+            assert config.ingestion.batch_size == 150
 
-                # Default remains
-                assert config.ingestion.follow_symlinks is False
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+            # Default remains
+            assert config.ingestion.follow_symlinks is False
 
     def test_fallback_disable_env(self):
         """Test disabling environment variable loading."""
-        with patch.dict("os.environ", {"FALKOR_NEO4J_URI": "bolt://env:7687"}):
+        with set_env(FALKOR_NEO4J_URI="bolt://env:7687"):
             config = load_config(use_env=False)
 
             # Should not load from env
             assert config.neo4j.uri == "bolt://localhost:7687"  # default
 
-    def test_fallback_chain_with_expansion(self):
+    def test_fallback_chain_with_expansion(self, tmp_path):
         """Test that environment variable expansion works in config files."""
-        temp_dir = tempfile.mkdtemp()
-        config_path = Path(temp_dir) / ".falkorrc"
+        config_path = tmp_path / ".falkorrc"
         config_path.write_text('{"neo4j": {"password": "${NEO4J_PASSWORD}"}}')
 
-        try:
-            with patch.dict("os.environ", {"NEO4J_PASSWORD": "expanded_secret"}):
-                config = load_config(search_path=Path(temp_dir))
+        with set_env(NEO4J_PASSWORD="expanded_secret"):
+            config = load_config(search_path=tmp_path)
 
-                # ${VAR} should be expanded
-                assert config.neo4j.password == "expanded_secret"
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir)
+            # ${VAR} should be expanded
+            assert config.neo4j.password == "expanded_secret"
@@ -1,10 +1,18 @@
 """Unit tests for graph query utilities."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 from repotoire.graph.queries.patterns import CypherPatterns
 from repotoire.graph.queries.builders import QueryBuilder, DetectorQueryBuilder
 from repotoire.graph.queries.traversal import GraphTraversal
+from repotoire.validation import ValidationError
+
+
+def _stream(rows):
+    """Mimic Neo4jClient.execute_query_stream() over the given rows."""
+    stream = MagicMock()
+    stream.__enter__.return_value = iter(rows)
+    return stream
 
 
 class TestQueryBuilder:
@@ -173,6 +181,7 @@ class TestCypherPatterns:
         """Create a mock Neo4j client."""
         client = Mock()
         client.execute_query = Mock()
+        client.execute_query_stream = Mock(return_value=_stream([]))
         return client
 
     @pytest.fixture
@@ -181,9 +190,12 @@ class TestCypherPatterns:
         return CypherPatterns(mock_client)
 
     def test_find_cycles(self, patterns, mock_client):
-        """Test cycle detection query."""
-        mock_client.execute_query.return_value = [
-            {"nodes": ["file_a.py", "file_b.py", "file_c.py"], "length": 3}
+        """Test cycle detection via GDS strongly connected components."""
+        mock_client.execute_query.side_effect = [
+            [{"version": "2.6.0"}],
+            [{"graph_name": "g"}],
+            [{"nodes": ["file_a.py", "file_b.py", "file_c.py"], "length": 3}],
+            [{"graphName": "g"}],
         ]
 
         result = patterns.find_cycles(
@@ -194,16 +206,15 @@ class TestCypherPatterns:
             limit=50
         )
 
-        # Check query was called
-        assert mock_client.execute_query.called
-        query = mock_client.execute_query.call_args[0][0]
-        params = mock_client.execute_query.call_args[1]["parameters"]
+        calls = mock_client.execute_query.call_args_list
+        assert "MATCH (source:File)" in calls[1][0][0]
+        assert "(source)-[:IMPORTS]->(target:File)" in calls[1][0][0]
 
-        assert "MATCH (n1:File)" in query
-        assert "MATCH (n2:File)" in query
+        query = calls[2][0][0]
+        params = calls[2][1]["parameters"]
+        assert "gds.scc.stream" in query
         # Check for parameterized query (not hardcoded values)
-        assert "shortestPath((n1)-[:IMPORTS*$min_length..$max_length]->(n2))" in query
-        assert "shortestPath((n2)-[:IMPORTS*$min_length..$max_length]->(n1))" in query
+        assert "size(cycle) >= $min_length AND size(cycle) <= $max_length" in query
         assert "LIMIT $limit" in query
 
         # Verify parameters
@@ -211,17 +222,67 @@ class TestCypherPatterns:
         assert params["max_length"] == 10
         assert params["limit"] == 50
 
+        # Projection is always dropped
+        assert "gds.graph.drop" in calls[3][0][0]
+
         # Check result
         assert len(result) == 1
         assert result[0]["length"] == 3
         assert len(result[0]["nodes"]) == 3
 
+    def test_find_cycles_without_gds(self, patterns, mock_client):
+        """Test cycle detection falls back to client-side Tarjan SCC."""
+        adjacency = [
+            {"node": "n1", "file_path": "a.py", "targets": ["n2"]},
+            {"node": "n2", "file_path": "b.py", "targets": ["n3"]},
+            {"node": "n3", "file_path": "c.py", "targets": ["n1", "n4"]},
+            {"node": "n4", "file_path": "d.py", "targets": ["n5"]},
+            {"node": "n5", "file_path": "e.py", "targets": ["n4"]},
+            {"node": "n6", "file_path": "f.py", "targets": []},
+        ]
+        mock_client.execute_query.side_effect = [Exception("no gds"), adjacency]
+
+        result = patterns.find_cycles("File", "IMPORTS", min_length=2, max_length=10, limit=50)
+
+        assert mock_client.execute_query.call_count == 2
+        assert [c["length"] for c in result] == [3, 2]
+        assert sorted(result[0]["nodes"]) == ["a.py", "b.py", "c.py"]
+        assert sorted(result[1]["nodes"]) == ["d.py", "e.py"]
+
+        mock_client.execute_query.side_effect = [adjacency]
+        assert patterns.find_cycles("File", "IMPORTS", max_length=2) == [result[1]]
+
+    def test_find_cycles_reports_large_components_by_default(self, patterns, mock_client):
+        """Test components of any size are reported unless max_length is given."""
+        ring = [
+            {"node": f"n{i}", "file_path": f"{i}.py", "targets": [f"n{(i + 1) % 20}"]}
+            for i in range(20)
+        ]
+        mock_client.execute_query.side_effect = [Exception("no gds"), ring]
+
+        result = patterns.find_cycles("File", "IMPORTS")
+
+        assert [c["length"] for c in result] == [20]
+
+    def test_find_cycles_gds_unbounded_and_unsorted(self, patterns, mock_client):
+        """Test the GDS query omits the size cap and ORDER BY unless requested."""
+        mock_client.execute_query.side_effect = [[{"version": "2.6.0"}], [], [], []]
+
+        patterns.find_cycles(sort=False)
+
+        query = mock_client.execute_query.call_args_list[2][0][0]
+        params = mock_client.execute_query.call_args_list[2][1]["parameters"]
+        assert "$max_length" not in query
+        assert "max_length" not in params
+        assert "ORDER BY" not in query
+        assert "LIMIT $limit" in query
+
     def test_calculate_degree_centrality(self, patterns, mock_client):
         """Test degree centrality calculation."""
-        mock_client.execute_query.return_value = [
+        mock_client.execute_query_stream.return_value = _stream([
             {"node": "node1", "name": "file_a.py", "file_path": "/path/file_a.py", "degree": 15},
             {"node": "node2", "name": "file_b.py", "file_path": "/path/file_b.py", "degree": 10},
-        ]
+        ])
 
         result = patterns.calculate_degree_centrality(
             node_label="File",
@@ -230,15 +291,50 @@ class TestCypherPatterns:
         )
 
         # Check query
-        query = mock_client.execute_query.call_args[0][0]
+        query = mock_client.execute_query_stream.call_args[0][0]
         assert "MATCH (n:File)" in query
         assert "OPTIONAL MATCH (n)-[:IMPORTS]->" in query
         assert "count(connected) AS degree" in query
+        assert "n.name AS name" in query
 
-        # Check result
+        # Check result (streamed lazily, in one round-trip)
+        result = list(result)
         assert len(result) == 2
         assert result[0]["degree"] == 15
+        assert result[0]["name"] == "file_a.py"
         assert result[1]["degree"] == 10
+        assert result[1]["file_path"] == "/path/file_b.py"
+        mock_client.execute_query.assert_not_called()
+
+    def test_degree_centrality_releases_stream_when_closed(self, patterns, mock_client):
+        """Test that closing the iterator early exits the query stream."""
+        stream = _stream([
+            {"node": "node1", "name": "a.py", "file_path": "/a.py", "degree": 2},
+            {"node": "node2", "name": "b.py", "file_path": "/b.py", "degree": 1},
+        ])
+        mock_client.execute_query_stream.return_value = stream
+
+        result = patterns.calculate_degree_centrality()
+        assert next(result)["name"] == "a.py"
+        stream.__exit__.assert_not_called()
+
+        result.close()
+        stream.__exit__.assert_called_once()
+
+    def test_degree_centrality_sort_and_top_k(self, patterns, mock_client):
+        """Test that ordering is only requested when consumed."""
+        list(patterns.calculate_degree_centrality(sort=False))
+        query = mock_client.execute_query_stream.call_args[0][0]
+        assert "ORDER BY" not in query
+        assert "LIMIT" not in query
+
+        mock_client.execute_query_stream.return_value = _stream([])
+        list(patterns.calculate_degree_centrality(top_k=5, sort=False))
+        query = mock_client.execute_query_stream.call_args[0][0]
+        params = mock_client.execute_query_stream.call_args[1]["parameters"]
+        assert "ORDER BY degree DESC" in query
+        assert "LIMIT $top_k" in query
+        assert params == {"top_k": 5}
 
     def test_find_shortest_path(self, patterns, mock_client):
         """Test shortest path finding."""
@@ -265,9 +361,9 @@ class TestCypherPatterns:
         query = mock_client.execute_query.call_args[0][0]
         params = mock_client.execute_query.call_args[1]["parameters"]
 
-        # Check for parameterized query (not hardcoded max_depth)
-        assert "shortestPath((source)-[:CALLS*1..$max_depth]-(target))" in query
-        assert params == {"source_id": "node1", "target_id": "node3", "max_depth": 5}
+        # Variable-length bounds cannot be parameters; the depth is validated
+        assert "shortestPath((source)-[:CALLS*1..5]-(target))" in query
+        assert params == {"source_id": "node1", "target_id": "node3"}
 
         # Check result
         assert result is not None
@@ -285,9 +381,34 @@ class TestCypherPatterns:
 
         assert result is None
 
+    def test_find_shortest_paths_batch(self, patterns, mock_client):
+        """Test batched shortest paths use one query and keep input order."""
+        mock_client.execute_query.return_value = [
+            {"source_id": "n3", "target_id": "n4", "path": Mock(), "length": 1, "nodes": []},
+            {"source_id": "n1", "target_id": "n2", "path": Mock(), "length": 2, "nodes": []},
+        ]
+
+        result = patterns.find_shortest_paths(
+            [("n1", "n2"), ("n1", "n5"), ("n3", "n4")], "CALLS", max_depth=4
+        )
+
+        assert mock_client.execute_query.call_count == 1
+        query = mock_client.execute_query.call_args[0][0]
+        params = mock_client.execute_query.call_args[1]["parameters"]
+        assert "UNWIND $pairs AS pair" in query
+        # Variable-length bounds cannot be parameters; the depth is validated
+        assert "shortestPath((source)-[:CALLS*1..4]-(target))" in query
+        assert params["pairs"][1] == {"source_id": "n1", "target_id": "n5"}
+
+        assert [r and r["length"] for r in result] == [2, None, 1]
+        assert patterns.find_shortest_paths([]) == []
+
+        with pytest.raises(ValidationError):
+            patterns.find_shortest_paths([("n1", "n2")], max_depth="4]-(x) DELETE x //")
+
     def test_find_bottlenecks(self, patterns, mock_client):
         """Test bottleneck node detection."""
-        mock_client.execute_query.return_value = [
+        mock_client.execute_query_stream.return_value = _stream([
             {
                 "node": "node1",
                 "name": "middleware.py",
@@ -296,7 +417,7 @@ class TestCypherPatterns:
                 "out_degree": 8,
                 "degree": 20
             }
-        ]
+        ])
 
         result = patterns.find_bottlenecks(
             node_label="File",
@@ -305,8 +426,8 @@ class TestCypherPatterns:
         )
 
         # Check query
-        query = mock_client.execute_query.call_args[0][0]
-        params = mock_client.execute_query.call_args[1]["parameters"]
+        query = mock_client.execute_query_stream.call_args[0][0]
+        params = mock_client.execute_query_stream.call_args[1]["parameters"]
 
         assert "count(DISTINCT out) AS out_degree" in query
         assert "count(DISTINCT in) AS in_degree" in query
@@ -314,7 +435,8 @@ class TestCypherPatterns:
         assert "WHERE total_degree >= $threshold" in query
         assert params["threshold"] == 10
 
-        # Check result
+        # Check result (streamed lazily)
+        result = list(result)
         assert len(result) == 1
         assert result[0]["degree"] == 20
         assert result[0]["in_degree"] == 12
@@ -347,6 +469,84 @@ class TestCypherPatterns:
 
         assert result == 0.0
 
+    def test_compute_graph_metrics(self, patterns, mock_client):
+        """Test degree, bottleneck and clustering metrics from one query."""
+        # a -> b, a -> c, b -> c (a triangle) and c -> d
+        mock_client.execute_query.return_value = [
+            {"node": "a", "name": "a.py", "file_path": "a.py", "outs": ["b", "c"], "ins": []},
+            {"node": "b", "name": "b.py", "file_path": "b.py", "outs": ["c"], "ins": ["a"]},
+            {"node": "c", "name": "c.py", "file_path": "c.py", "outs": ["d"], "ins": ["a", "b"]},
+            {"node": "d", "name": "d.py", "file_path": "d.py", "outs": [], "ins": ["c"]},
+        ]
+
+        metrics = patterns.compute_graph_metrics("File", "IMPORTS", bottleneck_threshold=2)
+
+        assert mock_client.execute_query.call_count == 1
+        query = mock_client.execute_query.call_args[0][0]
+        assert "MATCH (n:File)" in query
+        assert "collect(DISTINCT elementId(out)) AS outs" in query
+
+        degrees = {d["node"]: d for d in metrics["degrees"]}
+        assert degrees["c"]["in_degree"] == 2
+        assert degrees["c"]["out_degree"] == 1
+        assert degrees["c"]["degree"] == 3
+        assert [b["node"] for b in metrics["bottlenecks"]] == ["c", "a", "b"]
+        # Local coefficients: a = 1, b = 1, c = 1/3 (d has one neighbour)
+        assert metrics["clustering_coefficient"] == pytest.approx(7 / 9)
+
+    def test_find_connected_components_without_gds(self, patterns, mock_client):
+        """Test components are labelled client-side from a single edge-list query."""
+        adjacency = [
+            {"node": "n1", "file_path": "a.py", "targets": ["n2"]},
+            {"node": "n2", "file_path": "b.py", "targets": []},
+            {"node": "n3", "file_path": "c.py", "targets": ["n2"]},
+            {"node": "n4", "file_path": "d.py", "targets": []},
+        ]
+        mock_client.execute_query.side_effect = [Exception("no gds"), adjacency]
+
+        result = list(patterns.find_connected_components("File", "IMPORTS"))
+
+        assert mock_client.execute_query.call_count == 2
+        query = mock_client.execute_query.call_args[0][0]
+        assert "OPTIONAL MATCH (n)-[:IMPORTS]->(m:File)" in query
+
+        assert len(result) == 2
+        assert result[0]["size"] == 3
+        assert sorted(result[0]["nodes"]) == ["a.py", "b.py", "c.py"]
+        assert result[1] == {"component_id": "n4", "nodes": ["d.py"], "size": 1}
+
+    def test_find_connected_components_with_gds(self, patterns, mock_client):
+        """Test components come from GDS WCC and the projection is dropped."""
+        components = [{"component_id": "n1", "nodes": ["a.py", "b.py"], "size": 2}]
+        mock_client.execute_query.side_effect = [
+            [{"version": "2.6.0"}],
+            [{"graph_name": "g"}],
+            components,
+            [{"graphName": "g"}],
+        ]
+
+        result = list(patterns.find_connected_components("File", "IMPORTS"))
+
+        queries = [c[0][0] for c in mock_client.execute_query.call_args_list]
+        assert "gds.graph.project" in queries[1]
+        assert "gds.wcc.stream" in queries[2]
+        assert "gds.graph.drop" in queries[3]
+        assert result == components
+
+    def test_identifiers_validated_once(self, patterns, mock_client):
+        """Test labels/relationship types are validated once per instance."""
+        mock_client.execute_query.return_value = []
+
+        with patch(
+            "repotoire.graph.queries.patterns.validate_identifier",
+            side_effect=lambda name, context: name,
+        ) as mock_validate:
+            patterns.find_bottlenecks("File", "IMPORTS")
+            patterns.find_bottlenecks("File", "IMPORTS")
+            patterns.calculate_clustering_coefficient("File", "IMPORTS")
+
+        assert mock_validate.call_count == 2
+
 
 class TestGraphTraversal:
     """Test GraphTraversal BFS/DFS utilities."""
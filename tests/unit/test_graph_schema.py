@@ -0,0 +1,135 @@
+"""Unit tests for graph schema management."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from repotoire.graph.client import Neo4jClient
+from repotoire.graph.schema import _LOOKUP_INDEXES, GraphSchema, _quote_name
+
+
+class TestGraphSchema:
+    """Test GraphSchema DDL submission."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock Neo4j client."""
+        client = Mock()
+        client.execute_query = Mock(return_value=[])
+        client.execute_write_batch = Mock()
+        return client
+
+    @pytest.fixture
+    def schema(self, mock_client):
+        """Create GraphSchema instance with mock client."""
+        return GraphSchema(mock_client)
+
+    def test_initialize_sends_one_batch(self, schema, mock_client):
+        """Test constraints and indexes are created in a single transaction."""
+        schema.initialize()
+
+        mock_client.execute_write_batch.assert_called_once_with(
+            GraphSchema.CONSTRAINTS + GraphSchema.INDEXES
+        )
+        # Marker lookup before, marker update after
+        assert mock_client.execute_query.call_count == 2
+        assert "SET s.hash = $hash" in mock_client.execute_query.call_args[0][0]
+
+    def test_initialize_skips_unchanged_schema(self, schema, mock_client):
+        """Test a matching stored hash short-circuits the DDL."""
+        schema.initialize()
+        stored_hash = mock_client.execute_query.call_args[1]["parameters"]["hash"]
+        mock_client.reset_mock()
+        mock_client.execute_query.return_value = [{"hash": stored_hash}]
+
+        schema.initialize()
+
+        mock_client.execute_write_batch.assert_not_called()
+        assert mock_client.execute_query.call_count == 1
+
+        schema.initialize(force=True)
+        mock_client.execute_write_batch.assert_called_once()
+
+    def test_initialize_logs_up_to_date_schema(self, schema, mock_client, caplog):
+        """Test an unchanged schema is reported as such, not as created."""
+        schema.initialize()
+        stored_hash = mock_client.execute_query.call_args[1]["parameters"]["hash"]
+        mock_client.execute_query.return_value = [{"hash": stored_hash}]
+        caplog.clear()
+
+        with caplog.at_level("INFO", logger="repotoire.graph.schema"):
+            schema.initialize(enable_vector_search=True)
+
+        assert "Graph schema is up to date" in caplog.messages
+        assert "Schema created successfully" not in caplog.messages
+        mock_client.execute_write_batch.assert_called_with(GraphSchema.VECTOR_INDEXES)
+
+    def test_initialize_does_not_record_partial_schema(self, schema, mock_client):
+        """Test the hash is only stored when every statement applied."""
+        mock_client.execute_write_batch.side_effect = Exception("unsupported index")
+        mock_client.execute_each.return_value = [Exception("bad")]
+
+        schema.initialize()
+
+        mock_client.execute_query.assert_called_once()
+
+    def test_batch_failure_falls_back_to_individual_statements(self, schema, mock_client):
+        """Test a failed batch retries each statement so the rest still applies."""
+        mock_client.execute_write_batch.side_effect = Exception("unsupported index")
+        mock_client.execute_each.return_value = [Exception("bad")] + [None] * (
+            len(GraphSchema.INDEXES) - 1
+        )
+
+        schema.create_indexes()
+
+        mock_client.execute_each.assert_called_once_with(GraphSchema.INDEXES)
+        mock_client.execute_query.assert_not_called()
+
+    def test_client_create_indexes_uses_schema_lookup_indexes(self, mock_client):
+        """Test Neo4jClient.create_indexes creates only the three lookup indexes."""
+        Neo4jClient.create_indexes(mock_client)
+
+        mock_client.execute_write_batch.assert_called_once_with(_LOOKUP_INDEXES)
+        assert len(_LOOKUP_INDEXES) == 3
+        assert set(_LOOKUP_INDEXES) <= set(GraphSchema.INDEXES)
+
+    def test_vector_indexes_batched(self, schema, mock_client):
+        """Test vector indexes are submitted together when supported."""
+        schema.initialize(enable_vector_search=True)
+
+        assert mock_client.execute_write_batch.call_count == 2
+        mock_client.execute_write_batch.assert_called_with(GraphSchema.VECTOR_INDEXES)
+
+    def test_drop_all_batches_drops(self, schema, mock_client, caplog):
+        """Test drop_all lists schema objects then drops them in one batch."""
+        mock_client.execute_query.side_effect = [
+            [{"name": "file_path_unique"}],
+            [{"name": "file_language_idx"}, {"name": "odd`name; MATCH (n) DELETE n"}],
+            [],
+        ]
+
+        with caplog.at_level("INFO", logger="repotoire.graph.schema"):
+            schema.drop_all()
+
+        assert "Schema dropped" in caplog.messages
+        assert mock_client.execute_query.call_count == 3
+        show_indexes = mock_client.execute_query.call_args_list[1]
+        assert "owningConstraint IS NULL AND NOT name IN $builtin" in show_indexes[0][0]
+        assert show_indexes[1]["parameters"] == {
+            "builtin": ["node_label_index", "relationship_type_index"]
+        }
+        assert "_FalkorSchema" in mock_client.execute_query.call_args[0][0]
+        mock_client.execute_write_batch.assert_called_once_with([
+            "DROP CONSTRAINT `file_path_unique`",
+            "DROP INDEX `file_language_idx`",
+            "DROP INDEX `odd``name; MATCH (n) DELETE n`",
+        ])
+
+    @pytest.mark.parametrize("name,quoted", [
+        ("file_path_unique", "`file_path_unique`"),
+        ("índice.v2", "`índice.v2`"),
+        ("idx`; DROP", "`idx``; DROP`"),
+    ])
+    def test_quote_name(self, name, quoted):
+        """Test schema object names are escaped as Cypher identifiers."""
+        assert _quote_name(name) == quoted
@@ -1,5 +1,6 @@
 """Unit tests for IngestionPipeline."""
 
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
@@ -7,7 +8,7 @@ from unittest.mock import Mock, MagicMock, patch
 import pytest
 
 from repotoire.pipeline.ingestion import IngestionPipeline
-from repotoire.parsers import CodeParser
+from repotoire.parsers import CodeParser, hash_file_content
 from repotoire.models import FileEntity, Relationship, RelationshipType, NodeType
 
 
@@ -57,7 +58,6 @@ def temp_repo():
     yield temp_path
 
     # Cleanup
-    import shutil
     shutil.rmtree(temp_dir)
 
 
@@ -156,7 +156,6 @@ class TestFileScanning:
 
             assert len(files) == 0
         finally:
-            import shutil
             shutil.rmtree(temp_dir)
 
 
@@ -232,6 +231,18 @@ def hello():
         # Should have CONTAINS relationships
         assert len(relationships) > 0
 
+    def test_parse_and_extract_shares_relative_path(self, mock_neo4j_client, temp_repo):
+        """Test entities from one file share a single relative path string."""
+        pipeline = IngestionPipeline(str(temp_repo), mock_neo4j_client)
+
+        test_file = temp_repo / "main.py"
+        test_file.write_text("class A:\n    def f(self):\n        pass\n")
+
+        entities, _ = pipeline.parse_and_extract(test_file)
+
+        assert {e.file_path for e in entities} == {"main.py"}
+        assert len({id(e.file_path) for e in entities}) == 1
+
     def test_parse_and_extract_unsupported_language(self, mock_neo4j_client, temp_repo):
         """Test handling of unsupported language."""
         pipeline = IngestionPipeline(str(temp_repo), mock_neo4j_client)
@@ -263,6 +274,68 @@ def hello():
         assert entities == []
         assert relationships == []
 
+    def test_extract_in_workers_matches_serial(self, mock_neo4j_client, temp_repo):
+        """Test process-pool parsing yields the same results in file order."""
+        (temp_repo / "main.py").write_text("def hello():\n    return helper()\n")
+        (temp_repo / "src" / "utils.py").write_text("class Helper:\n    pass\n")
+        (temp_repo / "broken.py").write_text("def broken(:\n")
+        files = [
+            temp_repo / "main.py",
+            temp_repo / "notes.xyz",
+            temp_repo / "broken.py",
+            temp_repo / "src" / "utils.py",
+        ]
+        (temp_repo / "notes.xyz").write_text("no parser")
+
+        serial = IngestionPipeline(str(temp_repo), mock_neo4j_client)
+        expected = [serial.parse_and_extract(f) for f in files]
+
+        parallel = IngestionPipeline(str(temp_repo), mock_neo4j_client, workers=2)
+        results = list(parallel._extract_in_workers(files))
+
+        assert [[e.qualified_name for e in ents] for ents, _ in results] == [
+            [e.qualified_name for e in ents] for ents, _ in expected
+        ]
+        assert results[0][0][0].file_path == "main.py"
+        assert results[1] == ([], []) and results[2] == ([], [])
+        assert parallel.skipped_files == serial.skipped_files
+
+    def test_extract_in_workers_falls_back_on_broken_pool(self, mock_neo4j_client, temp_repo):
+        """Test files from a failed worker chunk are parsed in-process."""
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        class BrokenExecutor:
+            def __init__(self, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+        (temp_repo / "main.py").write_text("def hello():\n    return 1\n")
+        (temp_repo / "broken.py").write_text("def broken(:\n")
+        files = [temp_repo / "main.py", temp_repo / "broken.py"]
+
+        serial = IngestionPipeline(str(temp_repo), mock_neo4j_client)
+        expected = [serial.parse_and_extract(f) for f in files]
+
+        parallel = IngestionPipeline(str(temp_repo), mock_neo4j_client, workers=2)
+        with patch("repotoire.pipeline.ingestion.ProcessPoolExecutor", BrokenExecutor):
+            results = list(parallel._extract_in_workers(files))
+
+        assert [[e.qualified_name for e in ents] for ents, _ in results] == [
+            [e.qualified_name for e in ents] for ents, _ in expected
+        ]
+        assert parallel.skipped_files == serial.skipped_files
+
 
 class TestLoadToGraph:
     """Test loading data to Neo4j graph."""
@@ -418,7 +491,6 @@ class TestErrorHandling:
                 # Should not have loaded any data
                 mock_neo4j_client.batch_create_nodes.assert_not_called()
         finally:
-            import shutil
             shutil.rmtree(temp_dir)
 
     def test_ingest_initializes_schema(self, mock_neo4j_client, temp_repo):
@@ -467,3 +539,37 @@ class TestCustomPatterns:
             files = pipeline.scan(patterns=["**/*.md"])
             assert len(files) == 1
             assert files[0].name == "README.md"
+
+
+class TestIncrementalScan:
+    """Test incremental ingestion change detection."""
+
+    def test_hash_files(self, mock_neo4j_client, temp_repo):
+        """Test files are fingerprinted with hash_file_content."""
+        pipeline = IngestionPipeline(str(temp_repo), mock_neo4j_client)
+        files = [temp_repo / "main.py", temp_repo / "src" / "utils.py"]
+
+        hashes = pipeline._hash_files(files)
+
+        assert hashes == {f: hash_file_content(f.read_bytes()) for f in files}
+
+    def test_only_changed_and_new_files_are_parsed(self, mock_neo4j_client, temp_repo):
+        """Test unchanged files are skipped and changed files re-ingested."""
+        unchanged = temp_repo / "main.py"
+        changed = temp_repo / "src" / "utils.py"
+        metadata = {
+            "main.py": {"hash": hash_file_content(unchanged.read_bytes())},
+            "src/utils.py": {"hash": "stale"},
+        }
+        mock_neo4j_client.get_file_metadata.side_effect = metadata.get
+        mock_neo4j_client.get_all_file_paths.return_value = list(metadata)
+
+        with patch('repotoire.pipeline.ingestion.GraphSchema'):
+            pipeline = IngestionPipeline(str(temp_repo), mock_neo4j_client)
+            pipeline._find_dependent_files = Mock(return_value=[])
+            pipeline.parse_and_extract = Mock(return_value=([], []))
+            pipeline.ingest(incremental=True)
+
+        parsed = {call.args[0] for call in pipeline.parse_and_extract.call_args_list}
+        assert parsed == {changed, temp_repo / "tests" / "test_main.py"}
+        mock_neo4j_client.delete_file_entities.assert_called_once_with("src/utils.py")
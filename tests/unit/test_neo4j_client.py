@@ -10,26 +10,54 @@ from repotoire.graph.client import Neo4jClient
 from repotoire.models import FileEntity, ClassEntity, FunctionEntity, Relationship, RelationshipType
 
 
-@pytest.fixture
+class _FakeResult:
+    """Minimal stand-in for a Neo4j result that only needs to be iterated."""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+def _prime_result(session, rows):
+    """Make session.run() return a result yielding the given rows."""
+    session.run.return_value = _FakeResult(rows)
+
+
+@pytest.fixture(scope="module")
 def mock_driver():
-    """Create a mock Neo4j driver."""
-    driver = MagicMock()
+    """Create a mock Neo4j driver shared by the tests of this module.
+
+    Built once per module (and so once per pytest-xdist worker running it);
+    mock_session resets it before every test.
+    """
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def mock_session(mock_driver):
+    """Reset the shared driver and give each test its own session and result."""
     session = MagicMock()
     result = MagicMock()
 
+    mock_driver.reset_mock(return_value=True, side_effect=True)
+
     # Setup mock chain: driver -> session (as context manager) -> result
-    driver.session.return_value.__enter__.return_value = session
-    driver.session.return_value.__exit__.return_value = None
+    mock_driver.session.return_value.__enter__.return_value = session
+    mock_driver.session.return_value.__exit__.return_value = None
     session.run.return_value = result
     result.__iter__.return_value = []
 
-    return driver
+    return session
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def client(mock_driver):
-    """Create a Neo4jClient with mocked driver."""
-    with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+    """Create a Neo4jClient with mocked driver, shared by the tests of a class."""
+    with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
         mock_gd.driver.return_value = mock_driver
         client = Neo4jClient(
             uri="bolt://localhost:7687",
@@ -40,12 +68,63 @@ def client(mock_driver):
         client.close()
 
 
+# Entities are only passed through to the mocked driver, never mutated,
+# so they are built once per module
+@pytest.fixture(scope="module")
+def sample_file_entities():
+    """Create two file entities."""
+    return [
+        FileEntity(
+            name="test.py",
+            qualified_name="test.py",
+            file_path="test.py",
+            line_start=1,
+            line_end=10,
+            language="python",
+            loc=10
+        ),
+        FileEntity(
+            name="test2.py",
+            qualified_name="test2.py",
+            file_path="test2.py",
+            line_start=1,
+            line_end=20,
+            language="python",
+            loc=20
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_class_entity():
+    """Create a class entity in test.py."""
+    return ClassEntity(
+        name="MyClass",
+        qualified_name="test.py::MyClass",
+        file_path="test.py",
+        line_start=1,
+        line_end=5
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_function_entity():
+    """Create a function entity in test.py."""
+    return FunctionEntity(
+        name="my_func",
+        qualified_name="test.py::my_func",
+        file_path="test.py",
+        line_start=6,
+        line_end=10
+    )
+
+
 class TestConnection:
     """Test database connection management."""
 
     def test_client_initialization(self, mock_driver):
         """Test client initializes with correct parameters."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_gd.driver.return_value = mock_driver
 
             client = Neo4jClient(
@@ -62,7 +141,7 @@ class TestConnection:
 
     def test_context_manager(self, mock_driver):
         """Test client works as context manager."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_gd.driver.return_value = mock_driver
 
             with Neo4jClient() as client:
@@ -74,12 +153,9 @@ class TestConnection:
 class TestQueryExecution:
     """Test query execution methods."""
 
-    def test_execute_query_simple(self, client, mock_driver):
+    def test_execute_query_simple(self, client, mock_session):
         """Test executing a simple query."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = [{"count": 5}]
-        mock_session.run.return_value = mock_result
+        _prime_result(mock_session, [{"count": 5}])
 
         result = client.execute_query("MATCH (n) RETURN count(n) as count")
 
@@ -87,12 +163,9 @@ class TestQueryExecution:
         assert result[0]["count"] == 5
         mock_session.run.assert_called_once()
 
-    def test_execute_query_with_parameters(self, client, mock_driver):
+    def test_execute_query_with_parameters(self, client, mock_session):
         """Test executing query with parameters."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = []
-        mock_session.run.return_value = mock_result
+        _prime_result(mock_session, [])
 
         params = {"name": "test"}
         client.execute_query("MATCH (n {name: $name}) RETURN n", params)
@@ -100,13 +173,26 @@ class TestQueryExecution:
         call_args = mock_session.run.call_args
         assert call_args[0][1] == params
 
+    def test_execute_query_stream_releases_session_on_early_exit(self, client, mock_driver):
+        """Test leaving the stream block early discards the rest and closes the session."""
+        stream_session = mock_driver.session.return_value
+        result = MagicMock()
+        result.__iter__.return_value = iter([{"n": 1}, {"n": 2}])
+        stream_session.run.return_value = result
+
+        with client.execute_query_stream("MATCH (n) RETURN n") as rows:
+            assert next(rows) == {"n": 1}
+            stream_session.close.assert_not_called()
+
+        result.consume.assert_called_once()
+        stream_session.close.assert_called_once()
+
 
 class TestNodeOperations:
     """Test node creation and management."""
 
-    def test_batch_create_nodes_single_type(self, client, mock_driver):
+    def test_batch_create_nodes_single_type(self, client, mock_session, sample_file_entities):
         """Test batch creating nodes of single type."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
 
         # Mock execute_write to call the function with a mock transaction
         def execute_write_side_effect(func, *args, **kwargs):
@@ -121,37 +207,17 @@ class TestNodeOperations:
 
         mock_session.execute_write = MagicMock(side_effect=execute_write_side_effect)
 
-        entities = [
-            FileEntity(
-                name="test.py",
-                qualified_name="test.py",
-                file_path="test.py",
-                line_start=1,
-                line_end=10,
-                language="python",
-                loc=10
-            ),
-            FileEntity(
-                name="test2.py",
-                qualified_name="test2.py",
-                file_path="test2.py",
-                line_start=1,
-                line_end=20,
-                language="python",
-                loc=20
-            )
-        ]
-
-        id_mapping = client.batch_create_nodes(entities)
+        id_mapping = client.batch_create_nodes(sample_file_entities)
 
         assert len(id_mapping) == 2
         assert "test.py" in id_mapping
         assert "test2.py" in id_mapping
         mock_session.execute_write.assert_called()
 
-    def test_batch_create_nodes_multiple_types(self, client, mock_driver):
+    def test_batch_create_nodes_multiple_types(
+        self, client, mock_session, sample_file_entities, sample_class_entity, sample_function_entity
+    ):
         """Test batch creating nodes of multiple types."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
 
         # Track which type is being created to return appropriate results
         call_count = [0]
@@ -171,31 +237,7 @@ class TestNodeOperations:
 
         mock_session.execute_write = MagicMock(side_effect=execute_write_side_effect)
 
-        entities = [
-            FileEntity(
-                name="test.py",
-                qualified_name="test.py",
-                file_path="test.py",
-                line_start=1,
-                line_end=10,
-                language="python",
-                loc=10
-            ),
-            ClassEntity(
-                name="MyClass",
-                qualified_name="test.py::MyClass",
-                file_path="test.py",
-                line_start=1,
-                line_end=5
-            ),
-            FunctionEntity(
-                name="my_func",
-                qualified_name="test.py::my_func",
-                file_path="test.py",
-                line_start=6,
-                line_end=10
-            )
-        ]
+        entities = [sample_file_entities[0], sample_class_entity, sample_function_entity]
 
         id_mapping = client.batch_create_nodes(entities)
 
@@ -203,9 +245,8 @@ class TestNodeOperations:
         assert mock_session.execute_write.call_count >= 1
         assert len(id_mapping) == 3
 
-    def test_batch_create_nodes_empty_list(self, client, mock_driver):
+    def test_batch_create_nodes_empty_list(self, client, mock_session):
         """Test batch creating with empty list."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
         mock_session.execute_write = MagicMock()
 
         id_mapping = client.batch_create_nodes([])
@@ -217,9 +258,8 @@ class TestNodeOperations:
 class TestRelationshipOperations:
     """Test relationship creation."""
 
-    def test_batch_create_relationships(self, client, mock_driver):
+    def test_batch_create_relationships(self, client, mock_session):
         """Test batch creating relationships."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
 
         def execute_write_side_effect(func, *args, **kwargs):
             mock_tx = MagicMock()
@@ -253,9 +293,8 @@ class TestRelationshipOperations:
         # Should be called once per relationship type
         assert mock_session.execute_write.call_count >= 1
 
-    def test_batch_create_relationships_empty(self, client, mock_driver):
+    def test_batch_create_relationships_empty(self, client, mock_session):
         """Test batch creating with empty relationships list."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
         mock_session.execute_write = MagicMock()
 
         count = client.batch_create_relationships([])
@@ -263,9 +302,8 @@ class TestRelationshipOperations:
         assert count == 0
         mock_session.execute_write.assert_not_called()
 
-    def test_batch_create_relationships_groups_by_type(self, client, mock_driver):
+    def test_batch_create_relationships_groups_by_type(self, client, mock_session):
         """Test relationships are grouped by type for efficiency."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
 
         def execute_write_side_effect(func, *args, **kwargs):
             mock_tx = MagicMock()
@@ -308,12 +346,9 @@ class TestRelationshipOperations:
 class TestUtilityMethods:
     """Test utility methods."""
 
-    def test_clear_graph(self, client, mock_driver):
+    def test_clear_graph(self, client, mock_session):
         """Test clearing all nodes from graph."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = [{"deletedNodes": 100}]
-        mock_session.run.return_value = mock_result
+        _prime_result(mock_session, [{"deletedNodes": 100}])
 
         client.clear_graph()
 
@@ -322,18 +357,17 @@ class TestUtilityMethods:
         call_args = mock_session.run.call_args[0][0]
         assert "DELETE" in call_args.upper() or "DETACH" in call_args.upper()
 
-    def test_get_stats(self, client, mock_driver):
+    def test_get_stats(self, client, mock_session):
         """Test getting database statistics."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
 
         # get_stats runs 5 queries, each returning [{"count": X}]
         # Setup side_effect to return different results for each query
         mock_results = [
-            MagicMock(__iter__=lambda self: iter([{"count": 1000}])),  # total_nodes
-            MagicMock(__iter__=lambda self: iter([{"count": 50}])),    # total_files
-            MagicMock(__iter__=lambda self: iter([{"count": 200}])),   # total_classes
-            MagicMock(__iter__=lambda self: iter([{"count": 750}])),   # total_functions
-            MagicMock(__iter__=lambda self: iter([{"count": 1500}]))   # total_relationships
+            _FakeResult([{"count": 1000}]),  # total_nodes
+            _FakeResult([{"count": 50}]),    # total_files
+            _FakeResult([{"count": 200}]),   # total_classes
+            _FakeResult([{"count": 750}]),   # total_functions
+            _FakeResult([{"count": 1500}]),  # total_relationships
         ]
         mock_session.run.side_effect = mock_results
 
@@ -352,7 +386,7 @@ class TestErrorHandling:
 
     def test_connection_error_handling(self, mock_driver):
         """Test handling connection errors."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_gd.driver.side_effect = Exception("Connection failed")
 
             with pytest.raises(Exception) as exc_info:
@@ -360,9 +394,8 @@ class TestErrorHandling:
 
             assert "Connection failed" in str(exc_info.value)
 
-    def test_query_error_handling(self, client, mock_driver):
+    def test_query_error_handling(self, client, mock_session):
         """Test handling query execution errors."""
-        mock_session = mock_driver.session.return_value.__enter__.return_value
         mock_session.run.side_effect = Exception("Query failed")
 
         with pytest.raises(Exception) as exc_info:
@@ -375,7 +408,7 @@ class TestRetryLogic:
 
     def test_connection_retry_succeeds_on_second_attempt(self):
         """Test connection succeeds after initial failure."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_driver = MagicMock()
             mock_gd.driver.return_value = mock_driver
             
@@ -404,7 +437,7 @@ class TestRetryLogic:
 
     def test_connection_retry_fails_after_max_retries(self):
         """Test connection fails after exhausting retries."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_driver = MagicMock()
             mock_gd.driver.return_value = mock_driver
             
@@ -426,7 +459,7 @@ class TestRetryLogic:
 
     def test_connection_retry_exponential_backoff(self):
         """Test exponential backoff delay calculation."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd, \
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd, \
              patch('time.sleep') as mock_sleep:
             mock_driver = MagicMock()
             mock_gd.driver.return_value = mock_driver
@@ -457,7 +490,7 @@ class TestRetryLogic:
 
     def test_query_retry_on_session_expired(self):
         """Test query retries on SessionExpired error."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_driver = MagicMock()
             mock_session = MagicMock()
             mock_result = MagicMock()
@@ -491,7 +524,7 @@ class TestRetryLogic:
 
     def test_query_retry_fails_on_non_transient_error(self):
         """Test query fails immediately on non-transient errors."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd, \
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd, \
              patch('time.sleep') as mock_sleep:
             mock_driver = MagicMock()
             mock_session = MagicMock()
@@ -523,7 +556,7 @@ class TestRetryLogic:
 
     def test_configurable_retry_parameters(self):
         """Test that retry parameters can be configured."""
-        with patch('falkor.graph.client.GraphDatabase') as mock_gd:
+        with patch('repotoire.graph.client.GraphDatabase') as mock_gd:
             mock_driver = MagicMock()
             mock_gd.driver.return_value = mock_driver
             mock_driver.verify_connectivity.return_value = None
@@ -0,0 +1,202 @@
+"""Unit tests for the on-disk parse cache."""
+
+import sqlite3
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from repotoire.models import FileEntity, SecretsPolicy
+from repotoire.parsers import PythonParser
+from repotoire.pipeline import IngestionPipeline, ParseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a parse cache in a temporary directory."""
+    parse_cache = ParseCache(tmp_path / "cache")
+    yield parse_cache
+    parse_cache.close()
+
+
+class TestParseCache:
+    """Test ParseCache storage and keying."""
+
+    def test_round_trip(self, cache, tmp_path):
+        """Test a stored result is returned for the same key."""
+        source = tmp_path / "mod.py"
+        source.write_text("def f():\n    pass\n")
+        entities, relationships = PythonParser().process_file(str(source))
+        key = ParseCache.make_key("abc", PythonParser())
+
+        cache.put(str(source), key, entities, relationships)
+        cached_entities, cached_relationships = cache.get(str(source), key)
+
+        assert [e.qualified_name for e in cached_entities] == [
+            e.qualified_name for e in entities
+        ]
+        assert len(cached_relationships) == len(relationships)
+
+    def test_key_mismatch_misses(self, cache):
+        """Test a different content hash or file path misses."""
+        key = ParseCache.make_key("abc", PythonParser())
+        cache.put("mod.py", key, [], [])
+
+        assert cache.get("mod.py", ParseCache.make_key("def", PythonParser())) is None
+        assert cache.get("other.py", key) is None
+
+    def test_key_includes_secrets_policy(self):
+        """Test results redacted under one policy are not reused under another."""
+        redact = ParseCache.make_key("abc", PythonParser(secrets_policy=SecretsPolicy.REDACT))
+        warn = ParseCache.make_key("abc", PythonParser(secrets_policy=SecretsPolicy.WARN))
+
+        assert redact != warn
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test flushed entries are visible to a new cache instance."""
+        key = ParseCache.make_key("abc", PythonParser())
+        first = ParseCache(tmp_path)
+        first.put("mod.py", key, [], [])
+        first.close()
+
+        second = ParseCache(tmp_path)
+        assert second.get("mod.py", key) == ([], [])
+        second.close()
+
+    def test_context_manager_closes(self, tmp_path):
+        """Test leaving the with block commits and closes the connection."""
+        key = ParseCache.make_key("abc", PythonParser())
+        with ParseCache(tmp_path) as first:
+            first.put("mod.py", key, [], [])
+        assert first._conn is None
+        first.close()  # Closing twice is harmless
+
+        with ParseCache(tmp_path) as second:
+            assert second.get("mod.py", key) == ([], [])
+
+
+class InlineExecutor:
+    """Process pool stand-in that runs worker tasks in this process."""
+
+    submitted = []
+
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        if initializer is not None:
+            initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        InlineExecutor.submitted.append(args)
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture
+def cached_pipeline(tmp_path):
+    """Create a two-worker pipeline with a parse cache over two Python files."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("def a():\n    pass\n")
+    (repo / "b.py").write_text("def b():\n    pass\n")
+    InlineExecutor.submitted = []
+    pipeline = IngestionPipeline(
+        str(repo), MagicMock(), workers=2, parse_cache_dir=str(tmp_path / "cache")
+    )
+    yield pipeline, [repo / "a.py", repo / "b.py"]
+    pipeline.parse_cache.close()
+
+
+class TestPipelineParseCache:
+    """Test IngestionPipeline uses the parse cache."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        """Test the second parse of an unchanged file comes from the cache."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        source = repo / "mod.py"
+        source.write_text("def f():\n    pass\n")
+
+        pipeline = IngestionPipeline(
+            str(repo), MagicMock(), parse_cache_dir=str(tmp_path / "cache")
+        )
+        parser = pipeline.parsers["python"]
+        parser.process_source = MagicMock(wraps=parser.process_source)
+
+        first, _ = pipeline.parse_and_extract(source)
+        second, _ = pipeline.parse_and_extract(source)
+
+        assert parser.process_source.call_count == 1
+        assert [e.qualified_name for e in second] == [e.qualified_name for e in first]
+        assert any(isinstance(e, FileEntity) and e.file_path == "mod.py" for e in second)
+
+        source.write_text("def g():\n    pass\n")
+        pipeline.parse_and_extract(source)
+        assert parser.process_source.call_count == 2
+
+    def test_miss_reuses_content_hash(self, tmp_path):
+        """Test a cache miss parses the bytes already read and hashed for the key."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        source = repo / "mod.py"
+        source.write_text("def f():\n    pass\n")
+
+        pipeline = IngestionPipeline(
+            str(repo), MagicMock(), parse_cache_dir=str(tmp_path / "cache")
+        )
+        uncached = PythonParser().process_file(str(source))[0]
+        entities, _ = pipeline.parse_and_extract(source)
+
+        def file_hash(found):
+            return next(e.hash for e in found if isinstance(e, FileEntity))
+
+        assert file_hash(entities) == file_hash(uncached)
+
+    def test_workers_get_the_bytes_read_for_the_lookup(self, cached_pipeline):
+        """Test cache misses are sent to workers with their source and hash."""
+        pipeline, files = cached_pipeline
+        with patch("repotoire.pipeline.ingestion.ProcessPoolExecutor", InlineExecutor):
+            results = list(pipeline._extract_in_workers(files))
+
+        (tasks,), = InlineExecutor.submitted
+        assert [task.source for task in tasks] == [f.read_bytes() for f in files]
+        assert all(task.content_hash for task in tasks)
+        assert [r[0][0].file_path for r in results] == ["a.py", "b.py"]
+
+    def test_workers_skip_pool_when_everything_is_cached(self, cached_pipeline):
+        """Test no process pool is started when every file is a cache hit."""
+        pipeline, files = cached_pipeline
+        for file_path in files:
+            pipeline.parse_and_extract(file_path)
+
+        executor = MagicMock()
+        with patch("repotoire.pipeline.ingestion.ProcessPoolExecutor", executor):
+            results = list(pipeline._extract_in_workers(files))
+
+        executor.assert_not_called()
+        assert all(entities for entities, _ in results)
+
+    def test_workers_skip_files_whose_lookup_fails(self, cached_pipeline):
+        """Test a cache error skips the file instead of aborting the ingest."""
+        pipeline, files = cached_pipeline
+        get = pipeline.parse_cache.get
+
+        def locked(file_path, key):
+            if file_path.endswith("a.py"):
+                raise sqlite3.OperationalError("database is locked")
+            return get(file_path, key)
+
+        pipeline.parse_cache.get = locked
+        with patch("repotoire.pipeline.ingestion.ProcessPoolExecutor", InlineExecutor):
+            results = list(pipeline._extract_in_workers(files))
+
+        assert results[0] == ([], [])
+        assert results[1][0]
+        assert pipeline.skipped_files == [
+            {"file": str(files[0]), "reason": "Parse error: database is locked"}
+        ]
@@ -1,10 +1,13 @@
 """Unit tests for PythonParser."""
 
+import hashlib
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from repotoire.parsers import base as parsers_base
+from repotoire.parsers import hash_file_content
 from repotoire.parsers.python_parser import PythonParser
 from repotoire.models import NodeType, RelationshipType
 
@@ -39,6 +42,28 @@ class TestEntityExtraction:
         assert file_entities[0].qualified_name == temp_python_file.name
         assert file_entities[0].language == "python"
 
+    def test_file_entity_hash_and_loc(self, parser, temp_python_file):
+        """Test file hash and LOC come from the bytes read by parse()."""
+        source = "import os\n\n\ndef f():\n    return os.sep\n"
+        temp_python_file.write(source)
+        temp_python_file.flush()
+
+        tree = parser.parse(temp_python_file.name)
+        file_entity = parser.extract_entities(tree, temp_python_file.name)[0]
+
+        assert file_entity.hash == hash_file_content(source.encode())
+        algorithm, _, digest = file_entity.hash.partition(":")
+        assert algorithm in ("xxh3", "b2")
+        assert len(digest) == 32
+        assert file_entity.loc == 3
+
+    def test_file_hash_names_its_algorithm(self, monkeypatch):
+        """Test the fallback digest is prefixed so it never matches an xxh3 one."""
+        monkeypatch.setattr(parsers_base, "HAS_XXHASH", False)
+
+        expected = "b2:" + hashlib.blake2b(b"data", digest_size=16).hexdigest()
+        assert hash_file_content(b"data") == expected
+
     def test_extract_class_entity(self, parser, temp_python_file):
         """Test class entity extraction."""
         temp_python_file.write("""
@@ -127,6 +152,26 @@ async def async_function():
         assert func_entities[0].name == "async_function"
         assert func_entities[0].is_async is True
 
+    def test_complexity_counts_boolean_operators(self, parser, temp_python_file):
+        """Test each boolean operator adds one to cyclomatic complexity."""
+        temp_python_file.write("""
+def check(a, b, c):
+    if a and b or c:
+        return 1
+    def inner(x):
+        while x or a:
+            pass
+""")
+        temp_python_file.flush()
+
+        tree = parser.parse(temp_python_file.name)
+        entities = parser.extract_entities(tree, temp_python_file.name)
+
+        complexity = {e.name: e.complexity for e in entities if e.node_type == NodeType.FUNCTION}
+        # base + if + 2 operators, plus the nested while + 1 operator
+        assert complexity["check"] == 6
+        assert complexity["inner"] == 3
+
 
 class TestRelationshipExtraction:
     """Test relationship extraction from Python code."""
@@ -188,6 +233,33 @@ def callee():
         # Verify caller -> callee relationship exists
         assert any("caller" in r.source_id and "callee" in r.target_id for r in call_rels)
 
+    def test_self_call_resolves_to_own_class_method(self, parser, temp_python_file):
+        """Test self.method() resolves to the method of the enclosing class."""
+        temp_python_file.write("""
+class A:
+    def run(self):
+        pass
+
+class B:
+    def run(self):
+        pass
+
+    def start(self):
+        self.run()
+""")
+        temp_python_file.flush()
+
+        tree = parser.parse(temp_python_file.name)
+        entities = parser.extract_entities(tree, temp_python_file.name)
+        relationships = parser.extract_relationships(tree, temp_python_file.name, entities)
+
+        self_calls = [
+            r for r in relationships
+            if r.rel_type == RelationshipType.CALLS and r.properties["is_self_call"]
+        ]
+        assert len(self_calls) == 1
+        assert self_calls[0].target_id == f"{temp_python_file.name}::B:6.run:7"
+
     def test_extract_inherits_relationship(self, parser, temp_python_file):
         """Test INHERITS relationship extraction."""
         temp_python_file.write("""
@@ -518,6 +590,31 @@ class TypedClass:
         assert method.return_type == "float"
         assert method.parameter_types == {"x": "float", "y": "float"}
 
+    def test_compound_type_annotations(self, parser, temp_python_file):
+        """Test compound annotations render exactly as in the source."""
+        temp_python_file.write("""
+def compound(
+    a: typing.Dict[str, List[int]],
+    b: int | None,
+    c: "Forward",
+    d: a | (b | c),
+) -> Callable[[int], str]:
+    pass
+""")
+        temp_python_file.flush()
+
+        tree = parser.parse(temp_python_file.name)
+        entities = parser.extract_entities(tree, temp_python_file.name)
+
+        func = next(e for e in entities if e.node_type == NodeType.FUNCTION)
+        assert func.return_type == "Callable[[int], str]"
+        assert func.parameter_types == {
+            "a": "typing.Dict[str, List[int]]",
+            "b": "int | None",
+            "c": "'Forward'",
+            "d": "a | (b | c)",
+        }
+
     def test_class_decorators(self, parser, temp_python_file):
         """Test extraction of class decorators."""
         temp_python_file.write("""
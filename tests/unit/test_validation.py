@@ -14,6 +14,7 @@ from repotoire.validation import (
     validate_output_path,
     validate_file_size_limit,
     validate_batch_size,
+    validate_path_depth,
     validate_retry_config,
 )
 
@@ -391,6 +392,30 @@ class TestBatchSizeValidation:
         assert "memory issues" in exc_info.value.suggestion
 
 
+class TestPathDepthValidation:
+    """Test variable-length path depth validation."""
+
+    def test_valid_path_depth(self):
+        """Test validation of valid path depths."""
+        assert validate_path_depth(1) == 1
+        assert validate_path_depth(100) == 100
+
+    @pytest.mark.parametrize("depth,message", [
+        (0, "must be positive"),
+        (-3, "must be positive"),
+        (101, "too large"),
+        ("5", "must be an integer"),
+        (2.5, "must be an integer"),
+        (True, "must be an integer"),
+        ("1..5]-(x) DETACH DELETE x //", "must be an integer"),
+    ])
+    def test_invalid_path_depth(self, depth, message):
+        """Test validation fails for depths that cannot be interpolated."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_path_depth(depth)
+        assert message in exc_info.value.message.lower()
+
+
 class TestRetryConfigValidation:
     """Test retry configuration validation."""
 